@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作表分析基准测试
+
+比较ConfigProcessor逐单元格分析与向量化分析引擎的耗时，并校验两者结果一致。
+
+用法:
+    python benchmarks/bench_analyze_sheet.py [PN数量 ...]
+"""
+
+import os
+import sys
+import time
+
+# 将项目根目录添加到Python路径
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from benchmarks.synthetic import make_config_sheet
+from processors.config_processor import ConfigProcessor
+
+
+def run_once(df, use_vectorized):
+    """运行一次分析，返回 (耗时, config_data)"""
+    processor = ConfigProcessor()
+    processor.use_vectorized = use_vectorized
+    start = time.perf_counter()
+    processor._analyze_sheet('bench_config', df)
+    return time.perf_counter() - start, processor.config_data
+
+
+def main(argv=None):
+    """主函数"""
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = [int(arg) for arg in argv] or [50, 200, 400]
+
+    print(f"{'PN数量':>8} {'逐单元格(s)':>12} {'向量化(s)':>12} {'加速比':>8}")
+    for n_pns in sizes:
+        df = make_config_sheet(n_pns)
+        loop_time, loop_data = run_once(df, use_vectorized=False)
+        vec_time, vec_data = run_once(df, use_vectorized=True)
+        if loop_data != vec_data:
+            print(f"{n_pns:>8} 结果不一致!")
+            return 1
+        print(f"{n_pns:>8} {loop_time:>12.3f} {vec_time:>12.3f} {loop_time / vec_time:>7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
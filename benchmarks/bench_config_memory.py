@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置数据内存基准测试
+
+比较逐单元格分析生成的嵌套字典与向量化分析生成的紧凑记录（ComponentRecord + 字符串驻留）
+所占用的内存，并校验两者按字典方式访问时结果一致。
+
+用法:
+    python benchmarks/bench_config_memory.py [PN数量]
+"""
+
+import os
+import gc
+import sys
+import tracemalloc
+
+# 将项目根目录添加到Python路径
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from benchmarks.synthetic import make_config_sheet
+from processors.config_processor import ConfigProcessor
+
+
+def measure(df, use_vectorized):
+    """分析一次工作表，返回 (config_data保留的字节数, config_data)"""
+    processor = ConfigProcessor()
+    processor.use_vectorized = use_vectorized
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    processor._analyze_sheet('bench_config', df)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained, processor.config_data
+
+
+def main(argv=None):
+    """主函数"""
+    argv = sys.argv[1:] if argv is None else argv
+    n_pns = int(argv[0]) if argv else 500
+
+    df = make_config_sheet(n_pns)
+    dict_bytes, dict_data = measure(df, use_vectorized=False)
+    compact_bytes, compact_data = measure(df, use_vectorized=True)
+    if dict_data != compact_data:
+        print("结果不一致!")
+        return 1
+
+    records = sum(len(components) for data in compact_data.values()
+                  for components in data['config'].values())
+    print(f"PN数量: {n_pns}, 组件记录数: {records}")
+    print(f"{'嵌套字典':>10}: {dict_bytes / 1024:>10.1f} KiB")
+    print(f"{'紧凑记录':>10}: {compact_bytes / 1024:>10.1f} KiB")
+    print(f"{'节省':>10}: {1 - compact_bytes / dict_bytes:>10.1%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+基准测试数据生成模块
+
+生成与真实BOM配置工作表结构一致的合成数据：
+- 前几行为说明区域
+- System P/N标题行，每个PN占用两列（规格列 + 料号列）
+- 第一列为组件名称
+"""
+
+import random
+import pandas as pd
+
+COMPONENT_NAMES = [
+    "CPU", "GPU", "Memory 1", "Memory 2", "LCD", "WLAN", "WWAN", "SSD 1", "SSD 2",
+    "Battery", "Adaptor", "KeyBoard", "USH", "Finger Print", "Smart Card", "RFID", "FIPS"
+]
+
+SPEC_POOL = [
+    "Intel Core i7-1365U vPro, 10C, 1.8GHz",
+    "Intel Core i5-1345U vPro, 10C, 1.6GHz",
+    "NVIDIA RTX A500 4GB GDDR6",
+    "16GB DDR5 5600MHz SODIMM",
+    "32GB DDR5 5600MHz SODIMM",
+    "14\" FHD+ 1920x1200 WVA IPS 250nits",
+    "Intel Wi-Fi 6E AX211 2x2 + BT 5.3",
+    "Qualcomm Snapdragon X12 4G LTE",
+    "512GB M.2 PCIe NVMe Class 35 SSD",
+    "1TB M.2 PCIe NVMe Class 40 SSD",
+    "3 Cell 54Wh ExpressCharge Battery",
+    "65W USB-C AC Adapter",
+    "US English Backlit Keyboard",
+    "Control Vault 3+ Advanced Authentication",
+    "Fingerprint Reader in Power Button",
+    "Contacted Smart Card Reader",
+    "NFC/RFID Contactless Reader",
+]
+
+
+def make_config_sheet(n_pns=400, header_row=3, seed=0):
+    """生成合成的配置工作表
+
+    Args:
+        n_pns: System P/N数量
+        header_row: System P/N标题所在行
+        seed: 随机种子
+
+    Returns:
+        pandas.DataFrame: 不含列标题的工作表数据（header=None布局）
+    """
+    rng = random.Random(seed)
+    n_cols = 2 + n_pns * 2
+    n_rows = header_row + 1 + len(COMPONENT_NAMES)
+    rows = [[None] * n_cols for _ in range(n_rows)]
+
+    rows[0][0] = "Platform Configuration"
+    rows[header_row][1] = "System P/N"
+    for i in range(n_pns):
+        rows[header_row][2 + i * 2] = f"SYS{i:05d}"
+
+    for r, name in enumerate(COMPONENT_NAMES, start=header_row + 1):
+        rows[r][0] = name
+        for i in range(n_pns):
+            if rng.random() < 0.85:
+                rows[r][2 + i * 2] = rng.choice(SPEC_POOL)
+                rows[r][3 + i * 2] = f"{rng.randrange(16 ** 5):05X}"
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+命令行批量生成入口
+
+不启动Qt界面，读取配置工作簿并为每个System P/N生成 <PN>.TXT 文件：
+
+    autoconfig-batch CONFIG.xlsx --os WIN11-ENG-HOME --bypass-whql -o out
+
+默认写入的内容与界面写入MOD.TXT的相同（OS MOD参数值，--bypass-whql时加上5P226）；
+加上 --include-components 时在前面写入配置中的组件料号。
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+
+from processors.config_processor import ConfigProcessor
+from processors.mod_generator import DEFAULT_OS_INI, read_os_mod_values, generate_mod_files
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="为配置工作簿中的每个System P/N批量生成MOD文件")
+    parser.add_argument('workbook', help="配置工作簿路径")
+    parser.add_argument('--sheet', action='append', dest='sheets',
+                        help="只处理指定工作表，可重复；默认处理所有名称包含config的工作表")
+    parser.add_argument('--os', dest='os_option', help="OS.INI中的OS MOD选项，如 WIN11-ENG-HOME")
+    parser.add_argument('--os-ini', default=DEFAULT_OS_INI, help=f"OS.INI路径（默认 {DEFAULT_OS_INI}）")
+    parser.add_argument('--bypass-whql', action='store_true', help="在MOD文件中加入5P226")
+    parser.add_argument('--include-components', action='store_true',
+                        help="在MOD文件开头写入配置中的组件料号（界面不写入，默认不写入）")
+    parser.add_argument('-o', '--output-dir', default='.', help="输出目录（默认当前目录）")
+    parser.add_argument('--overwrite', action='store_true', help="覆盖已存在的 <PN>.TXT")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="工作进程数（默认CPU核数）")
+    parser.add_argument('-v', '--verbose', action='store_true', help="输出调试日志")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """命令行入口"""
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    start = time.perf_counter()
+    try:
+        os_values = read_os_mod_values(args.os_option, args.os_ini) if args.os_option else []
+
+        processor = ConfigProcessor()
+        config_sheets = processor.load_excel_file(args.workbook)
+        sheets = args.sheets or config_sheets
+        missing = [sheet for sheet in sheets if sheet not in processor.sheet_names]
+        if missing:
+            print(f"工作簿中没有工作表: {missing}", file=sys.stderr)
+            return 2
+
+        # 只分析选定的工作表；全工作簿缓存不适用于部分工作表
+        processor.sheet_names = sheets
+        processor.cache = None
+        if not processor.analyze_all_sheets(parallel=args.workers != 1, max_workers=args.workers):
+            print(f"分析工作簿失败: {args.workbook}", file=sys.stderr)
+            return 1
+        config_data = processor.get_config_data()
+        analyze_time = time.perf_counter() - start
+        if not config_data:
+            print("选定的工作表中没有System P/N", file=sys.stderr)
+            return 1
+
+        stats = generate_mod_files(config_data, processor.component_keywords, args.output_dir,
+                                   os_values, args.bypass_whql, args.overwrite, args.workers,
+                                   args.include_components)
+    except Exception as e:
+        logger.error(f"批量生成MOD文件失败: {str(e)}")
+        print(f"批量生成MOD文件失败: {str(e)}", file=sys.stderr)
+        return 1
+
+    total_time = time.perf_counter() - start
+    total = len(config_data)
+    print(f"工作表: {', '.join(sheets)}")
+    print(f"System P/N: {total}，已生成 {stats['written']}，跳过 {stats['skipped']}（已存在），"
+          f"{stats['invalid']} 个不能作为文件名")
+    print(f"分析耗时 {analyze_time:.3f}s，生成耗时 {stats['elapsed']:.3f}s（{stats['workers']} 个进程，"
+          f"{stats['pns_per_second']:.1f} PN/s）")
+    print(f"总耗时 {total_time:.3f}s，总吞吐 {total / total_time:.1f} PN/s")
+    print(f"输出目录: {os.path.abspath(args.output_dir)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
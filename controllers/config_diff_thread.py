@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置差异比较线程模块
+
+在后台线程中读取并分析要比较的配置工作簿，界面线程只负责显示忙碌状态和差异结果：
+- 当前工作簿已完整分析且文件未变化时直接使用其配置数据，只分析旧版本
+- 结果通过排队信号交给界面线程显示
+- 取消时在分析的检查点中止，不影响当前打开的工作簿
+"""
+
+import logging
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from processors.config_diff import compare_workbooks
+from utils.cancellation import CancelToken, LoadCancelled
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigDiffThread(QThread):
+    """配置差异比较线程类"""
+
+    compared = pyqtSignal(object)   # ConfigDiff
+    failed = pyqtSignal(str)        # 错误信息
+    cancelled = pyqtSignal()        # 比较已取消
+
+    def __init__(self, old_path, new_path, new_data=None, cache=None):
+        """初始化比较线程
+
+        Args:
+            old_path: 旧版本工作簿路径
+            new_path: 新版本工作簿路径
+            new_data: 新版本已分析的config_data（只读取），为None时在本线程中分析new_path
+            cache: 分析时使用的AnalysisCache（线程安全，可与界面处理器共用）
+        """
+        super().__init__()
+        self.old_path = old_path
+        self.new_path = new_path
+        self.new_data = new_data
+        self.cache = cache
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        """请求取消比较（可在界面线程中调用）"""
+        self.cancel_token.cancel()
+
+    def run(self):
+        try:
+            diff = compare_workbooks(self.old_path, self.new_path, self.new_data,
+                                     cancel=self.cancel_token, cache=self.cache)
+            self.cancel_token.check()
+            self.compared.emit(diff)
+        except LoadCancelled:
+            logger.info(f"已取消比较配置文件: {self.old_path} -> {self.new_path}")
+            self.cancelled.emit()
+        except Exception as e:
+            logger.error(f"后台比较配置文件失败: {str(e)}")
+            self.failed.emit(str(e))
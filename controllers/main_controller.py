@@ -21,6 +21,12 @@ from models.os_mod_model import OSModModel
 from models.mod_model import MODModel
 from models.keyparts_model import KeyPartsModel
 from models.app_mod_model import AppModModel
+from controllers.sheet_prefetcher import SheetPrefetcher
+from controllers.sheet_loader import SheetLoadThread
+from controllers.config_diff_thread import ConfigDiffThread
+from ui.config_diff_dialog import ConfigDiffDialog
+from utils.workbook_session import WorkbookSession
+from utils.encoding_sniffer import detect_encoding
 
 from utils.event_bus import event_bus
 from utils.event_constants import (
@@ -57,7 +63,9 @@ from utils.event_constants import (
     KEYPARTS_CLEAR_CLICKED,
     APP_MOD_ADD_CLICKED,
     BYPASS_WHQL_CLICKED,
-    OS_MOD_ADD_CLICKED
+    OS_MOD_ADD_CLICKED,
+    PN_SEARCH_CLICKED,
+    CONFIG_DIFF_CLICKED
 )
 
 logger = logging.getLogger(__name__)
@@ -87,6 +95,18 @@ class MainController:
         self.keyparts_model = KeyPartsModel(self.event_bus)
         self.app_mod_model = AppModModel(self.event_bus)
         
+        # 打开工作簿后在后台预取工作表
+        self.sheet_prefetcher = SheetPrefetcher(self.config_model.processor)
+        
+        # 后台加载所选工作表的线程、进度对话框以及加载使用的工作簿会话
+        self.sheet_load_thread = None
+        self.sheet_load_progress = None
+        self._sheet_session = None
+        
+        # 后台比较配置文件的线程及其进度对话框
+        self.config_diff_thread = None
+        self.config_diff_progress = None
+        
         # 初始化主窗口引用
         self.main_window = None
         self.current_os_mod = None
@@ -112,6 +132,21 @@ class MainController:
         self._on_os_mod_options_updated(options)
         logger.info(f"已更新OS MOD选项: {options}")
         
+    def shutdown(self):
+        """应用程序退出前停止后台任务并保存缓存"""
+        try:
+            for thread in (self.sheet_load_thread, self.config_diff_thread):
+                if thread is not None:
+                    thread.cancel()
+                    thread.wait()
+            self.sheet_prefetcher.cancel()
+            if self._sheet_session is not None:
+                self._sheet_session.close()
+                self._sheet_session = None
+            self.config_model.processor.close()
+        except Exception as e:
+            logger.error(f"退出时清理失败: {str(e)}")
+        
     def set_main_window(self, main_window):
         """设置主窗口引用
         
@@ -148,7 +183,8 @@ class MainController:
             KEYPARTS_LOAD_CLICKED, KEYPARTS_SEARCH_CLICKED,
             KEYPARTS_ADD_CLICKED, KEYPARTS_CLEAR_CLICKED,
             APP_MOD_ADD_CLICKED, BYPASS_WHQL_CLICKED,
-            OS_MOD_ADD_CLICKED
+            OS_MOD_ADD_CLICKED, PN_SEARCH_CLICKED,
+            CONFIG_DIFF_CLICKED
         )
 
         # UI事件
@@ -162,6 +198,8 @@ class MainController:
         self.event_bus.subscribe(GENERATE_CLICKED, self.generate_content)
         self.event_bus.subscribe(CHECK_CLICKED, self.check_number)
         self.event_bus.subscribe(OS_MOD_ADD_CLICKED, self.os_mod_add_to_file)
+        self.event_bus.subscribe(PN_SEARCH_CLICKED, self.search_pn)
+        self.event_bus.subscribe(CONFIG_DIFF_CLICKED, self.compare_config_files)
 
         # 模型事件
         self.event_bus.subscribe(CONFIG_FILE_LOADED, self._on_config_file_loaded)
@@ -324,6 +362,8 @@ class MainController:
                         self.phbom_model = phbom_model
                         # 添加标志位，用于安全终止线程
                         self.is_running = True
+                        # 在线程中建立的PHBOM索引，由主线程交给模型
+                        self.index = None
 
                     def run(self):
                         try:
@@ -349,7 +389,7 @@ class MainController:
                             try:
                                 self.progress.emit(20)  # 更新进度
                                 QThread.msleep(200)
-                                with open(self.file_path, 'r', encoding='utf-8') as f:
+                                with open(self.file_path, 'r', encoding=detect_encoding(self.file_path)) as f:
                                     # 尝试读取前几行
                                     for _ in range(5):
                                         if not f.readline():
@@ -377,6 +417,14 @@ class MainController:
                             
                             success, result = processor.process_file(self.file_path)
                             
+                            # 在线程中建立常驻索引，之后的Check不再读取文件
+                            if success and self.is_running:
+                                try:
+                                    from processors.phbom_index import PHBOMIndex
+                                    self.index = PHBOMIndex.from_csv(result)
+                                except Exception as e:
+                                    logger.error(f"建立PHBOM索引失败: {str(e)}")
+                            
                             # 完成加载，更新进度
                             if not self.is_running:
                                 return
@@ -466,7 +514,9 @@ class MainController:
         """PHBOM文件加载完成的回调"""
         try:
             # 确保线程对象被正确清理
+            index = None
             if hasattr(self, 'load_thread'):
+                index = self.load_thread.index
                 self.load_thread.disconnect()
                 self.load_thread.wait()  # 等待线程完全结束
                 self.load_thread.deleteLater()  # 安全删除线程对象
@@ -482,6 +532,8 @@ class MainController:
                     if hasattr(self, 'phbom_model') and self.phbom_model:
                         # 设置当前文件
                         self.phbom_model.current_file = message
+                        if index is not None:
+                            self.phbom_model.set_index(index)
                         # 发布事件
                         self.event_bus.publish(PHBOM_FILE_LOADED, message)
                 except Exception as e:
@@ -851,28 +903,15 @@ class MainController:
                 self._show_error("PHBOM.CSV文件不存在，请先加载PHBOM文件")
                 return
             
-            # 读取PHBOM.CSV文件
+            # 使用常驻的PHBOM索引，文件变化时自动重新建立
             try:
-                # 尝试使用UTF-8编码读取
-                df = pd.read_csv(phbom_file_path, encoding='utf-8')
-            except UnicodeDecodeError:
-                # 如果失败，尝试使用GBK编码
-                df = pd.read_csv(phbom_file_path, encoding='gbk')
-            
-            # 查找可能的Number列
-            number_columns = ['Number', 'number', 'Part Number', 'PN', 'P/N', '料号', '零件号']
-            number_col = None
-            for col in number_columns:
-                if col in df.columns:
-                    number_col = col
-                    break
-            
-            if number_col is None:
-                self._show_error("PHBOM.CSV文件中未找到Number列")
+                index = self.phbom_model.get_index(phbom_file_path)
+            except ValueError as e:
+                self._show_error(str(e))
                 return
             
-            # 查找匹配的行
-            matched_rows = df[df[number_col].astype(str).str.contains(check_value, case=False, na=False)]
+            # 查找Number中包含输入内容的所有行（按字面匹配，不区分大小写）
+            matched_rows = index.search(check_value)
             
             if matched_rows.empty:
                 self._show_error(f"未找到Number为 {check_value} 的记录")
@@ -882,7 +921,7 @@ class MainController:
             info_text = f"找到 {len(matched_rows)} 条匹配记录：\n\n"
             
             # 获取所有列名
-            columns = df.columns.tolist()
+            columns = index.columns
             
             # 对于每一行匹配的记录，显示所有列的信息
             for idx, row in matched_rows.iterrows():
@@ -904,6 +943,182 @@ class MainController:
             logger.error(traceback.format_exc())
             self.event_bus.publish(ERROR_OCCURRED, error_msg)
     
+    def search_pn(self, pn):
+        """在全局System P/N索引中查找，并跳转到所在的工作簿、工作表和P/N
+        
+        @param {str} pn - 要查找的System P/N
+        """
+        try:
+            pn = (pn or '').strip()
+            if not pn:
+                self._show_error("请输入要查找的System P/N")
+                return False
+            
+            locations = self.config_model.find_pn(pn)
+            if not locations:
+                self._show_error(f"索引中未找到System P/N: {pn}\n请先打开并分析包含该P/N的配置文件")
+                return False
+            
+            # 优先跳转到当前工作簿中的位置
+            current_file = self.config_model.get_current_file_path()
+            current_abs = os.path.abspath(current_file) if current_file else None
+            location = next((loc for loc in locations if loc['workbook'] == current_abs), locations[0])
+            workbook = location['workbook']
+            sheet_name = location['sheet']
+            logger.info(f"System P/N {pn} 位于 {workbook} [{sheet_name}] 第 {location['column_letter']} 列")
+            
+            if not os.path.exists(workbook):
+                self._show_error(f"配置文件不存在: {workbook}")
+                return False
+            
+            # 切换工作簿
+            if workbook != current_abs:
+                if not self.load_config_file_sheets_only(workbook):
+                    return False
+            
+            if not self.main_window:
+                return False
+            
+            # 切换工作表并加载数据
+            sheet_combo = self.main_window.control_panel.sheet_combo
+            sheet_index = sheet_combo.findText(sheet_name)
+            if sheet_index >= 0:
+                sheet_combo.setCurrentIndex(sheet_index)
+            # 工作表在后台加载，完成后再选中P/N
+            return self.load_and_analyze_sheet_data(
+                workbook, sheet_name, on_loaded=lambda: self._select_found_pn(pn, sheet_name))
+            
+        except Exception as e:
+            error_msg = f"查找System P/N时出错: {str(e)}"
+            logger.error(error_msg)
+            self._show_error(error_msg)
+            return False
+    
+    def _select_found_pn(self, pn, sheet_name):
+        """查找的工作表加载完成后选中P/N
+        
+        @param {str} pn - 要选中的System P/N
+        @param {str} sheet_name - P/N所在的工作表
+        """
+        if not self.main_window:
+            return False
+        pn_combo = self.main_window.control_panel.pn_combo
+        pn_index = pn_combo.findText(pn)
+        if pn_index < 0:
+            self._show_error(f"工作表 {sheet_name} 中未找到System P/N: {pn}")
+            return False
+        pn_combo.setCurrentIndex(pn_index)
+        return True
+    
+    def compare_config_files(self, old_path=None, new_path=None):
+        """在后台线程中比较配置文件的两个版本，完成后在界面线程中显示差异
+        
+        默认以当前打开的配置文件为新版本，由用户选择要比较的旧版本。
+        当前配置文件已完整分析且未变化时直接使用其分析结果，只分析旧版本。
+        
+        @param {str} old_path - 旧版本配置文件路径，为None时弹出文件选择框
+        @param {str} new_path - 新版本配置文件路径，为None时使用当前配置文件
+        @returns {bool} 是否已开始比较
+        """
+        try:
+            new_path = new_path or self.config_model.get_current_file_path()
+            if not new_path:
+                self._show_error("请先加载配置文件")
+                return None
+            
+            if old_path is None:
+                if not self.main_window:
+                    return None
+                old_path, _ = QFileDialog.getOpenFileName(
+                    self.main_window,
+                    "选择要比较的旧版本配置文件",
+                    os.path.dirname(new_path),
+                    "Excel文件 (*.xlsx *.xlsm);;所有文件 (*.*)"
+                )
+                if not old_path:
+                    return None
+            
+            # 之前的比较尚未完成时取消并丢弃其结果
+            previous = self.config_diff_thread
+            self.config_diff_thread = None
+            if previous is not None and previous.isRunning():
+                logger.info(f"丢弃尚未完成的配置比较: {previous.old_path}")
+                previous.cancel()
+            
+            progress = None
+            if self.main_window:
+                # 无法报告比较进度，显示为忙碌状态
+                progress = QProgressDialog("正在比较配置文件...", "取消", 0, 0, self.main_window)
+                progress.setWindowTitle("比较中")
+                progress.setWindowModality(Qt.WindowModality.WindowModal)
+                progress.setMinimumDuration(0)
+                progress.setMinimumWidth(400)
+                progress.setLabelText(f"正在比较配置文件...\n{os.path.basename(old_path)} -> {os.path.basename(new_path)}")
+                progress.show()
+            if self.config_diff_progress is not None:
+                self.config_diff_progress.close()
+            self.config_diff_progress = progress
+            
+            # 分析和比较在后台线程中进行，结果通过排队信号回到界面线程
+            processor = self.config_model.processor
+            thread = ConfigDiffThread(old_path, new_path, processor.analyzed_workbook_data(new_path),
+                                      processor.cache)
+            queued = Qt.ConnectionType.QueuedConnection
+            thread.compared.connect(lambda diff: self._on_config_compared(thread, diff), queued)
+            thread.failed.connect(lambda message: self._on_config_compare_failed(thread, message), queued)
+            thread.finished.connect(thread.deleteLater)
+            if progress is not None:
+                progress.canceled.connect(lambda: self._on_config_compare_canceled(thread))
+            self.config_diff_thread = thread
+            thread.start()
+            return True
+            
+        except Exception as e:
+            if self.config_diff_progress is not None:
+                self.config_diff_progress.close()
+                self.config_diff_progress = None
+            error_msg = f"比较配置文件时出错: {str(e)}"
+            logger.error(error_msg)
+            self._show_error(error_msg)
+            return False
+    
+    def _on_config_compared(self, thread, diff):
+        """配置比较完成，显示差异（界面线程）"""
+        if thread is not self.config_diff_thread:
+            return
+        self.config_diff_thread = None
+        if self.config_diff_progress is not None:
+            self.config_diff_progress.close()
+            self.config_diff_progress = None
+        logger.info(f"配置差异 {thread.old_path} -> {thread.new_path}: {diff.summary()}")
+        
+        if self.main_window:
+            if diff.is_empty():
+                QMessageBox.information(self.main_window, "配置差异", "两个版本的配置没有差异")
+            else:
+                ConfigDiffDialog(diff, self.main_window).exec()
+    
+    def _on_config_compare_canceled(self, thread):
+        """用户取消配置比较（界面线程）"""
+        thread.cancel()
+        if thread is not self.config_diff_thread:
+            return
+        self.config_diff_thread = None
+        self.config_diff_progress = None
+        logger.info(f"用户取消比较配置文件: {thread.old_path}")
+    
+    def _on_config_compare_failed(self, thread, message):
+        """配置比较失败（界面线程）"""
+        if thread is not self.config_diff_thread:
+            return
+        self.config_diff_thread = None
+        if self.config_diff_progress is not None:
+            self.config_diff_progress.close()
+            self.config_diff_progress = None
+        error_msg = f"比较配置文件时出错: {message}"
+        logger.error(error_msg)
+        self._show_error(error_msg)
+    
     # 私有方法 - 处理模型信号
     def _on_config_file_loaded(self, file_path):
         """处理配置文件加载完成事件"""
@@ -1051,6 +1266,7 @@ class MainController:
             logger.info(f"正在加载配置文件工作表列表: {file_path}")
             
             # 创建进度对话框
+            progress = None
             if self.main_window:
                 from PyQt6.QtWidgets import QProgressDialog
                 from PyQt6.QtCore import Qt, QTimer
@@ -1091,6 +1307,11 @@ class MainController:
             if progress:
                 progress.setValue(40)
                 QTimer.singleShot(100, lambda: progress.setValue(60))
+                QApplication.processEvents()
+                # 用户已取消时不切换工作簿，当前工作簿和工作表保持不变
+                if progress.wasCanceled():
+                    logger.info(f"用户取消加载配置文件: {file_path}")
+                    return False
 
             # 使用ConfigModel加载Excel文件并获取工作表列表
             result = self.config_model.load_file_sheets_only(file_path)
@@ -1103,6 +1324,8 @@ class MainController:
                 
             if result:
                 logger.info(f"成功加载配置文件工作表列表: {file_path}")
+                # 用户选择工作表期间在后台预先读取和分析
+                self.sheet_prefetcher.start(file_path, self.config_model.get_sheet_list())
                 return True
 
             return False
@@ -1146,21 +1369,30 @@ class MainController:
             logger.error(f"处理配置文件确定按钮点击事件时出错: {str(e)}")
             self._show_error(f"处理配置文件确定按钮点击事件时出错: {str(e)}")
             
-    def load_and_analyze_sheet_data(self, file_path, sheet_name):
-        """加载并分析工作表数据
+    def load_and_analyze_sheet_data(self, file_path, sheet_name, on_loaded=None):
+        """在后台线程中加载并分析工作表数据，完成后在界面线程中更新P/N列表
+        
         Args:
             file_path: 配置文件路径
             sheet_name: 工作表名称
+            on_loaded: 加载成功并更新P/N列表后调用的函数
         """
         try:
             logger.info(f"正在加载并分析工作表数据: {sheet_name}")
             
+            # 之前的加载尚未完成时取消并丢弃其结果，并为新的加载单独打开工作簿会话
+            previous = self.sheet_load_thread
+            self.sheet_load_thread = None
+            if previous is not None and previous.isRunning():
+                logger.info(f"丢弃尚未完成的工作表加载: {previous.sheet_name}")
+                previous.cancel()
+                self._sheet_session = None
+            if self._sheet_session is None or not self._sheet_session.matches(file_path):
+                self._sheet_session = WorkbookSession(file_path)
+            
             # 创建进度对话框
+            progress = None
             if self.main_window:
-                from PyQt6.QtWidgets import QProgressDialog
-                from PyQt6.QtCore import Qt, QTimer
-                
-                # 创建进度对话框
                 progress = QProgressDialog("正在加载工作表数据...", "取消", 0, 100, self.main_window)
                 progress.setWindowTitle("加载中")
                 progress.setWindowModality(Qt.WindowModality.WindowModal)
@@ -1170,60 +1402,109 @@ class MainController:
                 progress.setMinimumWidth(400)
                 # 设置标签文本
                 progress.setLabelText(f"正在加载工作表 {sheet_name} 数据...\n请稍候")
-                # 强制显示进度对话框
                 progress.show()
-                # 确保进度对话框立即更新
-                QApplication.processEvents()
-                
-                # 更新进度
-                progress.setValue(10)
-                QTimer.singleShot(100, lambda: progress.setValue(20))
-
-            # 使用ConfigProcessor加载工作表数据
-            if progress:
-                progress.setValue(30)
-                
-            result = self.config_model.processor.load_sheet_data(file_path, sheet_name)
+            if self.sheet_load_progress is not None:
+                self.sheet_load_progress.close()
+            self.sheet_load_progress = progress
             
-            if progress:
-                progress.setValue(50)
+            # 读取和分析在后台线程中进行，结果通过排队信号回到界面线程
+            thread = SheetLoadThread(self.config_model.processor, self.sheet_prefetcher,
+                                     self._sheet_session, file_path, sheet_name)
+            queued = Qt.ConnectionType.QueuedConnection
+            thread.progress.connect(lambda value: self._on_sheet_load_progress(thread, value), queued)
+            thread.loaded.connect(lambda prepared: self._on_sheet_loaded(thread, prepared, on_loaded), queued)
+            thread.failed.connect(lambda message: self._on_sheet_load_failed(thread, message), queued)
+            thread.cancelled.connect(lambda: logger.info(f"工作表 {thread.sheet_name} 的加载已中止"), queued)
+            thread.finished.connect(thread.deleteLater)
+            if progress is not None:
+                # 关闭对话框同样会发出canceled信号，已完成的加载不受影响
+                progress.canceled.connect(lambda: self._on_sheet_load_canceled(thread))
+            self.sheet_load_thread = thread
+            thread.start()
+            return True
                 
+        except Exception as e:
+            if self.sheet_load_progress is not None:
+                self.sheet_load_progress.close()
+                self.sheet_load_progress = None
+            logger.error(f"加载并分析工作表数据时出错: {str(e)}")
+            self._show_error(f"加载并分析工作表数据时出错: {str(e)}")
+            return False
+    
+    def _on_sheet_load_progress(self, thread, value):
+        """工作表加载进度更新（界面线程）"""
+        progress = self.sheet_load_progress
+        if thread is not self.sheet_load_thread or progress is None:
+            return
+        if value < 0:
+            # 读取引擎无法报告进度时显示为忙碌状态
+            progress.setRange(0, 0)
+        else:
+            if progress.maximum() == 0:
+                progress.setRange(0, 100)
+            progress.setValue(value)
+    
+    def _on_sheet_loaded(self, thread, prepared, on_loaded=None):
+        """工作表在后台加载完成，使结果生效并更新P/N列表（界面线程）"""
+        if thread is not self.sheet_load_thread:
+            logger.debug(f"忽略过期的工作表加载结果: {thread.sheet_name}")
+            if thread.session is not self._sheet_session:
+                # 取消时已丢弃的会话不会再被使用
+                thread.session.close()
+            return
+        self.sheet_load_thread = None
+        file_path = prepared['file_path']
+        sheet_name = prepared['sheet_name']
+        try:
+            result = self.config_model.processor.install_sheet(prepared)
             if result:
                 # 更新当前表
                 self.config_model.current_sheet = sheet_name
+                self.sheet_prefetcher.remember(file_path, sheet_name)
                 
-                if progress:
-                    progress.setValue(60)
-                    QTimer.singleShot(100, lambda: progress.setValue(70))
-
                 # 获取PN列表
                 pn_list = self.config_model.processor.get_pn_list(sheet_name)
                 
-                if progress:
-                    progress.setValue(80)
-                    QTimer.singleShot(100, lambda: progress.setValue(90))
-
                 # 发送PN列表更新事件
                 self.config_model.pn_list_updated.emit(pn_list)
                 self.event_bus.publish(PN_LIST_UPDATED, pn_list)
-                
-                if progress:
-                    progress.setValue(100)
-                    # 延迟关闭进度对话框，确保用户能看到进度
-                    QTimer.singleShot(500, lambda: progress.close())
-
                 logger.info(f"成功加载工作表数据: {sheet_name}, 包含 {len(pn_list)} 个P/N")
+                
+                if on_loaded is not None:
+                    on_loaded()
             else:
-                if progress:
-                    progress.close()
                 logger.error(f"加载工作表数据失败: {sheet_name}")
                 self._show_error(f"加载工作表数据失败: {sheet_name}")
-                
         except Exception as e:
-            if 'progress' in locals() and progress:
-                progress.close()
             logger.error(f"加载并分析工作表数据时出错: {str(e)}")
             self._show_error(f"加载并分析工作表数据时出错: {str(e)}")
+        finally:
+            if self.sheet_load_progress is not None:
+                self.sheet_load_progress.close()
+                self.sheet_load_progress = None
+    
+    def _on_sheet_load_canceled(self, thread):
+        """用户取消工作表加载（界面线程），之前生效的工作表保持不变"""
+        thread.cancel()
+        if thread is not self.sheet_load_thread:
+            return
+        self.sheet_load_thread = None
+        self.sheet_load_progress = None
+        # 被取消的线程中止时会关闭它的会话，下一次加载单独打开新的会话
+        if self._sheet_session is thread.session:
+            self._sheet_session = None
+        logger.info(f"用户取消加载工作表: {thread.sheet_name}")
+    
+    def _on_sheet_load_failed(self, thread, message):
+        """工作表后台加载失败（界面线程）"""
+        if thread is not self.sheet_load_thread:
+            return
+        self.sheet_load_thread = None
+        if self.sheet_load_progress is not None:
+            self.sheet_load_progress.close()
+            self.sheet_load_progress = None
+        logger.error(f"加载工作表数据失败: {thread.sheet_name}: {message}")
+        self._show_error(f"加载并分析工作表数据时出错: {message}")
     
     def _on_sheet_changed(self, index):
         """处理工作表变更事件"""
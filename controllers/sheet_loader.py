@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作表加载线程模块
+
+在后台线程中读取并分析用户选择的工作表，界面线程只负责显示进度和使结果生效：
+- 优先使用内存中的工作表和预取结果（等待正在进行的预取任务也在后台线程中完成）
+- 读取进度来自工作表XML的解压进度（openpyxl引擎），无法报告时显示为忙碌状态
+- 结果通过排队信号交给界面线程，由ConfigProcessor.install_sheet生效
+- 取消时在读取和分析的检查点中止，丢弃已读取的数据，之前生效的工作表不受影响
+"""
+
+import gc
+import logging
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from utils.cancellation import CancelToken, LoadCancelled
+
+logger = logging.getLogger(__name__)
+
+# 进度分配：读取工作表占 READ_START~READ_END，其余为分析
+READ_START = 5
+READ_END = 90
+
+# 无法报告进度时发出的进度值
+BUSY = -1
+
+
+class SheetLoadThread(QThread):
+    """工作表加载线程类"""
+
+    progress = pyqtSignal(int)      # 0~100，BUSY表示无法报告进度
+    loaded = pyqtSignal(object)     # ConfigProcessor.prepare_sheet的结果
+    failed = pyqtSignal(str)        # 错误信息
+    cancelled = pyqtSignal()        # 加载已取消
+
+    def __init__(self, processor, prefetcher, session, file_path, sheet_name):
+        """初始化加载线程
+
+        Args:
+            processor: ConfigProcessor实例（只调用不修改处理器状态的prepare_sheet）
+            prefetcher: SheetPrefetcher实例，为None时不使用预取结果
+            session: 读取使用的WorkbookSession，只在本线程中使用
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+        """
+        super().__init__()
+        self.processor = processor
+        self.prefetcher = prefetcher
+        self.session = session
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.cancel_token = CancelToken()
+        self._last_value = None
+
+    def cancel(self):
+        """请求取消加载（可在界面线程中调用）"""
+        self.cancel_token.cancel()
+
+    def _emit_progress(self, value):
+        if value != self._last_value:
+            self._last_value = value
+            self.progress.emit(value)
+
+    def _on_read_progress(self, done, total):
+        """读取进度回调（在本线程中调用）"""
+        if total <= 0:
+            self._emit_progress(BUSY)
+        else:
+            self._emit_progress(READ_START + (READ_END - READ_START) * done // total)
+
+    def run(self):
+        try:
+            self._emit_progress(0)
+
+            # 最近加载过的工作表直接从内存取回；已预取的直接生效，正在预取的等待其完成
+            prepared = None
+            if self.processor.sheet_store is not None:
+                prepared = self.processor.sheet_store.get(self.file_path, self.sheet_name)
+            if prepared is None and self.prefetcher is not None:
+                prepared = self.prefetcher.take(self.file_path, self.sheet_name, cancel=self.cancel_token)
+                if prepared is not None:
+                    logger.info(f"使用预取的工作表数据: {self.sheet_name}")
+
+            if prepared is None:
+                self._emit_progress(READ_START)
+                prepared = self.processor.prepare_sheet(
+                    self.file_path, self.sheet_name, self.session,
+                    progress=self._on_read_progress, cancel=self.cancel_token)
+            self.cancel_token.check()
+
+            self._emit_progress(100)
+            self.loaded.emit(prepared)
+        except LoadCancelled:
+            logger.info(f"已取消加载工作表: {self.sheet_name}")
+            # 中止的解析可能留下未完成的状态，关闭会话并立即释放已读取的数据
+            prepared = None
+            self.session.close()
+            gc.collect()
+            self.cancelled.emit()
+        except Exception as e:
+            logger.error(f"后台加载工作表 {self.sheet_name} 失败: {str(e)}")
+            self.failed.emit(str(e))
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作表预取模块
+
+打开配置工作簿后，在QThreadPool后台线程中预先读取并分析用户可能选择的工作表：
+上次使用的工作表、第一个工作表，然后在内存预算内预取其余工作表。
+选择工作表时，已完成的预取结果立即生效；仍在进行中的预取任务会被等待而不是重新加载。
+"""
+
+import os
+import json
+import logging
+import threading
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+from utils.cancellation import CancelToken, LoadCancelled
+from utils.sheet_store import deep_sizeof
+from utils.workbook_session import WorkbookSession
+
+logger = logging.getLogger(__name__)
+
+# 预取结果的默认内存预算
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024
+
+# 等待预取任务时检查取消请求的间隔（秒）
+CANCEL_POLL_INTERVAL = 0.1
+
+# 每个工作簿上次使用的工作表
+RECENT_SHEETS_PATH = os.path.join(os.path.expanduser('~'), '.autoconfig', 'recent_sheets.json')
+
+
+def prepared_bytes(prepared):
+    """预取结果占用的内存（字节），使用prepare_sheet统计的结果"""
+    size = prepared.get('size')
+    return size if size is not None else deep_sizeof(prepared)
+
+
+class _PrefetchJob(QRunnable):
+    """单个工作表的预取任务"""
+
+    def __init__(self, prefetcher, generation, file_path, sheet_name, session, cancel):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.prefetcher = prefetcher
+        self.generation = generation
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.session = session
+        self.cancel = cancel
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.size = 0
+
+    def run(self):
+        try:
+            if self.prefetcher._job_started(self):
+                self.result = self.prefetcher.processor.prepare_sheet(
+                    self.file_path, self.sheet_name, self.session, cancel=self.cancel)
+        except LoadCancelled:
+            logger.debug(f"预取工作表 {self.sheet_name} 已取消")
+        except Exception as e:
+            self.error = e
+            logger.warning(f"预取工作表 {self.sheet_name} 失败: {str(e)}")
+        finally:
+            self.done.set()
+            self.prefetcher._job_finished(self)
+
+
+class SheetPrefetcher:
+    """工作表预取器类"""
+
+    def __init__(self, processor, memory_budget=DEFAULT_MEMORY_BUDGET, max_threads=1):
+        """初始化预取器
+
+        Args:
+            processor: ConfigProcessor实例，用于读取和分析工作表
+            memory_budget: 预取结果的内存预算（字节）
+            max_threads: 后台线程数
+        """
+        self.processor = processor
+        self.memory_budget = memory_budget
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._file_path = None
+        self._session = None  # 单线程预取时各任务共用的工作簿会话（多线程时各任务单独打开并关闭会话）
+        self._cancel = CancelToken()  # 当前工作簿各预取任务共用的取消令牌
+        self._jobs = {}      # {工作表: _PrefetchJob}
+        self._running = set()  # 正在运行的任务
+        self._queue = []     # 等待提交的工作表
+        self._used_bytes = 0
+
+    def is_current(self, generation):
+        """任务是否属于当前工作簿"""
+        return generation == self._generation
+
+    def start(self, file_path, sheet_names):
+        """开始预取工作簿中的工作表，丢弃之前工作簿的预取结果
+
+        Args:
+            file_path: 工作簿路径
+            sheet_names: 可选择的工作表名称列表
+        """
+        self.cancel()
+        if not sheet_names:
+            return
+
+        order = []
+        last_sheet = self._load_recent().get(os.path.abspath(file_path))
+        if last_sheet in sheet_names:
+            order.append(last_sheet)
+        order.extend(sheet for sheet in sheet_names if sheet not in order)
+
+        with self._lock:
+            self._file_path = file_path
+            if self.pool.maxThreadCount() == 1:
+                self._session = WorkbookSession(file_path)
+            self._queue = order
+        logger.info(f"开始预取工作表: {order}")
+        self._submit_next()
+
+    def _submit_next(self):
+        """在内存预算内提交下一个预取任务"""
+        with self._lock:
+            if not self._queue or self._used_bytes >= self.memory_budget:
+                if self._queue:
+                    logger.info(f"预取已达到内存预算，剩余工作表不再预取: {self._queue}")
+                    self._queue = []
+                return
+            sheet_name = self._queue.pop(0)
+            job = _PrefetchJob(self, self._generation, self._file_path, sheet_name, self._session, self._cancel)
+            self._jobs[sheet_name] = job
+        self.pool.start(job)
+
+    def _job_started(self, job):
+        """后台线程中任务开始时的回调
+
+        Returns:
+            bool: 任务属于当前工作簿、应当继续执行时返回True
+        """
+        with self._lock:
+            if not self.is_current(job.generation):
+                return False
+            self._running.add(job)
+            return True
+
+    def _detached_session(self, session):
+        """已不再使用、可以关闭的共用会话（调用方需持有_lock）"""
+        if session is None or session is self._session:
+            return None
+        if any(job.session is session for job in self._running):
+            return None
+        return session
+
+    def _job_finished(self, job):
+        """后台线程中任务完成后的回调"""
+        with self._lock:
+            self._running.discard(job)
+            # 取消或重新开始后，最后一个使用旧会话的任务结束时关闭该会话
+            session = self._detached_session(job.session)
+            current = self.is_current(job.generation)
+            if current and job.result is not None and self._jobs.get(job.sheet_name) is job:
+                job.size = prepared_bytes(job.result)
+                self._used_bytes += job.size
+                logger.debug(f"工作表 {job.sheet_name} 预取完成，预取数据共 {self._used_bytes} 字节")
+        if session is not None:
+            session.close()
+        if current:
+            self._submit_next()
+
+    def take(self, file_path, sheet_name, cancel=None):
+        """取出工作表的预取结果
+
+        预取已完成时立即返回；正在进行时等待其完成；尚未开始或文件已变化时返回None，由调用方直接加载。
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            cancel: 调用方的CancelToken，等待预取任务期间定期检查
+
+        Returns:
+            dict: ConfigProcessor.prepare_sheet的结果，或None
+
+        Raises:
+            LoadCancelled: 等待期间调用方取消了加载（预取任务继续进行，结果留给下次使用）
+        """
+        with self._lock:
+            if self._file_path is None or os.path.abspath(file_path) != os.path.abspath(self._file_path):
+                return None
+            job = self._jobs.pop(sheet_name, None)
+            if sheet_name in self._queue:
+                self._queue.remove(sheet_name)
+        if job is None:
+            return None
+
+        if not job.done.is_set():
+            if self.pool.tryTake(job):
+                # 任务还在队列中，没有必要再等待；继续预取其余工作表
+                self._submit_next()
+                return None
+            logger.info(f"等待工作表 {sheet_name} 的预取任务完成")
+            while not job.done.wait(CANCEL_POLL_INTERVAL):
+                if cancel is not None and cancel.cancelled:
+                    with self._lock:
+                        if self.is_current(job.generation) and sheet_name not in self._jobs:
+                            self._jobs[sheet_name] = job
+                    cancel.check()
+
+        prepared = job.result
+        if prepared is None:
+            return None
+        with self._lock:
+            self._used_bytes = max(0, self._used_bytes - job.size)
+
+        stat = prepared.get('stat')
+        try:
+            current = os.stat(file_path)
+            if stat is None or (current.st_size, current.st_mtime_ns) != tuple(stat):
+                logger.info(f"工作簿在预取后已变化，重新加载工作表: {sheet_name}")
+                return None
+        except OSError:
+            return None
+        return prepared
+
+    def cancel(self):
+        """取消所有预取任务并丢弃预取结果，正在进行的任务在下一个检查点中止
+
+        共用的工作簿会话立即关闭；仍有任务在使用时由最后一个任务结束时关闭。
+        """
+        with self._lock:
+            self._cancel.cancel()
+            self._cancel = CancelToken()
+            self._generation += 1
+            self._queue = []
+            jobs = list(self._jobs.values())
+            self._jobs = {}
+            self._used_bytes = 0
+            session, self._session = self._session, None
+            session = self._detached_session(session)
+        for job in jobs:
+            self.pool.tryTake(job)
+        if session is not None:
+            session.close()
+
+    def remember(self, file_path, sheet_name):
+        """记录工作簿上次使用的工作表，下次打开时优先预取
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+        """
+        recent = self._load_recent()
+        recent[os.path.abspath(file_path)] = sheet_name
+        try:
+            os.makedirs(os.path.dirname(RECENT_SHEETS_PATH), exist_ok=True)
+            with open(RECENT_SHEETS_PATH, 'w', encoding='utf-8') as f:
+                json.dump(recent, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"保存最近使用的工作表失败: {str(e)}")
+
+    @staticmethod
+    def _load_recent():
+        try:
+            with open(RECENT_SHEETS_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"读取最近使用的工作表失败: {str(e)}")
+            return {}
@@ -55,6 +55,9 @@ def main():
     
     window.show()
     
+    # 退出前停止后台任务并保存缓存
+    app.aboutToQuit.connect(controller.shutdown)
+    
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 from processors.config_processor import ConfigProcessor
+from utils.excel_reader import read_sheet_names
 from utils.event_bus import event_bus
 from utils.event_constants import (
     CONFIG_FILE_SELECTED,
@@ -46,27 +47,14 @@ class ConfigModel(QObject):
     def __init__(self, event_bus_instance=None):
         super().__init__()
         self.processor = ConfigProcessor()
+        # 界面一次只查看少数几个PN，按需提取配置以缩短加载工作表的时间
+        self.processor.lazy_extraction = True
         self.file_path = None
         self.current_sheet = None
         self.current_pn = None
         self.config_data = None
-        self.component_keywords = [
-            "CPU", 
-            "GPU", 
-            "Memory", 
-            "LCD", 
-            "WLAN", 
-            "WWAN", 
-            "SSD", 
-            "Battery", 
-            "Adaptor", 
-            "KeyBoard", 
-            "USH", 
-            "Finger Print", 
-            "Smart Card", 
-            "RFID",
-            "FIPS"
-        ]
+        # 与处理器共用同一份组件关键字列表
+        self.component_keywords = self.processor.component_keywords
         
         # 设置事件总线
         self.event_bus = event_bus_instance if event_bus_instance else event_bus
@@ -137,10 +125,8 @@ class ConfigModel(QObject):
                 
             # 尝试加载Excel文件
             try:
-                # 使用pandas读取Excel文件的工作表列表
-                import pandas as pd
-                excel_file = pd.ExcelFile(file_path)
-                sheet_names = excel_file.sheet_names
+                # 只读取workbook.xml获取工作表列表，选择工作表后才解析工作簿
+                sheet_names = read_sheet_names(file_path)
                 
                 # 过滤出包含"_config"的工作表
                 config_sheets = [sheet for sheet in sheet_names if "_config" in sheet.lower()]
@@ -284,7 +270,7 @@ class ConfigModel(QObject):
         """选择系统P/N"""
         try:
             self.current_pn = pn
-            config_details = self.processor.get_config_details(pn)
+            config_details = self.get_config_details(pn)
             
             if config_details is not None:
                 self.config_data = config_details
@@ -310,6 +296,77 @@ class ConfigModel(QObject):
         """获取当前选择的系统P/N"""
         return self.current_pn 
     
+    def get_config_table(self, build=True):
+        """获取当前配置数据的Arrow列式表
+        
+        Args:
+            build: 没有已构建或已保存的表时是否构建
+            
+        Returns:
+            ConfigArrowTable: 未安装pyarrow、没有配置数据或不构建时返回None
+        """
+        try:
+            return self.processor.get_config_table(build)
+        except Exception as e:
+            logger.error(f"构建配置列式表时出错: {str(e)}")
+            return None
+    
+    def get_config_details(self, pn):
+        """获取系统P/N的配置详情
+        
+        当前数据的Arrow列式表已构建或可从缓存加载时直接从表中切片读取，
+        否则按PN提取，不为单个PN构建整张表。
+        
+        Args:
+            pn: 系统PN
+            
+        Returns:
+            pandas.DataFrame: 配置详情，找不到时返回None
+        """
+        table = self.get_config_table(build=False)
+        if table is None:
+            return self.processor.get_config_details(pn)
+        return table.details(pn)
+    
+    def find_pns_using(self, component_type=None, name=None, spec=None, part_pn=None, contains=False):
+        """查找满足条件的系统P/N，如使用某个CPU的所有P/N
+        
+        Args:
+            component_type: 组件类型，如 CPU
+            name: 组件名称
+            spec: 规格
+            part_pn: 料号
+            contains: 为True时按不区分大小写的子串匹配，否则精确匹配
+            
+        Returns:
+            list: 系统P/N列表
+        """
+        table = self.get_config_table()
+        if table is not None:
+            return table.pns_using(component_type, name, spec, part_pn, contains)
+        
+        # 未安装pyarrow时逐个检查配置
+        criteria = {'name': name, 'spec': spec, 'pn': part_pn}
+        def matches(component):
+            for key, value in criteria.items():
+                if value is None:
+                    continue
+                text = str(component.get(key, ''))
+                if not (value.lower() in text.lower() if contains else text == value):
+                    return False
+            return True
+        
+        result = []
+        for pn, item in (self.processor.config_data or {}).items():
+            for keyword, components in item['config'].items():
+                if component_type is not None and not (
+                        component_type.lower() in keyword.lower() if contains else keyword == component_type):
+                    continue
+                if any(matches(component) for component in components):
+                    result.append(pn)
+                    break
+        return result
+    
     def get_pn_list(self):
         """获取当前工作表的P/N列表
         
@@ -350,6 +407,21 @@ class ConfigModel(QObject):
         """
         return self.file_path
         
+    def find_pn(self, pn):
+        """在全局索引中查找System P/N所在位置
+        
+        Args:
+            pn: 系统PN
+            
+        Returns:
+            list: [{'workbook', 'sheet', 'column', 'column_letter'}, ...]
+        """
+        try:
+            return self.processor.find_pn(pn)
+        except Exception as e:
+            logger.error(f"查找System P/N时出错: {str(e)}")
+            return []
+        
     def get_component_keywords(self):
         """获取组件关键字列表"""
         return self.component_keywords 
\ No newline at end of file
@@ -9,10 +9,12 @@ PHBOM数据模型
 
 import os
 import logging
+import threading
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QFileDialog
 
 from processors.phbom_processor import PHBOMProcessor
+from processors.phbom_index import PHBOMIndex
 from utils.event_bus import event_bus
 from utils.event_constants import (
     PHBOM_FILE_SELECTED,
@@ -48,6 +50,10 @@ class PHBOMModel(QObject):
         # 当前文件路径
         self.current_file = None
         
+        # 常驻的PHBOM数据及Number索引
+        self.index = None
+        self._index_lock = threading.Lock()
+        
     def _register_event_handlers(self):
         """注册事件处理器"""
         self.event_bus.subscribe(PHBOM_FILE_SELECTED, self._handle_phbom_file_selected)
@@ -99,6 +105,12 @@ class PHBOMModel(QObject):
                 # 保存当前文件路径
                 self.current_file = file_path
                 
+                # 建立常驻索引，之后的Check不再读取文件
+                try:
+                    self.set_index(PHBOMIndex.from_csv(result))
+                except Exception as e:
+                    logger.error(f"建立PHBOM索引失败: {str(e)}")
+                
                 # 发射文件加载成功信号
                 self.file_loaded.emit(file_path)
                 
@@ -124,4 +136,36 @@ class PHBOMModel(QObject):
             logger.error(error_msg)
             # 发布错误事件
             self.event_bus.publish(ERROR_OCCURRED, error_msg)
-            return False 
\ No newline at end of file
+            return False 
+
+    def set_index(self, index):
+        """设置常驻的PHBOM索引
+        
+        Args:
+            index: PHBOMIndex实例
+        """
+        with self._index_lock:
+            self.index = index
+            
+    def get_index(self, file_path='PHBOM.CSV'):
+        """获取常驻的PHBOM索引
+        
+        尚未建立、来源文件不同或文件已变化时重新读取文件建立索引。
+        
+        Args:
+            file_path: 处理后的PHBOM.CSV路径
+            
+        Returns:
+            PHBOMIndex: 索引对象，文件不存在时返回None
+        """
+        with self._index_lock:
+            index = self.index
+            if index is not None and index.file_path == os.path.abspath(file_path) and not index.is_stale():
+                return index
+            if not os.path.exists(file_path):
+                self.index = None
+                return None
+            if index is not None:
+                logger.info(f"PHBOM文件已变化，重新建立索引: {file_path}")
+            self.index = PHBOMIndex.from_csv(file_path)
+            return self.index
\ No newline at end of file
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置差异比较模块
+
+这个模块比较两个版本配置工作簿的System P/N配置，包括：
+- 新增、删除的System P/N
+- 组件条目的新增、删除以及规格/料号变化
+- 所在工作表的变化
+
+比较基于ConfigProcessor的config_data，使用按键的哈希连接代替嵌套循环：
+先按System P/N连接两个版本，再比较每个P/N的配置签名，签名不同的P/N才按
+(关键字, 组件名称, 序号) 连接组件条目。
+"""
+
+import time
+import logging
+from operator import attrgetter
+from collections import namedtuple
+
+from processors.config_processor import ConfigProcessor
+from processors.config_records import ComponentRecord, RECORD_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 差异类型
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+MOVED = 'moved'
+
+# 单条差异：组件级差异的keyword/name有值；P/N级差异的keyword/name为空字符串
+DiffEntry = namedtuple('DiffEntry', [
+    'kind', 'pn', 'keyword', 'name',
+    'old_spec', 'new_spec', 'old_pn', 'new_pn',
+    'old_sheet', 'new_sheet'
+])
+
+
+_record_fields = attrgetter(*RECORD_FIELDS)
+
+
+def _component_fields(component):
+    """获取组件条目的 (名称, 规格, 料号)"""
+    if type(component) is ComponentRecord:
+        return _record_fields(component)
+    return component['name'], component['spec'], component.get('pn', '')
+
+
+def _component_rows(config):
+    """将一个P/N的配置展开为 {(关键字, 组件名称, 序号): (规格, 料号)}
+
+    同一关键字下名称相同的组件按出现顺序编号，保证连接键唯一。
+
+    Args:
+        config: {关键字: [{'name', 'spec', 'pn'}, ...]}
+
+    Returns:
+        dict: 组件条目
+    """
+    rows = {}
+    for keyword, components in config.items():
+        seen = {}
+        for component in components:
+            name, spec, part = _component_fields(component)
+            ordinal = seen.get(name, 0)
+            seen[name] = ordinal + 1
+            rows[(keyword, name, ordinal)] = (spec, part)
+    return rows
+
+
+def _config_signature(config):
+    """生成P/N配置的签名，签名相同的配置内容一定相同
+
+    Args:
+        config: {关键字: [{'name', 'spec', 'pn'}, ...]}
+
+    Returns:
+        tuple: 配置签名
+    """
+    return tuple(
+        (keyword, tuple(map(_component_fields, components)))
+        for keyword, components in config.items() if components
+    )
+
+
+class ConfigDiff:
+    """配置差异结果类"""
+
+    def __init__(self, old_label, new_label, entries, old_count, new_count, elapsed):
+        """初始化差异结果
+
+        Args:
+            old_label: 旧版本名称（通常是文件路径）
+            new_label: 新版本名称
+            entries: DiffEntry列表
+            old_count: 旧版本的P/N数量
+            new_count: 新版本的P/N数量
+            elapsed: 比较耗时（秒）
+        """
+        self.old_label = old_label
+        self.new_label = new_label
+        self.entries = entries
+        self.old_count = old_count
+        self.new_count = new_count
+        self.elapsed = elapsed
+
+    @property
+    def added_pns(self):
+        """新增的System P/N列表"""
+        return [entry.pn for entry in self.entries if entry.kind == ADDED and not entry.keyword]
+
+    @property
+    def removed_pns(self):
+        """删除的System P/N列表"""
+        return [entry.pn for entry in self.entries if entry.kind == REMOVED and not entry.keyword]
+
+    @property
+    def changed_pns(self):
+        """配置或所在工作表发生变化的System P/N列表"""
+        return list(dict.fromkeys(entry.pn for entry in self.entries
+                                  if entry.keyword or entry.kind == MOVED))
+
+    def component_changes(self, pn):
+        """获取指定P/N的组件级差异
+
+        Args:
+            pn: System P/N
+
+        Returns:
+            list: DiffEntry列表
+        """
+        return [entry for entry in self.entries if entry.pn == pn and entry.keyword]
+
+    def is_empty(self):
+        """两个版本是否没有差异"""
+        return not self.entries
+
+    def summary(self):
+        """获取差异摘要
+
+        Returns:
+            str: 摘要文本
+        """
+        return (f"新增 {len(self.added_pns)} 个P/N，删除 {len(self.removed_pns)} 个P/N，"
+                f"变化 {len(self.changed_pns)} 个P/N，共 {len(self.entries)} 处差异")
+
+
+def diff_config_data(old_data, new_data, old_label='', new_label=''):
+    """比较两个版本的config_data
+
+    Args:
+        old_data: 旧版本 {pn: {'sheet': 工作表, 'config': 配置}}
+        new_data: 新版本 {pn: {'sheet': 工作表, 'config': 配置}}
+        old_label: 旧版本名称
+        new_label: 新版本名称
+
+    Returns:
+        ConfigDiff: 差异结果
+    """
+    start = time.perf_counter()
+    entries = []
+
+    old_pns = set(old_data.keys())
+    new_pns = set(new_data.keys())
+
+    for pn in old_data.keys():
+        if pn not in new_pns:
+            sheet = old_data[pn]['sheet']
+            entries.append(DiffEntry(REMOVED, pn, '', '', '', '', '', '', sheet, ''))
+
+    for pn in new_data.keys():
+        if pn not in old_pns:
+            sheet = new_data[pn]['sheet']
+            entries.append(DiffEntry(ADDED, pn, '', '', '', '', '', '', '', sheet))
+            continue
+
+        old_item = old_data[pn]
+        new_item = new_data[pn]
+        old_sheet, new_sheet = old_item['sheet'], new_item['sheet']
+        if old_sheet != new_sheet:
+            entries.append(DiffEntry(MOVED, pn, '', '', '', '', '', '', old_sheet, new_sheet))
+
+        old_config, new_config = old_item['config'], new_item['config']
+        if _config_signature(old_config) == _config_signature(new_config):
+            continue
+
+        # 签名不同时按 (关键字, 名称, 序号) 连接组件条目
+        old_rows = _component_rows(old_config)
+        new_rows = _component_rows(new_config)
+        for key, (old_spec, old_part) in old_rows.items():
+            new_row = new_rows.get(key)
+            if new_row is None:
+                entries.append(DiffEntry(REMOVED, pn, key[0], key[1], old_spec, '', old_part, '',
+                                         old_sheet, new_sheet))
+            elif new_row != (old_spec, old_part):
+                entries.append(DiffEntry(CHANGED, pn, key[0], key[1], old_spec, new_row[0],
+                                         old_part, new_row[1], old_sheet, new_sheet))
+        for key, (new_spec, new_part) in new_rows.items():
+            if key not in old_rows:
+                entries.append(DiffEntry(ADDED, pn, key[0], key[1], '', new_spec, '', new_part,
+                                         old_sheet, new_sheet))
+
+    elapsed = time.perf_counter() - start
+    diff = ConfigDiff(old_label, new_label, entries, len(old_pns), len(new_pns), elapsed)
+    logger.info(f"配置差异比较完成: {diff.summary()}，耗时 {elapsed:.3f}s")
+    return diff
+
+
+def load_config_data(file_path, processor=None, cancel=None, cache=None):
+    """读取并分析工作簿的全部配置工作表
+
+    Args:
+        file_path: 工作簿路径
+        processor: 使用的ConfigProcessor，为None时新建一个不写入System P/N索引和工作表存储的处理器
+        cancel: CancelToken，取消时抛出LoadCancelled
+        cache: 新建处理器时使用的AnalysisCache（如界面处理器的缓存），为None时不使用缓存
+
+    Returns:
+        dict: config_data，失败时返回None
+    """
+    if processor is None:
+        # 比较的旧版本不应进入全局System P/N索引，也不另外创建索引和缓存实例
+        processor = ConfigProcessor(persistent=False)
+        processor.cache = cache
+    processor.load_excel_file(file_path)
+    if not processor.analyze_all_sheets(cancel=cancel):
+        return None
+    return processor.get_config_data()
+
+
+def compare_workbooks(old_path, new_path, new_data=None, cancel=None, cache=None):
+    """比较两个版本的配置工作簿
+
+    Args:
+        old_path: 旧版本工作簿路径
+        new_path: 新版本工作簿路径
+        new_data: 新版本已分析的config_data，为None时读取并分析new_path
+        cancel: CancelToken，取消时抛出LoadCancelled
+        cache: 分析时使用的AnalysisCache，为None时不使用缓存
+
+    Returns:
+        ConfigDiff: 差异结果
+    """
+    old_data = load_config_data(old_path, cancel=cancel, cache=cache)
+    if old_data is None:
+        raise ValueError(f"分析配置文件失败: {old_path}")
+    if new_data is None:
+        new_data = load_config_data(new_path, cancel=cancel, cache=cache)
+        if new_data is None:
+            raise ValueError(f"分析配置文件失败: {new_path}")
+    else:
+        logger.info(f"使用已分析的配置数据: {new_path}")
+    return diff_config_data(old_data, new_data, old_path, new_path)
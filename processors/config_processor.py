@@ -13,33 +13,142 @@
 import sys
 import os
 import logging
+import time
 import pandas as pd
 import re
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 
 # 将项目根目录添加到Python路径
 current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if current_dir not in sys.path:
     sys.path.append(current_dir)
 
+from processors.sheet_analyzer import (
+    to_object_array,
+    collect_components_map,
+    find_pn_columns,
+    extract_pn_configs,
+    LazyConfigData,
+    HeaderLocator,
+    scan_used_range
+)
+from processors.config_table import ARROW_AVAILABLE, ConfigArrowTable
+from utils.analysis_cache import AnalysisCache
+from utils.cancellation import LoadCancelled
+from utils.component_taxonomy import COMPONENT_KEYWORDS, get_taxonomy
+from utils.excel_reader import sheet_fingerprints
+from utils.workbook_session import WorkbookSession
+from utils.pn_index import PNIndex
+from utils.sheet_store import SheetStore, deep_sizeof
+
 logger = logging.getLogger(__name__)
 
+# analyze_all_sheets 整个工作簿分析结果的缓存键
+ALL_SHEETS_CACHE_KEY = '*'
+
+# 并行分析时检查取消请求的间隔（秒）
+CANCEL_POLL_INTERVAL = 0.2
+
+# 并行分析时每个工作进程持有的工作簿会话和标题定位器
+_worker_session = None
+_worker_header_locator = None
+
+
+def _file_stat(file_path):
+    try:
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+    except OSError:
+        return None
+
+
+def _init_analysis_worker(file_path):
+    """并行分析工作进程初始化：每个进程只打开一次工作簿"""
+    global _worker_session, _worker_header_locator
+    _worker_session = WorkbookSession(file_path)
+    _worker_header_locator = HeaderLocator()
+
+
+def _analyze_sheet_job(sheet_name, component_keywords):
+    """并行分析任务：在工作进程中读取并分析单个工作表
+    
+    Args:
+        sheet_name: 工作表名称
+        component_keywords: 组件关键字列表
+    Returns:
+        tuple: (工作表名称, 工作表配置, PN配置列表, 耗时)
+    """
+    start = time.perf_counter()
+    processor = ConfigProcessor(persistent=False)
+    processor.component_keywords = component_keywords
+    processor.header_locator = _worker_header_locator
+    df = processor.read_config_sheet(_worker_session, sheet_name, header=None)
+    sheet_config, pn_configs = processor.analyze_sheet_frame(sheet_name, df)
+    return sheet_name, sheet_config, pn_configs, time.perf_counter() - start
+
 class ConfigProcessor:
     """配置处理器类，负责处理Excel配置文件"""
     
-    def __init__(self):
-        """初始化配置处理器"""
-        self.excel_file = None
+    def __init__(self, persistent=True):
+        """初始化配置处理器
+        
+        Args:
+            persistent: 是否创建分析缓存、工作表存储和System P/N索引；
+                为False时都不创建（为None），用于后台任务或比较等独立分析
+        """
+        self.session = None  # 工作簿会话，首次需要读取工作表数据时才打开容器
+        self.file_path = None
+        self.sheet_names = []
         self.current_sheet = None
         self.config_data = None
         self.sheet_data = {}
         self.sheet_configs = {}  # 添加sheet_configs的初始化
         
         # 添加组件关键字列表
-        self.component_keywords = [
-            "CPU", "GPU", "Memory", "LCD", "WLAN", "WWAN", "SSD",
-            "Battery", "Adaptor", "KeyBoard", "USH", "Finger Print",
-            "Smart Card", "RFID", "FIPS"
-        ]
+        self.component_keywords = list(COMPONENT_KEYWORDS)
+        
+        # 是否使用向量化分析引擎（False时使用逐单元格分析）
+        self.use_vectorized = True
+        
+        # System P/N标题定位器，按工作表布局缓存标题位置
+        self.header_locator = HeaderLocator()
+        
+        # 是否按需提取配置：加载工作表时只记录PN所在列，首次查看某个PN时才提取其配置
+        self.lazy_extraction = False
+        
+        # 是否两阶段读取：先定位标题和组件块，再只读取该范围（跳过无关的备注区域和格式行）
+        self.bounded_read = True
+        
+        # 分析结果磁盘缓存，设为None时禁用
+        self.cache = AnalysisCache() if persistent else None
+        
+        # 最近使用的工作表数据和分析结果的内存存储，设为None时禁用
+        self.sheet_store = SheetStore() if persistent else None
+        
+        # System P/N全局索引，设为None时禁用
+        self.pn_index = PNIndex() if persistent else None
+        
+        # analyze_all_sheets 是否默认使用进程池并行分析，以及工作进程数（None为CPU核数）
+        self.parallel_analysis = False
+        self.max_workers = None
+        
+        # 最近一次analyze_all_sheets的耗时统计
+        self.analysis_stats = {}
+        
+        # 最近一次analyze_all_sheets各工作表的指纹和分析结果，用于增量重新分析
+        self._last_sheet_results = {}
+        
+        # 最近一次analyze_all_sheets成功时的 (工作簿, 文件大小/修改时间, 配置数据)，配置数据被替换后失效
+        self._workbook_analysis = None
+        
+        # 当前配置数据的Arrow列式表及其对应的配置数据，配置数据被替换后重新构建
+        self._config_table = None
+        self._config_table_source = None
+        
+        # 当前配置数据对应的 (工作簿, 缓存工作表键, 文件大小/修改时间, 配置数据)，用于保存和内存映射列式表
+        self._config_data_origin = None
         
     def load_excel_file(self, file_path):
         """加载Excel文件
@@ -50,11 +159,15 @@ class ConfigProcessor:
         try:
             logger.info(f"开始加载Excel文件: {file_path}")
             
-            # 使用pandas读取Excel文件
-            self.excel_file = pd.ExcelFile(file_path)
+            # 只读取工作表列表，完整的ExcelFile延迟到选择工作表时再打开
+            session = self._get_session(file_path)
+            all_sheets = session.sheet_names
+            self.file_path = file_path
+            self.sheet_names = all_sheets
             
-            # 获取所有sheet名称
-            all_sheets = self.excel_file.sheet_names
+            # 文件变化后丢弃该工作簿过期的P/N索引
+            if self.pn_index is not None:
+                self.pn_index.refresh_workbook(file_path)
             logger.debug(f"找到工作表: {all_sheets}")
             
             # 过滤包含config的sheet
@@ -74,6 +187,43 @@ class ConfigProcessor:
             logger.error(error_msg)
             raise
             
+    def _get_session(self, file_path):
+        """获取文件对应的工作簿会话，文件变化时重新创建
+        
+        Args:
+            file_path: Excel文件路径
+        Returns:
+            WorkbookSession: 工作簿会话
+        """
+        if self.session is None or not self.session.matches(file_path):
+            self.close_excel_file()
+            self.session = WorkbookSession(file_path)
+        return self.session
+        
+    def get_excel_file(self):
+        """获取已打开的ExcelFile，未打开时才解析工作簿
+        
+        Returns:
+            pandas.ExcelFile: Excel文件对象
+        """
+        if not self.file_path:
+            return None
+        return self._get_session(self.file_path).excel_file
+        
+    def close_excel_file(self):
+        """关闭工作簿会话"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            
+    def close(self):
+        """关闭处理器：关闭工作簿会话并保存缓存和P/N索引中未保存的修改"""
+        self.close_excel_file()
+        if self.cache is not None:
+            self.cache.close()
+        if self.pn_index is not None:
+            self.pn_index.flush()
+            
     def load_sheet_data(self, file_path, sheet_name):
         """加载指定工作表的数据
         
@@ -84,31 +234,261 @@ class ConfigProcessor:
         try:
             logger.info(f"加载工作表数据: {sheet_name}")
             
-            # 设置当前sheet
-            self.current_sheet = sheet_name
-            
-            # 清除之前的数据
-            self.sheet_data.clear()
-            self.sheet_configs.clear()
-            self.config_data = {}
-            
-            # 加载指定的sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            self.sheet_data[sheet_name] = df
-            logger.debug(f"成功加载工作表 {sheet_name}")
-            
-            # 分析当前工作表结构
-            success = self._analyze_sheet(sheet_name, df)
-            if not success:
-                raise ValueError(f"工作表 {sheet_name} 分析失败")
-            
-            return True
+            # 最近加载过且文件未变化的工作表直接从内存取回
+            prepared = self.sheet_store.get(file_path, sheet_name) if self.sheet_store is not None else None
+            if prepared is None:
+                # 在会话中加载指定的sheet，复用已解析的容器和共享字符串
+                prepared = self.prepare_sheet(file_path, sheet_name, self._get_session(file_path))
+            return self.install_sheet(prepared)
             
         except Exception as e:
             error_msg = f"加载工作表 {sheet_name} 失败: {str(e)}"
             logger.error(error_msg)
             raise
-
+            
+    def _analysis_clone(self):
+        """创建与当前设置相同、但不带缓存和索引的处理器，用于独立分析"""
+        clone = ConfigProcessor(persistent=False)
+        clone.component_keywords = self.component_keywords
+        clone.use_vectorized = self.use_vectorized
+        clone.lazy_extraction = self.lazy_extraction
+        clone.bounded_read = self.bounded_read
+        clone.header_locator = self.header_locator
+        return clone
+        
+    def prepare_sheet(self, file_path, sheet_name, session=None, progress=None, cancel=None):
+        """读取并分析工作表，不修改处理器状态
+        
+        不访问处理器自身的工作簿会话，可以在后台线程中调用；结果交给install_sheet生效。
+        取消时丢弃已读取的数据，不写入缓存，之前生效的工作表不受影响。
+        
+        Args:
+            file_path: Excel文件路径
+            sheet_name: 工作表名称
+            session: 使用的工作簿会话，为None时单独打开并在完成后关闭
+            progress: 读取进度回调 progress(已完成量, 总量)，见WorkbookSession.read_sheet
+            cancel: CancelToken，在读取过程中和各阶段之间检查
+        Returns:
+            dict: 已分析的工作表数据
+        Raises:
+            LoadCancelled: 加载被取消
+        """
+        if cancel is not None:
+            cancel.check()
+        if session is not None:
+            return self._prepare_sheet(file_path, sheet_name, session, progress, cancel)
+        # 单独打开的会话在完成后关闭
+        session = WorkbookSession(file_path)
+        try:
+            return self._prepare_sheet(file_path, sheet_name, session, progress, cancel)
+        finally:
+            session.close()
+            
+    def _prepare_sheet(self, file_path, sheet_name, session, progress, cancel):
+        """prepare_sheet的实现，使用指定的工作簿会话"""
+        prepared = {
+            'file_path': file_path,
+            'sheet_name': sheet_name,
+            'stat': session.stat
+        }
+        
+        # 文件未变化时直接使用缓存的分析结果，跳过Excel解析
+        fingerprint = None
+        if self.cache is not None:
+            stale = []
+            payload = self.cache.get(file_path, sheet_name, on_stale=stale.append)
+            if payload is None and stale:
+                # 工作簿已修改，但这个工作表的内容指纹未变化时仍可复用
+                fingerprint = sheet_fingerprints(file_path, [sheet_name]).get(sheet_name)
+                if fingerprint is not None and stale[0].get('fingerprint') == fingerprint:
+                    logger.info(f"工作表 {sheet_name} 内容未变化，复用上次的分析结果")
+                    payload = stale[0]
+                    self.cache.put(file_path, sheet_name, payload)
+            if payload is not None:
+                prepared['cached'] = payload
+                prepared['size'] = deep_sizeof(prepared)
+                return prepared
+        
+        df = self.read_config_sheet(session, sheet_name, progress=progress, cancel=cancel)
+        logger.debug(f"成功加载工作表 {sheet_name}")
+        
+        # 分析当前工作表结构
+        worker = self._analysis_clone()
+        if not worker._analyze_sheet(sheet_name, df):
+            raise ValueError(f"工作表 {sheet_name} 分析失败")
+        if cancel is not None:
+            cancel.check()
+        
+        if self.cache is not None:
+            payload = worker._analysis_payload([sheet_name])
+            if fingerprint is None:
+                fingerprint = sheet_fingerprints(file_path, [sheet_name]).get(sheet_name)
+            payload['fingerprint'] = fingerprint
+            self.cache.put(file_path, sheet_name, payload)
+        
+        prepared['df'] = df
+        prepared['sheet_config'] = worker.sheet_configs[sheet_name]
+        prepared['config_data'] = worker.config_data
+        # 在调用线程（通常是后台线程）中统计占用的内存，install_sheet时不再统计
+        prepared['size'] = deep_sizeof(prepared)
+        return prepared
+        
+    def read_config_sheet(self, session, sheet_name, progress=None, cancel=None, **kwargs):
+        """两阶段读取配置工作表
+        
+        第一阶段流式读取工作表XML，读到组件块结束为止，定位System P/N标题和组件块；
+        第二阶段只读取从A1到组件块末行、最后一个PN列的范围（nrows/usecols），
+        右侧和下方的无关区域不再转换。行号和列号与完整读取时一致，分析结果不变。
+        无法确定范围时（不是xlsx/xlsm、未找到标题或bounded_read为False）完整读取。
+        
+        Args:
+            session: 工作簿会话
+            sheet_name: 工作表名称
+            progress: 读取进度回调，见WorkbookSession.read_sheet
+            cancel: CancelToken
+            **kwargs: 传递给pandas.read_excel的其他参数
+        Returns:
+            pandas.DataFrame: 工作表数据
+        """
+        bounds = None
+        if self.bounded_read and session.streams_rows:
+            header = kwargs.get('header', 0)
+            try:
+                bounds = scan_used_range(lambda max_cols: session.iter_rows(sheet_name, max_cols),
+                                         0 if header is None else header + 1)
+            except Exception as e:
+                logger.warning(f"确定工作表 {sheet_name} 的读取范围失败，完整读取: {str(e)}")
+            if bounds is not None:
+                logger.debug(f"工作表 {sheet_name} 只读取前 {bounds[0]} 行、前 {bounds[1] or '全部'} 列")
+            if cancel is not None:
+                cancel.check()
+        return session.read_sheet(sheet_name, progress=progress, cancel=cancel, bounds=bounds, **kwargs)
+        
+    def install_sheet(self, prepared):
+        """使prepare_sheet的结果成为当前工作表
+        
+        Args:
+            prepared: prepare_sheet返回的数据
+        Returns:
+            bool: 是否成功
+        """
+        file_path = prepared['file_path']
+        sheet_name = prepared['sheet_name']
+        
+        # 设置当前sheet并清除之前的数据
+        self.current_sheet = sheet_name
+        self.sheet_data.clear()
+        self.sheet_configs.clear()
+        self.config_data = {}
+        
+        if 'cached' in prepared:
+            self._restore_analysis(prepared['cached'])
+        else:
+            self.sheet_data[sheet_name] = prepared['df']
+            self.sheet_configs[sheet_name] = prepared['sheet_config']
+            self.config_data = prepared['config_data']
+        self._config_data_origin = (file_path, sheet_name, prepared.get('stat'), self.config_data)
+        
+        if self.sheet_store is not None:
+            self.sheet_store.put(file_path, sheet_name, prepared, prepared.get('size'))
+        self._update_pn_index(file_path, [sheet_name])
+        return True
+        
+    def _analysis_payload(self, sheet_names):
+        """生成用于缓存的分析结果
+        
+        Args:
+            sheet_names: 已分析的工作表名称列表
+        Returns:
+            dict: 包含sheet_configs、config_data和各工作表PN列表
+        """
+        pn_lists = {sheet: [] for sheet in sheet_names}
+        for pn in self.config_data:
+            sheet = self._pn_sheet(pn)
+            if sheet in pn_lists:
+                pn_lists[sheet].append(pn)
+        payload = {
+            'sheet_configs': {sheet: self.sheet_configs[sheet]
+                              for sheet in sheet_names if sheet in self.sheet_configs},
+            'pn_lists': pn_lists
+        }
+        if isinstance(self.config_data, LazyConfigData):
+            # 按需提取模式只缓存工作表数据，恢复后仍按需提取
+            payload['sheet_values'] = {sheet: self.sheet_configs[sheet]['values']
+                                       for sheet in payload['sheet_configs']}
+            payload['sheet_configs'] = {
+                sheet: {key: value for key, value in sheet_config.items() if key != 'values'}
+                for sheet, sheet_config in payload['sheet_configs'].items()
+            }
+        else:
+            payload['config_data'] = self.config_data
+        return payload
+        
+    def _restore_analysis(self, payload):
+        """从缓存的分析结果恢复状态
+        
+        Args:
+            payload: _analysis_payload生成的分析结果
+        """
+        self.sheet_configs.update(payload['sheet_configs'])
+        if 'sheet_values' in payload:
+            self.config_data = LazyConfigData(self.component_keywords)
+            for sheet, values in payload['sheet_values'].items():
+                sheet_config = self.sheet_configs[sheet]
+                sheet_config['values'] = values
+                self.config_data.add_sheet(sheet, values, sheet_config['components_map'],
+                                           sheet_config['pn_columns'])
+        else:
+            self.config_data = payload['config_data']
+        logger.debug(f"已从缓存恢复 {len(self.config_data)} 个System P/N配置")
+        
+    def _pn_sheet(self, pn):
+        """获取PN所属工作表（按需提取模式下不会触发提取）"""
+        if isinstance(self.config_data, LazyConfigData):
+            return self.config_data.sheet_of(pn)
+        return self.config_data[pn]['sheet']
+        
+    def _update_pn_index(self, file_path, sheet_names):
+        """将已分析工作表的System P/N位置写入全局索引
+        
+        Args:
+            file_path: 工作簿路径
+            sheet_names: 已分析的工作表名称列表
+        """
+        if self.pn_index is None or not file_path:
+            return
+        try:
+            self.pn_index.update_sheets(file_path, {
+                sheet_name: self.sheet_configs[sheet_name].get('pn_columns', {})
+                for sheet_name in sheet_names if self.sheet_configs.get(sheet_name)
+            })
+        except Exception as e:
+            logger.warning(f"更新System P/N索引失败: {str(e)}")
+            
+    def find_pn(self, pn):
+        """在全局索引中查找System P/N所在的工作簿、工作表和列
+        
+        Args:
+            pn: 系统PN
+        Returns:
+            list: 位置列表，未找到时返回空列表
+        """
+        if self.pn_index is None:
+            return []
+        return self.pn_index.lookup(pn)
+        
+    def clear_cache(self, file_path=None):
+        """手动清除分析缓存
+        
+        Args:
+            file_path: 工作簿路径，为None时清除全部缓存
+        """
+        if self.sheet_store is not None:
+            self.sheet_store.invalidate(file_path)
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(file_path)
+        
     def _analyze_sheet(self, sheet_name, df):
         """分析单个工作表的结构
         
@@ -130,6 +510,12 @@ class ConfigProcessor:
                 
             logger.debug(f"工作表 {sheet_name} 的标题行: {header_row}, 配置列: {config_col}")
             
+            if self.lazy_extraction:
+                return self._analyze_sheet_lazy(sheet_name, df, header_row, config_col)
+            
+            if self.use_vectorized:
+                return self._analyze_sheet_vectorized(sheet_name, df, header_row, config_col)
+            
             # 获取组件列表（第一列，从标题行后开始）
             components_map = {}
             row = header_row + 1
@@ -137,21 +523,22 @@ class ConfigProcessor:
                 component = str(df.iloc[row, 0]).strip()
                 if component:  # 只添加非空组件
                     # 尝试匹配组件名称
-                    for keyword in self.component_keywords:
-                        if keyword.lower() in component.lower():
-                            if keyword not in components_map:
-                                components_map[keyword] = []
-                            components_map[keyword].append({
-                                'name': component,
-                                'row': row
-                            })
+                    for keyword in self.taxonomy.keywords_in(component):
+                        if keyword not in components_map:
+                            components_map[keyword] = []
+                        components_map[keyword].append({
+                            'name': component,
+                            'row': row
+                        })
                 row += 1
             
             # 保存工作表配置信息
+            pn_columns = {}
             self.sheet_configs[sheet_name] = {
                 'header_row': header_row,
                 'config_col': config_col,
-                'components_map': components_map
+                'components_map': components_map,
+                'pn_columns': pn_columns
             }
             
             # 获取每个System P/N的配置
@@ -160,6 +547,7 @@ class ConfigProcessor:
                 pn = df.iloc[header_row, col]
                 if pd.notna(pn) and str(pn).strip():
                     pn = str(pn).strip()
+                    pn_columns[pn] = col
                     config = self._extract_pn_config(df, pn, col, components_map)
                     if config:
                         self.config_data[pn] = {
@@ -174,6 +562,113 @@ class ConfigProcessor:
             logger.error(f"分析工作表 {sheet_name} 时出错: {str(e)}")
             return False
             
+    def _analyze_sheet_vectorized(self, sheet_name, df, header_row, config_col):
+        """使用向量化引擎分析单个工作表
+        
+        将组件行 × PN列区域作为一个对象数组整体取出，批量生成所有PN的配置，
+        结果与逐单元格分析一致（同一工作表内重复的PN以最后一列为准）。
+        
+        Args:
+            sheet_name: 工作表名称
+            df: 工作表数据DataFrame
+            header_row: System P/N所在行
+            config_col: System P/N所在列
+        Returns:
+            bool: 分析是否成功
+        """
+        sheet_config, pn_configs = self.analyze_sheet_frame(sheet_name, df, (header_row, config_col))
+        
+        # 保存工作表配置信息
+        self.sheet_configs[sheet_name] = sheet_config
+        
+        self.config_data = {}
+        for pn, col, config in pn_configs:
+            self.config_data[pn] = {
+                'sheet': sheet_name,
+                'config': config
+            }
+        
+        logger.debug(f"工作表 {sheet_name} 向量化分析完成，共 {len(self.config_data)} 个System P/N")
+        return True
+        
+    def _analyze_sheet_lazy(self, sheet_name, df, header_row, config_col):
+        """按需提取模式分析单个工作表
+        
+        只记录标题行、配置列、组件映射和PN所在列，各PN的配置在首次访问时提取。
+        
+        Args:
+            sheet_name: 工作表名称
+            df: 工作表数据DataFrame
+            header_row: System P/N所在行
+            config_col: System P/N所在列
+        Returns:
+            bool: 分析是否成功
+        """
+        values = to_object_array(df)
+        components_map = collect_components_map(values, header_row, self.component_keywords)
+        pns, pn_cols = find_pn_columns(values, header_row, config_col)
+        pn_columns = dict(zip(pns, pn_cols.tolist()))
+        
+        self.sheet_configs[sheet_name] = {
+            'header_row': header_row,
+            'config_col': config_col,
+            'components_map': components_map,
+            'pn_columns': pn_columns,
+            'values': values
+        }
+        
+        self.config_data = LazyConfigData(self.component_keywords)
+        self.config_data.add_sheet(sheet_name, values, components_map, pn_columns)
+        
+        logger.debug(f"工作表 {sheet_name} 已记录 {len(pn_columns)} 个System P/N列，配置将按需提取")
+        return True
+        
+    def analyze_sheet_frame(self, sheet_name, df, structure=None):
+        """分析工作表数据，不修改处理器状态
+        
+        Args:
+            sheet_name: 工作表名称
+            df: 工作表数据DataFrame
+            structure: 已知的 (header_row, config_col)，为None时自动查找
+        Returns:
+            tuple: (工作表配置, [(pn, 列号, config), ...])，未找到System P/N行时返回 (None, [])
+        """
+        header_row, config_col = structure or self.analyze_sheet_structure(df)
+        if header_row == -1 or config_col == -1:
+            logger.debug(f"工作表 {sheet_name} 未找到System P/N行")
+            return None, []
+        
+        values = to_object_array(df)
+        components_map = collect_components_map(values, header_row, self.component_keywords)
+        pn_configs = extract_pn_configs(
+            values, header_row, config_col, components_map, self.component_keywords)
+        
+        sheet_config = {
+            'header_row': header_row,
+            'config_col': config_col,
+            'components_map': components_map,
+            'pn_columns': {pn: col for pn, col, config in pn_configs}
+        }
+        return sheet_config, pn_configs
+        
+    def _merge_sheet_result(self, sheet_name, sheet_config, pn_configs):
+        """合并单个工作表的分析结果，重复的System P/N保留首次出现的工作表
+        
+        Args:
+            sheet_name: 工作表名称
+            sheet_config: 工作表配置
+            pn_configs: [(pn, 列号, config), ...]
+        """
+        if sheet_config is None:
+            return
+        for pn, col, config in pn_configs:
+            if pn not in self.config_data:
+                self.config_data[pn] = {
+                    'sheet': sheet_name,
+                    'config': config
+                }
+        self.sheet_configs[sheet_name] = sheet_config
+        
     def _extract_pn_config(self, df, pn, col, components_map):
         """提取指定PN的配置信息
         
@@ -208,9 +703,14 @@ class ConfigProcessor:
             logger.error(f"提取PN配置时出错: {str(e)}")
             return None
 
+    @property
+    def taxonomy(self):
+        """当前组件关键字列表对应的共享分类器"""
+        return get_taxonomy(self.component_keywords)
+        
     def get_sheet_names(self):
         """获取所有工作表名称"""
-        if self.excel_file is None:
+        if not self.file_path:
             return []
         return list(self.sheet_data.keys())
         
@@ -291,148 +791,393 @@ class ConfigProcessor:
             return None
         
     def analyze_sheet_structure(self, df):
-        """分析工作表结构，找到关键行和列"""
-        logger.debug(f"开始分析工作表结构，形状: {df.shape}")
-        
-        # 查找System P/N所在行
-        header_row = -1
-        config_col = -1
-        
-        # 首先尝试查找完整匹配的"System P/N"
-        for i in range(min(30, len(df))):  # 扩大搜索范围到30行
-            for j in range(min(10, df.shape[1])):  # 只搜索前10列
-                cell_value = str(df.iloc[i, j]).strip()
-                logger.debug(f"检查单元格 [{i}, {j}]: {cell_value}")
-                if cell_value == 'System P/N':
-                    header_row = i
-                    config_col = j
-                    logger.debug(f"找到精确匹配的System P/N: [{i}, {j}]")
-                    break
-            if header_row != -1:
-                break
+        """分析工作表结构，找到关键行和列
         
-        # 如果没找到完整匹配，尝试模糊匹配
-        if header_row == -1:
-            for i in range(min(30, len(df))):
-                row_values = df.iloc[i].astype(str)
-                for j, value in enumerate(row_values):
-                    if 'system' in value.lower() and 'p' in value.lower() and 'n' in value.lower():
-                        header_row = i
-                        config_col = j
-                        logger.debug(f"找到模糊匹配的System P/N: [{i}, {j}]")
-                        break
-                if header_row != -1:
-                    break
+        Args:
+            df: 工作表数据DataFrame
+        Returns:
+            tuple: (header_row, config_col)，未找到时返回 (-1, -1)
+        """
+        header_row, config_col = self.header_locator.locate(df)
         
         if header_row == -1:
             logger.debug("未找到System P/N行")
             return -1, -1
-            
+        
+        logger.debug(f"找到System P/N: [{header_row}, {config_col}]")
         return header_row, config_col
         
-    def analyze_all_sheets(self):
-        """分析所有工作表"""
+    def analyze_all_sheets(self, parallel=None, max_workers=None, cancel=None):
+        """分析所有工作表
+        
+        工作簿修改后重新分析时，只重新读取内容指纹发生变化的工作表，其余工作表复用上次的分析结果。
+        
+        Args:
+            parallel: 是否使用进程池并行读取和分析，为None时使用parallel_analysis
+            max_workers: 工作进程数，为None时使用max_workers属性
+            cancel: CancelToken，取消时恢复之前的分析结果并抛出LoadCancelled
+        """
+        previous_state = (self.sheet_configs, self.config_data)
         self.sheet_configs = {}
         self.config_data = {}
         
         try:
-            for sheet_name in self.excel_file.sheet_names:
-                logger.debug(f"\n开始分析工作表: {sheet_name}")
-                
-                # 读取工作表，不使用任何转换
-                df = pd.read_excel(self.excel_file, sheet_name=sheet_name, header=None)
-                
-                # 分析工作表结构
-                header_row, config_col = self.analyze_sheet_structure(df)
-                
-                if header_row != -1:
-                    logger.debug(f"工作表 {sheet_name} 的标题行: {header_row}, 配置列: {config_col}")
-                    
-                    # 获取组件列表（第一列，从标题行后开始）
-                    components_map = {}
-                    row = header_row + 1
-                    while row < len(df) and pd.notna(df.iloc[row, 0]):
-                        component = str(df.iloc[row, 0]).strip()
-                        if component:  # 只添加非空组件
-                            # 尝试匹配组件名称
-                            for keyword in self.component_keywords:
-                                if keyword.lower() in component.lower():
-                                    # 使用实际的组件名称作为键
-                                    if keyword not in components_map:
-                                        components_map[keyword] = []
-                                    components_map[keyword].append({
-                                        'name': component,
-                                        'row': row
-                                    })
-                        row += 1
-                    
-                    logger.debug(f"找到组件映射: {components_map}")
-                    
-                    # 获取每个System P/N的配置
-                    for col in range(config_col, df.shape[1]):
-                        pn = df.iloc[header_row, col]
-                        if pd.notna(pn) and str(pn).strip():
-                            pn = str(pn).strip()
-                            logger.debug(f"\n处理System P/N: {pn}")
-                            
-                            config = {}
-                            # 按照component_keywords的顺序处理每个组件
-                            for keyword in self.component_keywords:
-                                if keyword in components_map:
-                                    # 处理所有匹配的组件
-                                    config[keyword] = []
-                                    for comp in components_map[keyword]:
-                                        row = comp['row']
-                                        spec = df.iloc[row, col]
-                                        pn_value = df.iloc[row, col + 1] if col + 1 < df.shape[1] else None
-                                        
-                                        if pd.notna(spec):
-                                            spec_str = str(spec).strip()
-                                            pn_str = str(pn_value).strip() if pd.notna(pn_value) else ''
-                                            config[keyword].append({
-                                                'name': comp['name'],
-                                                'spec': spec_str,
-                                                'pn': pn_str
-                                            })
-                                else:
-                                    config[keyword] = []
-                            
-                            if pn not in self.config_data:
-                                self.config_data[pn] = {
-                                    'sheet': sheet_name,
-                                    'config': config
-                                }
-                    
-                    # 保存工作表配置信息
-                    self.sheet_configs[sheet_name] = {
-                        'header_row': header_row,
-                        'config_col': config_col,
-                        'components_map': components_map
-                    }
+            previous = {}
+            if self.cache is not None and self.file_path:
+                payload = self.cache.get(
+                    self.file_path, ALL_SHEETS_CACHE_KEY,
+                    on_stale=lambda stale: previous.update(stale.get('sheet_results', {})))
+                if payload is not None:
+                    self._restore_analysis(payload)
+                    self._update_pn_index(self.file_path, list(self.sheet_configs.keys()))
+                    self._remember_workbook_analysis()
+                    return True
+            if not previous and self._last_sheet_results.get('file_path') == self.file_path:
+                previous = self._last_sheet_results['results']
+            
+            # 指纹未变化的工作表直接复用
+            fingerprints = sheet_fingerprints(self.file_path) if previous else {}
+            reused = {sheet_name: previous[sheet_name] for sheet_name in self.sheet_names
+                      if sheet_name in previous and fingerprints.get(sheet_name) is not None
+                      and previous[sheet_name]['fingerprint'] == fingerprints[sheet_name]}
+            pending = [sheet_name for sheet_name in self.sheet_names if sheet_name not in reused]
+            
+            parallel = self.parallel_analysis if parallel is None else parallel
+            if not pending:
+                results = {}
+            elif parallel and len(pending) > 1:
+                results = self._analyze_all_sheets_parallel(pending, max_workers or self.max_workers, cancel)
+            else:
+                results = self._analyze_all_sheets_serial(pending, cancel)
+            
+            if not fingerprints:
+                fingerprints = sheet_fingerprints(self.file_path)
+            sheet_results = {}
+            for sheet_name in self.sheet_names:
+                if sheet_name in reused:
+                    sheet_results[sheet_name] = reused[sheet_name]
                 else:
-                    logger.debug(f"工作表 {sheet_name} 未找到System P/N行")
+                    sheet_config, pn_configs, elapsed = results[sheet_name]
+                    sheet_results[sheet_name] = {
+                        'fingerprint': fingerprints.get(sheet_name),
+                        'sheet_config': sheet_config,
+                        'pn_configs': pn_configs,
+                        'elapsed': elapsed
+                    }
+                # 按工作表顺序合并，重复PN以首个工作表为准
+                result = sheet_results[sheet_name]
+                self._merge_sheet_result(sheet_name, result['sheet_config'], result['pn_configs'])
+            self._last_sheet_results = {'file_path': self.file_path, 'results': sheet_results}
+            self._record_incremental_stats(pending, reused)
             
             logger.debug(f"\n总共找到 {len(self.config_data)} 个System P/N配置")
+            
+            if self.cache is not None and self.file_path:
+                payload = self._analysis_payload(list(self.sheet_configs.keys()))
+                payload['sheet_results'] = sheet_results
+                self.cache.put(self.file_path, ALL_SHEETS_CACHE_KEY, payload)
+            self._update_pn_index(self.file_path, list(self.sheet_configs.keys()))
+            self._remember_workbook_analysis()
             return True
             
+        except LoadCancelled:
+            logger.info("分析工作表已取消，保留之前的分析结果")
+            self.sheet_configs, self.config_data = previous_state
+            raise
         except Exception as e:
             error_msg = f"分析工作表失败: {str(e)}"
             logger.error(error_msg)
             return False
             
+    def _record_incremental_stats(self, changed, reused):
+        """记录增量分析的统计信息
+        
+        Args:
+            changed: 重新分析的工作表名称列表
+            reused: {工作表名称: 复用的分析结果}
+        """
+        saved_time = sum(result.get('elapsed', 0.0) for result in reused.values())
+        self.analysis_stats['changed_sheets'] = list(changed)
+        self.analysis_stats['reused_sheets'] = list(reused.keys())
+        self.analysis_stats['saved_time'] = saved_time
+        if reused:
+            logger.info(f"工作簿增量分析: 变化的工作表 {list(changed)}，"
+                        f"复用 {len(reused)} 个未变化工作表的结果，节省约 {saved_time:.3f}s")
+            
+    def _analyze_all_sheets_parallel(self, sheet_names, max_workers=None, cancel=None):
+        """使用进程池并行读取和分析工作表
+        
+        每个工作进程只打开一次工作簿。取消时撤销尚未开始的任务，只等待正在运行的任务结束。
+        
+        Args:
+            sheet_names: 要分析的工作表名称列表
+            max_workers: 工作进程数，为None时使用CPU核数
+            cancel: CancelToken
+        Returns:
+            dict: {工作表名称: (工作表配置, PN配置列表, 耗时)}
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(sheet_names))
+        logger.info(f"使用 {workers} 个进程并行分析 {len(sheet_names)} 个工作表")
+        
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_analysis_worker,
+                                 initargs=(self.file_path,)) as executor:
+            futures = [executor.submit(_analyze_sheet_job, sheet_name, self.component_keywords)
+                       for sheet_name in sheet_names]
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                if cancel is not None and cancel.cancelled:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    cancel.check()
+            results = [future.result() for future in futures]
+        wall_time = time.perf_counter() - start
+        
+        self._record_analysis_stats('parallel', workers, wall_time,
+                                    {sheet_name: elapsed for sheet_name, _, _, elapsed in results})
+        return {sheet_name: (sheet_config, pn_configs, elapsed)
+                for sheet_name, sheet_config, pn_configs, elapsed in results}
+        
+    def _record_analysis_stats(self, mode, workers, wall_time, sheet_times):
+        """记录并输出分析耗时统计
+        
+        加速比 = 各工作表耗时之和（串行等效耗时）/ 实际总耗时。
+        """
+        serial_time = sum(sheet_times.values())
+        speedup = serial_time / wall_time if wall_time > 0 else 1.0
+        self.analysis_stats = {
+            'mode': mode,
+            'workers': workers,
+            'wall_time': wall_time,
+            'serial_time': serial_time,
+            'speedup': speedup,
+            'sheet_times': sheet_times
+        }
+        for sheet_name, elapsed in sheet_times.items():
+            share = elapsed / serial_time if serial_time > 0 else 0.0
+            logger.info(f"工作表 {sheet_name} 读取和分析耗时 {elapsed:.3f}s（占串行总耗时 {share:.0%}）")
+        logger.info(f"分析 {len(sheet_times)} 个工作表: 模式 {mode}, 进程数 {workers}, "
+                    f"总耗时 {wall_time:.3f}s, 串行等效 {serial_time:.3f}s, 加速比 {speedup:.2f}x")
+        
+    def _analyze_all_sheets_serial(self, sheet_names, cancel=None):
+        """在当前线程中逐个读取和分析工作表
+        
+        Args:
+            sheet_names: 要分析的工作表名称列表
+            cancel: CancelToken，在读取过程中和每个工作表之间检查
+        Returns:
+            dict: {工作表名称: (工作表配置, PN配置列表, 耗时)}
+        """
+        session = self._get_session(self.file_path)
+        session.excel_file  # 打开工作簿容器，不计入各工作表耗时
+        start = time.perf_counter()
+        sheet_times = {}
+        results = {}
+        for sheet_name in sheet_names:
+            sheet_config, pn_configs = None, []
+            sheet_start = time.perf_counter()
+            logger.debug(f"\n开始分析工作表: {sheet_name}")
+            
+            if cancel is not None:
+                cancel.check()
+            
+            # 读取工作表，不使用任何转换
+            df = self.read_config_sheet(session, sheet_name, cancel=cancel, header=None)
+            
+            # 分析工作表结构
+            header_row, config_col = self.analyze_sheet_structure(df)
+            
+            if header_row != -1 and self.use_vectorized:
+                logger.debug(f"工作表 {sheet_name} 的标题行: {header_row}, 配置列: {config_col}")
+                
+                sheet_config, pn_configs = self.analyze_sheet_frame(
+                    sheet_name, df, (header_row, config_col))
+            elif header_row != -1:
+                logger.debug(f"工作表 {sheet_name} 的标题行: {header_row}, 配置列: {config_col}")
+                
+                # 获取组件列表（第一列，从标题行后开始）
+                components_map = {}
+                row = header_row + 1
+                while row < len(df) and pd.notna(df.iloc[row, 0]):
+                    component = str(df.iloc[row, 0]).strip()
+                    if component:  # 只添加非空组件
+                        # 尝试匹配组件名称
+                        for keyword in self.taxonomy.keywords_in(component):
+                            # 使用实际的组件名称作为键
+                            if keyword not in components_map:
+                                components_map[keyword] = []
+                            components_map[keyword].append({
+                                'name': component,
+                                'row': row
+                            })
+                    row += 1
+                
+                logger.debug(f"找到组件映射: {components_map}")
+                
+                # 获取每个System P/N的配置
+                pn_columns = {}
+                for col in range(config_col, df.shape[1]):
+                    pn = df.iloc[header_row, col]
+                    if pd.notna(pn) and str(pn).strip():
+                        pn = str(pn).strip()
+                        pn_columns[pn] = col
+                        logger.debug(f"\n处理System P/N: {pn}")
+                        
+                        config = {}
+                        # 按照component_keywords的顺序处理每个组件
+                        for keyword in self.component_keywords:
+                            if keyword in components_map:
+                                # 处理所有匹配的组件
+                                config[keyword] = []
+                                for comp in components_map[keyword]:
+                                    row = comp['row']
+                                    spec = df.iloc[row, col]
+                                    pn_value = df.iloc[row, col + 1] if col + 1 < df.shape[1] else None
+                                    
+                                    if pd.notna(spec):
+                                        spec_str = str(spec).strip()
+                                        pn_str = str(pn_value).strip() if pd.notna(pn_value) else ''
+                                        config[keyword].append({
+                                            'name': comp['name'],
+                                            'spec': spec_str,
+                                            'pn': pn_str
+                                        })
+                            else:
+                                config[keyword] = []
+                        
+                        pn_configs.append((pn, col, config))
+                
+                # 保存工作表配置信息
+                sheet_config = {
+                    'header_row': header_row,
+                    'config_col': config_col,
+                    'components_map': components_map,
+                    'pn_columns': pn_columns
+                }
+            else:
+                logger.debug(f"工作表 {sheet_name} 未找到System P/N行")
+            
+            sheet_times[sheet_name] = time.perf_counter() - sheet_start
+            results[sheet_name] = (sheet_config, pn_configs, sheet_times[sheet_name])
+        
+        self._record_analysis_stats('serial', 1, time.perf_counter() - start, sheet_times)
+        return results
+            
+    def _remember_workbook_analysis(self):
+        """记录当前配置数据是整个工作簿的分析结果"""
+        self._workbook_analysis = (os.path.abspath(self.file_path), _file_stat(self.file_path), self.config_data)
+        self._config_data_origin = (self.file_path, ALL_SHEETS_CACHE_KEY, self._workbook_analysis[1], self.config_data)
+        
+    def analyzed_workbook_data(self, file_path):
+        """获取已完成的整个工作簿分析结果，不重新分析
+        
+        只在当前配置数据仍是analyze_all_sheets对该文件的分析结果、且文件未变化时返回。
+        返回的配置数据之后不会被处理器修改（加载其他工作表时整体替换），可以在其他线程中读取。
+        
+        Args:
+            file_path: 工作簿路径
+        Returns:
+            dict: config_data，没有可用的分析结果时返回None
+        """
+        if self._workbook_analysis is None:
+            return None
+        workbook, stat, config_data = self._workbook_analysis
+        if (config_data is not self.config_data or workbook != os.path.abspath(file_path)
+                or stat is None or stat != _file_stat(file_path)):
+            return None
+        return config_data
+        
     def get_config_data(self):
         """获取配置数据"""
         return self.config_data
         
+    def get_config_table(self, build=True):
+        """获取当前配置数据的Arrow列式表
+        
+        当前配置数据来自有分析缓存的工作表或工作簿时，表保存在缓存条目旁的Arrow IPC文件中，
+        文件未变化时直接内存映射该文件，不再由配置数据构建。加载其他工作表或重新分析后自动切换。
+        
+        Args:
+            build: 没有已构建或已保存的表时是否构建，为False时返回None
+        Returns:
+            ConfigArrowTable: 未安装pyarrow、没有配置数据或不构建时返回None
+        """
+        if not ARROW_AVAILABLE or not self.config_data:
+            return None
+        if self._config_table is not None and self._config_table_source is self.config_data:
+            return self._config_table
+        
+        path = self._config_table_path()
+        table = None
+        if path is not None and os.path.exists(path):
+            try:
+                table = ConfigArrowTable.load(path)
+                logger.debug(f"已内存映射配置列式表: {path}")
+            except Exception as e:
+                logger.warning(f"加载配置列式表失败，重新构建: {str(e)}")
+        if table is None:
+            if not build:
+                return None
+            start = time.perf_counter()
+            table = ConfigArrowTable.from_config_data(self.config_data, self.component_keywords)
+            logger.debug(f"构建配置列式表: {len(table)} 个System P/N，"
+                         f"{table.num_rows} 行，{table.nbytes} 字节，"
+                         f"耗时 {time.perf_counter() - start:.3f}s")
+            if path is not None:
+                self._save_config_table(table, path)
+        self._config_table = table
+        self._config_table_source = self.config_data
+        return table
+        
+    def _config_table_suffix(self):
+        """列式表文件后缀，包含组件关键字的哈希（关键字不同时组件分类不同）"""
+        digest = hashlib.sha1('\0'.join(self.component_keywords).encode('utf-8')).hexdigest()
+        return f".{digest[:8]}.arrow"
+        
+    def _config_table_path(self):
+        """获取当前配置数据的列式表文件路径，没有对应的分析缓存条目时返回None"""
+        origin = self._config_data_origin
+        if self.cache is None or origin is None or origin[3] is not self.config_data or origin[2] is None:
+            return None
+        file_path, sheet_key, stat, _ = origin
+        return self.cache.attachment_path(file_path, sheet_key, self._config_table_suffix(), stat)
+        
+    def _save_config_table(self, table, path):
+        """将列式表保存到分析缓存条目旁（先写临时文件再替换）
+        
+        Args:
+            table: ConfigArrowTable
+            path: _config_table_path返回的路径
+        """
+        file_path, sheet_key, stat, _ = self._config_data_origin
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+            os.close(fd)
+            table.save(tmp_path)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            if not self.cache.attach(file_path, sheet_key, self._config_table_suffix(), stat):
+                os.remove(path)
+        except Exception as e:
+            logger.warning(f"保存配置列式表失败: {str(e)}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        
     def get_sheet_configs(self):
         """获取工作表配置"""
         return self.sheet_configs
         
     def get_pn_list(self, sheet_name):
         """获取指定工作表的系统P/N列表"""
-        if not self.excel_file or sheet_name not in self.sheet_configs:
+        if not self.file_path or sheet_name not in self.sheet_configs:
             # 如果工作表结构未分析，先分析
-            if self.excel_file and sheet_name in self.excel_file.sheet_names:
+            if self.file_path and sheet_name in self.sheet_names:
                 self.analyze_all_sheets()
                 
             # 仍不存在则返回空列表
@@ -442,8 +1187,8 @@ class ConfigProcessor:
         
         pn_list = []
         # 从配置数据中筛选出属于该工作表的系统P/N
-        for pn, data in self.config_data.items():
-            if data['sheet'] == sheet_name:
+        for pn in self.config_data:
+            if self._pn_sheet(pn) == sheet_name:
                 pn_list.append(pn)
         
         return pn_list
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+紧凑配置记录模块
+
+这个模块提供配置数据中组件条目的紧凑表示，包括：
+- 使用 __slots__ 的组件记录，不为每条记录分配字典
+- 组件名称、规格和料号字符串驻留，不同PN之间共享同一个字符串对象
+- 与 {'name', 'spec', 'pn'} 字典兼容的只读映射接口
+"""
+
+import sys
+from collections.abc import Mapping
+
+# 记录字段，顺序与原字典的键顺序一致
+RECORD_FIELDS = ('name', 'spec', 'pn')
+
+
+def intern_str(value):
+    """驻留字符串，非字符串原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class ComponentRecord(Mapping):
+    """组件记录类
+
+    行为与 {'name': 名称, 'spec': 规格, 'pn': 料号} 字典一致，
+    支持 record['spec']、record.get('pn', '')、dict(record) 以及与字典比较相等。
+    """
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, name, spec, pn):
+        """初始化组件记录
+
+        Args:
+            name: 组件名称
+            spec: 规格
+            pn: 料号
+        """
+        self.name = intern_str(name)
+        self.spec = intern_str(spec)
+        self.pn = intern_str(pn)
+
+    def __getitem__(self, key):
+        if key in RECORD_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(RECORD_FIELDS)
+
+    def __len__(self):
+        return len(RECORD_FIELDS)
+
+    def __contains__(self, key):
+        return key in RECORD_FIELDS
+
+    def __reduce__(self):
+        # 反序列化时重新驻留字符串
+        return (ComponentRecord, (self.name, self.spec, self.pn))
+
+    def to_dict(self):
+        """转换为普通字典"""
+        return {'name': self.name, 'spec': self.spec, 'pn': self.pn}
+
+    def __repr__(self):
+        return f"ComponentRecord(name={self.name!r}, spec={self.spec!r}, pn={self.pn!r})"
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Arrow列式配置表模块
+
+这个模块把已分析的配置数据保存为一张Arrow表，包括：
+- 每个 (System P/N, 组件) 一行，列为 pn、component_type、name、spec、part_pn，字符串均为字典编码
+- 同一PN的行连续存放，按PN取配置是零拷贝切片
+- 在字典上匹配条件后按索引过滤，快速查询“使用某个CPU的所有PN”等
+- 保存为Arrow IPC文件，加载时内存映射，不复制数据
+
+依赖可选的pyarrow，未安装时ARROW_AVAILABLE为False。
+"""
+
+import json
+import logging
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+from processors.sheet_analyzer import LazyConfigData, extract_config_columns
+
+logger = logging.getLogger(__name__)
+
+# 是否可以使用Arrow列式表
+ARROW_AVAILABLE = pa is not None
+
+# 表的列
+TABLE_COLUMNS = ('pn', 'component_type', 'name', 'spec', 'part_pn')
+
+# 保存PN列表和每个PN行数的schema元数据键
+_METADATA_KEY = b'autoconfig.pns'
+
+# 配置详情DataFrame的列名，与ConfigProcessor.get_config_details一致
+DETAIL_COLUMNS = {
+    'component_type': 'Component',
+    'name': 'Name',
+    'spec': 'Specification',
+    'part_pn': 'P/N'
+}
+
+
+class ConfigArrowTable:
+    """Arrow列式配置表类（界面中的配置表控件是ui.config_table.ConfigTable）"""
+
+    def __init__(self, table, pns, counts):
+        """初始化配置表
+
+        Args:
+            table: pyarrow.Table，同一PN的行连续存放
+            pns: 按表中顺序排列的PN列表（包括没有组件的PN）
+            counts: 每个PN的行数
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("Arrow列式配置表需要安装pyarrow")
+        self.table = table
+        self.pns = list(pns)
+        counts = np.asarray(counts, dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(counts) else counts
+        self._offsets = dict(zip(self.pns, zip(starts.tolist(), counts.tolist())))
+
+    @classmethod
+    def from_columns(cls, columns, pns, counts):
+        """由按PN顺序排列的列数组创建配置表
+
+        Args:
+            columns: {列名: 对象数组}
+            pns: PN列表
+            counts: 每个PN的行数
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("Arrow列式配置表需要安装pyarrow")
+        arrays = [pa.array(columns[name], type=pa.string()).dictionary_encode() for name in TABLE_COLUMNS]
+        return cls(pa.Table.from_arrays(arrays, names=list(TABLE_COLUMNS)), pns, counts)
+
+    @classmethod
+    def from_config_data(cls, config_data, component_keywords):
+        """由配置数据创建配置表
+
+        按需提取的配置数据直接从工作表数组批量生成列，不逐个提取PN的配置。
+
+        Args:
+            config_data: {pn: {'sheet', 'config'}} 或 LazyConfigData
+            component_keywords: 组件关键字列表
+        """
+        if isinstance(config_data, LazyConfigData):
+            parts = [extract_config_columns(values, pn_columns, components_map, component_keywords)
+                     + (list(pn_columns),)
+                     for sheet_name, values, components_map, pn_columns in config_data.sheet_columns()]
+            columns = {name: np.concatenate([part[0][name] for part in parts]) if parts
+                       else np.empty(0, dtype=object) for name in TABLE_COLUMNS}
+            counts = np.concatenate([part[1] for part in parts]) if parts else []
+            pns = [pn for part in parts for pn in part[2]]
+            return cls.from_columns(columns, pns, counts)
+
+        columns = {name: [] for name in TABLE_COLUMNS}
+        pns = []
+        counts = []
+        for pn, item in config_data.items():
+            count = 0
+            for component_type, components in item['config'].items():
+                for component in components:
+                    columns['pn'].append(pn)
+                    columns['component_type'].append(component_type)
+                    columns['name'].append(str(component.get('name', '')))
+                    columns['spec'].append(str(component.get('spec', '')))
+                    columns['part_pn'].append(str(component.get('pn', '')))
+                    count += 1
+            pns.append(pn)
+            counts.append(count)
+        return cls.from_columns(columns, pns, counts)
+
+    def save(self, path):
+        """保存为未压缩的Arrow IPC文件，加载时可以内存映射
+
+        Args:
+            path: 文件路径
+        """
+        metadata = {_METADATA_KEY: json.dumps({
+            'pns': self.pns,
+            'counts': [self._offsets[pn][1] for pn in self.pns]
+        }, ensure_ascii=False).encode('utf-8')}
+        table = self.table.replace_schema_metadata(metadata)
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        logger.debug(f"已保存配置表: {path}，{len(self.pns)} 个System P/N，{self.num_rows} 行")
+
+    @classmethod
+    def load(cls, path, memory_map=True):
+        """加载Arrow IPC文件
+
+        Args:
+            path: 文件路径
+            memory_map: 是否内存映射（数据不复制到内存，按需从文件页读取）
+
+        Returns:
+            ConfigArrowTable: 配置表
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("Arrow列式配置表需要安装pyarrow")
+        source = pa.memory_map(path, 'r') if memory_map else pa.OSFile(path, 'rb')
+        table = pa.ipc.open_file(source).read_all()
+        metadata = json.loads(table.schema.metadata[_METADATA_KEY].decode('utf-8'))
+        return cls(table.replace_schema_metadata(None), metadata['pns'], metadata['counts'])
+
+    def __len__(self):
+        return len(self.pns)
+
+    def __contains__(self, pn):
+        return pn in self._offsets
+
+    @property
+    def num_rows(self):
+        """表的行数"""
+        return self.table.num_rows
+
+    @property
+    def nbytes(self):
+        """表占用的内存（字节）"""
+        return self.table.nbytes
+
+    def pn_slice(self, pn):
+        """获取PN的所有行（零拷贝切片）
+
+        Args:
+            pn: 系统PN
+
+        Returns:
+            pyarrow.Table: PN不存在时返回None
+        """
+        offset = self._offsets.get(pn)
+        if offset is None:
+            return None
+        return self.table.slice(*offset)
+
+    def details(self, pn):
+        """获取PN的配置详情
+
+        Args:
+            pn: 系统PN
+
+        Returns:
+            pandas.DataFrame: 与ConfigProcessor.get_config_details格式相同，PN不存在或没有组件时返回None
+        """
+        rows = self.pn_slice(pn)
+        if rows is None or rows.num_rows == 0:
+            return None
+        data = {label: rows.column(name).to_pylist() for name, label in DETAIL_COLUMNS.items()}
+        return pd.DataFrame(data)
+
+    def _match(self, name, value, contains):
+        """在字典编码的列上匹配条件，返回行掩码"""
+        column = self.table.column(name).combine_chunks()
+        dictionary = column.dictionary
+        if contains:
+            matched = pc.match_substring(dictionary, value, ignore_case=True)
+        else:
+            matched = pc.equal(dictionary, value)
+        codes = pc.indices_nonzero(matched)
+        return pc.is_in(column.indices, value_set=codes)
+
+    def filter(self, component_type=None, name=None, spec=None, part_pn=None, contains=False):
+        """按条件过滤行
+
+        每个条件先在列的字典中匹配，再按字典索引过滤行，字符串只比较一次。
+
+        Args:
+            component_type: 组件类型，如 CPU
+            name: 组件名称
+            spec: 规格
+            part_pn: 料号
+            contains: 为True时按不区分大小写的子串匹配，否则精确匹配
+
+        Returns:
+            pyarrow.Table: 满足所有条件的行
+        """
+        criteria = {'component_type': component_type, 'name': name, 'spec': spec, 'part_pn': part_pn}
+        mask = None
+        for column, value in criteria.items():
+            if value is None:
+                continue
+            matched = self._match(column, value, contains)
+            mask = matched if mask is None else pc.and_(mask, matched)
+        return self.table if mask is None else self.table.filter(mask)
+
+    def pns_using(self, component_type=None, name=None, spec=None, part_pn=None, contains=False):
+        """查找满足条件的PN，如使用某个CPU的所有PN
+
+        Args:
+            参数同filter
+
+        Returns:
+            list: 按表中顺序排列的PN列表（不重复）
+        """
+        rows = self.filter(component_type, name, spec, part_pn, contains)
+        column = rows.column('pn').combine_chunks()
+        return column.dictionary.take(pc.unique(column.indices)).to_pylist()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MOD文件生成模块
+
+这个模块不依赖Qt，按System P/N的配置生成 <PN>.TXT 文件，包括：
+- 从OS.INI读取OS MOD选项的参数值
+- Bypass WHQL时追加5P226
+- 默认内容与界面写入MOD.TXT的相同：OS MOD参数值（OS MOD ADD按原样追加，重复值保留），
+  Bypass WHQL时再加上5P226（界面不重复添加）
+- include_components为True时（命令行 --include-components）在前面加上按组件关键字顺序
+  收集的配置中的组件料号，这不是界面的行为
+- 使用进程池批量写入MOD文件
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.ini_reader import INIReader
+
+logger = logging.getLogger(__name__)
+
+# Bypass WHQL对应的MOD
+WHQL_BYPASS_MOD = "5P226"
+
+# 项目根目录
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 默认的OS.INI路径（相对于项目根目录，不受当前目录影响）
+DEFAULT_OS_INI = os.path.join(PROJECT_ROOT, 'config', 'OS.INI')
+
+# 每个任务处理的P/N数量
+CHUNK_SIZE = 64
+
+# 不能出现在文件名中的字符
+INVALID_FILE_CHARS = set('\\/:*?"<>|')
+
+
+def read_os_mod_values(option, ini_path=DEFAULT_OS_INI):
+    """读取OS MOD选项的参数值（与OS MOD ADD按钮写入MOD.TXT的值相同）
+
+    Args:
+        option: OS.INI中的节名称，如 WIN11-ENG-HOME
+        ini_path: OS.INI路径
+
+    Returns:
+        list: 参数值列表
+    """
+    reader = INIReader()
+    if not reader.load_file(ini_path):
+        raise FileNotFoundError(f"OS.INI文件不存在: {ini_path}")
+    if option not in reader.get_sections():
+        raise ValueError(f"OS.INI中没有选项: {option}，可用选项: {reader.get_sections()}")
+    return [value for value in reader.get_section_options(option).values() if value]
+
+
+def build_mod_lines(config, component_keywords, os_values=None, bypass_whql=False,
+                    include_components=False):
+    """生成一个System P/N的MOD文件内容
+
+    默认与界面写入MOD.TXT的内容相同：OS MOD参数值按原样写入（重复值保留），
+    Bypass WHQL时追加5P226（已有时不重复添加）。
+
+    Args:
+        config: {关键字: [{'name', 'spec', 'pn'}, ...]}
+        component_keywords: 组件关键字顺序
+        os_values: OS MOD参数值列表
+        bypass_whql: 是否追加5P226
+        include_components: 是否在前面加上配置中的组件料号（界面不写入组件料号）
+
+    Returns:
+        list: MOD行列表
+    """
+    lines = []
+    if include_components:
+        for keyword in component_keywords:
+            for component in config.get(keyword, ()):
+                part = component.get('pn', '')
+                if part:
+                    lines.append(part)
+    lines.extend(os_values or [])
+    if bypass_whql and WHQL_BYPASS_MOD not in lines:
+        lines.append(WHQL_BYPASS_MOD)
+    return lines
+
+
+def is_valid_pn_file_name(pn):
+    """System P/N能否直接作为文件名（如表头文字 System P/N 不能）"""
+    return bool(pn) and not INVALID_FILE_CHARS.intersection(pn)
+
+
+def write_mod_file(output_dir, pn, lines, overwrite=False):
+    """写入 <PN>.TXT 文件
+
+    Args:
+        output_dir: 输出目录
+        pn: System P/N
+        lines: MOD行列表
+        overwrite: 文件已存在时是否覆盖
+
+    Returns:
+        bool: 是否已写入（文件已存在且不覆盖时返回False）
+    """
+    output_path = os.path.join(output_dir, f"{pn}.TXT")
+    if not overwrite and os.path.exists(output_path):
+        logger.info(f"文件已存在，跳过: {output_path}")
+        return False
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for line in lines:
+            f.write(f"{line}\n")
+    return True
+
+
+def _generate_chunk_job(items, component_keywords, os_values, bypass_whql, output_dir, overwrite,
+                        include_components=False):
+    """工作进程中生成一批MOD文件
+
+    Returns:
+        tuple: (已写入数量, 已存在跳过数量, 无效P/N数量)
+    """
+    written = skipped = invalid = 0
+    for pn, config in items:
+        if not is_valid_pn_file_name(pn):
+            logger.warning(f"System P/N不能作为文件名，跳过: {pn}")
+            invalid += 1
+            continue
+        lines = build_mod_lines(config, component_keywords, os_values, bypass_whql, include_components)
+        if write_mod_file(output_dir, pn, lines, overwrite):
+            written += 1
+        else:
+            skipped += 1
+    return written, skipped, invalid
+
+
+def generate_mod_files(config_data, component_keywords, output_dir, os_values=None,
+                       bypass_whql=False, overwrite=False, max_workers=None, include_components=False):
+    """为config_data中的每个System P/N生成MOD文件
+
+    Args:
+        config_data: {pn: {'sheet': 工作表, 'config': 配置}}
+        component_keywords: 组件关键字顺序
+        output_dir: 输出目录
+        os_values: OS MOD参数值列表
+        bypass_whql: 是否追加5P226
+        overwrite: 文件已存在时是否覆盖
+        max_workers: 工作进程数，为1时在当前进程中生成
+        include_components: 是否写入配置中的组件料号，见build_mod_lines
+
+    Returns:
+        dict: 包含written、skipped、invalid、workers、elapsed、pns_per_second的统计信息
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    items = [(pn, item['config']) for pn, item in config_data.items()]
+    chunks = [items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
+    args = (component_keywords, os_values, bypass_whql, output_dir, overwrite, include_components)
+
+    start = time.perf_counter()
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_generate_chunk_job, chunk, *args) for chunk in chunks]
+            results = [future.result() for future in futures]
+    else:
+        results = [_generate_chunk_job(chunk, *args) for chunk in chunks]
+    elapsed = time.perf_counter() - start
+
+    written = sum(result[0] for result in results)
+    skipped = sum(result[1] for result in results)
+    invalid = sum(result[2] for result in results)
+    stats = {
+        'written': written,
+        'skipped': skipped,
+        'invalid': invalid,
+        'workers': max(workers, 1),
+        'elapsed': elapsed,
+        'pns_per_second': len(items) / elapsed if elapsed > 0 else 0.0
+    }
+    logger.info(f"生成 {written} 个MOD文件（跳过 {skipped + invalid} 个），进程数 {stats['workers']}，"
+                f"耗时 {elapsed:.3f}s，{stats['pns_per_second']:.1f} PN/s")
+    return stats
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+PHBOM常驻索引模块
+
+这个模块不依赖Qt，把处理后的PHBOM.CSV加载到内存并为Number列建立索引，包括：
+- 按与Check相同的规则确定Number列
+- 优先内存映射PHBOM.CSV旁边的列式副本，只解码Number列；没有可用的副本时解析CSV并保存副本
+- 各列为NumPy数组或内存映射的列，按行号取出匹配行不经过数据帧索引
+- Number精确查找（不区分大小写，忽略首尾空白）为一次哈希查找
+- Number部分查找（不区分大小写，按字面匹配）使用三元组索引
+- Check的查找返回所有包含输入内容的行，并合并精确查找的结果
+- 记录文件的大小和修改时间，文件变化后由调用方重新建立
+"""
+
+import os
+import time
+import logging
+import numpy as np
+import pandas as pd
+
+from processors.trigram_index import TrigramIndex
+from processors.phbom_sidecar import load_sidecar, write_sidecar
+from utils.encoding_sniffer import read_with_detected_encoding
+
+logger = logging.getLogger(__name__)
+
+# 可能的Number列名，按优先顺序
+NUMBER_COLUMNS = ['Number', 'number', 'Part Number', 'PN', 'P/N', '料号', '零件号']
+
+
+def _file_stat(file_path):
+    try:
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+    except OSError:
+        return None
+
+
+class PHBOMIndex:
+    """PHBOM数据及Number索引类"""
+
+    def __init__(self, arrays, numbers, number_col, file_path=None, stat=None):
+        """初始化索引
+
+        Args:
+            arrays: {列名: 列}，按列顺序，列为对象数组或StringColumn（都支持按位置数组取值）
+            numbers: Number列的文本，缺失值为'nan'（与原Check的astype(str)相同）
+            number_col: Number列名
+            file_path: 数据来源文件路径
+            stat: 建立索引时文件的 (大小, 修改时间)
+        """
+        self.columns = list(arrays)
+        self.arrays = arrays
+        self.number_col = number_col
+        self.file_path = file_path
+        self.stat = stat
+
+        self.numbers = np.empty(len(numbers), dtype=object)
+        self.numbers[:] = numbers
+        # 查找键：去掉首尾空白后转为小写
+        keys = pd.Series(self.numbers).str.strip().str.lower().to_numpy(dtype=object)
+        codes, uniques = pd.factorize(keys)
+        # 同一键的行号连续存放在 _positions[_starts[code]:_starts[code + 1]]
+        self._positions = np.argsort(codes, kind='stable')
+        self._starts = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(uniques)))))
+        self._key_index = pd.Index(uniques, dtype=object)
+        # 立即建立哈希表，避免第一次查找时才建立
+        '' in self._key_index
+        # 部分查找使用的三元组索引
+        self.trigrams = TrigramIndex(self.numbers)
+
+    @classmethod
+    def from_csv(cls, file_path):
+        """读取PHBOM.CSV并建立索引
+
+        列式副本与CSV一致时内存映射副本，否则解析CSV并保存副本供下次使用。
+
+        Args:
+            file_path: PHBOM.CSV路径
+
+        Returns:
+            PHBOMIndex: 索引对象
+
+        Raises:
+            ValueError: 文件中没有Number列
+        """
+        start = time.perf_counter()
+        stat = _file_stat(file_path)
+        sidecar = load_sidecar(file_path)
+        if sidecar is not None:
+            columns, arrays, rows = sidecar
+            number_col = next((col for col in NUMBER_COLUMNS if col in columns), None)
+            if number_col is None:
+                raise ValueError("PHBOM.CSV文件中未找到Number列")
+            numbers = arrays[number_col].to_list(missing='nan')
+            source = "列式副本"
+        else:
+            # 按文本读取，显示的内容与文件一致
+            data = read_with_detected_encoding(
+                file_path, lambda encoding: pd.read_csv(file_path, encoding=encoding, dtype=str))
+            number_col = next((col for col in NUMBER_COLUMNS if col in data.columns), None)
+            if number_col is None:
+                raise ValueError("PHBOM.CSV文件中未找到Number列")
+            arrays = {col: data[col].to_numpy(dtype=object) for col in data.columns}
+            numbers = [str(value) for value in arrays[number_col]]
+            source = "CSV"
+            try:
+                write_sidecar(file_path, data)
+            except Exception as e:
+                logger.warning(f"保存PHBOM列式副本失败: {str(e)}")
+
+        index = cls(arrays, numbers, number_col, os.path.abspath(file_path), stat)
+        logger.info(f"已建立PHBOM索引（{source}）: {len(index)} 行，{len(index._key_index)} 个Number，"
+                    f"耗时 {time.perf_counter() - start:.3f}s")
+        return index
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def is_stale(self):
+        """来源文件是否已变化（或已删除）"""
+        return self.file_path is not None and _file_stat(self.file_path) != self.stat
+
+    def lookup(self, number):
+        """精确查找Number
+
+        Args:
+            number: 要查找的Number（不区分大小写）
+
+        Returns:
+            numpy.ndarray: 匹配行的位置（按文件顺序），没有匹配时为空数组
+        """
+        key = str(number).strip().lower()
+        try:
+            code = self._key_index.get_loc(key)
+        except KeyError:
+            return np.empty(0, dtype=np.intp)
+        return self._positions[self._starts[code]:self._starts[code + 1]]
+
+    def contains(self, value):
+        """查找Number中包含value的行（不区分大小写，value按字面匹配，不是正则表达式）
+
+        Args:
+            value: 要查找的内容
+
+        Returns:
+            numpy.ndarray: 匹配行的位置（按文件顺序）
+        """
+        return self.trigrams.search(value)
+
+    def search(self, value):
+        """查找Number中包含value的所有行（与原Check相同，如输入ABC123时也列出ABC123-R1）
+
+        精确查找的结果（忽略首尾空白）合并到部分查找的结果中，按文件顺序排列。
+
+        Args:
+            value: 用户输入的Number
+
+        Returns:
+            pandas.DataFrame: 匹配的行
+        """
+        positions = self.contains(value)
+        exact = self.lookup(value)
+        if len(exact):
+            positions = np.union1d(positions, exact)
+        return self.rows(positions)
+
+    def rows(self, positions):
+        """按位置取出行
+
+        Args:
+            positions: 行的位置数组
+
+        Returns:
+            pandas.DataFrame: 以行的位置为索引的数据帧
+        """
+        return pd.DataFrame({col: self.arrays[col][positions] for col in self.columns},
+                            index=positions, columns=self.columns)
@@ -8,6 +8,8 @@ PHBOM处理器模块
 - 读取CSV文件
 - 解析PHBOM信息
 - 提取所需数据
+- 大文件按固定行数分块流式处理，只读取需要的列，逐块写入PHBOM.CSV
+- 在PHBOM.CSV旁边保存列式二进制副本，供查找时内存映射读取
 """
 
 import sys
@@ -22,9 +24,20 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 from utils.csv_reader import CSVReader
+from utils.encoding_sniffer import read_with_detected_encoding
+from processors.phbom_sidecar import SidecarWriter, write_sidecar
 
 logger = logging.getLogger(__name__)
 
+# 超过该大小（字节）的文件使用流式处理
+STREAMING_THRESHOLD = 32 * 1024 * 1024
+
+# 流式处理每块的行数
+DEFAULT_CHUNK_SIZE = 100000
+
+# 保留的列名关键字（与process_file中过滤列的规则相同）
+NEEDED_COLUMN_KEYWORDS = ['level', 'number', 'p/n', 'description', 'notes']
+
 class PHBOMProcessor:
     """PHBOM文件处理器类"""
     
@@ -43,6 +56,15 @@ class PHBOMProcessor:
         
         self.output_filename = 'PHBOM.CSV'
         
+        # 是否流式处理：None表示按文件大小自动选择
+        self.streaming = None
+        
+        # 流式处理每块的行数
+        self.chunk_size = DEFAULT_CHUNK_SIZE
+        
+        # 是否保存列式二进制副本
+        self.save_sidecar = True
+        
     def validate_columns(self, df):
         """验证数据帧是否包含所需的列
         
@@ -63,14 +85,13 @@ class PHBOMProcessor:
         return True
         
     def read_csv_file(self, file_path):
-        """读取CSV文件，自动处理编码"""
-        try:
-            # 首先尝试UTF-8编码
-            df = pd.read_csv(file_path, encoding='utf-8')
-        except UnicodeDecodeError:
-            # 如果失败，尝试GBK编码
-            df = pd.read_csv(file_path, encoding='gbk')
-        return df
+        """读取CSV文件，编码由样本检测一次确定
+        
+        所有列按文本读取（与流式处理相同），保持单元格原文，如 00123 不会变为 123、
+        有空单元格的Level列不会变为 1.0。
+        """
+        return read_with_detected_encoding(
+            file_path, lambda encoding: pd.read_csv(file_path, encoding=encoding, dtype=str))
         
     def extract_columns(self, df):
         """提取数据中需要的列
@@ -144,6 +165,9 @@ class PHBOMProcessor:
             # 读取文件
             logger.info(f"开始处理PHBOM文件: {file_path}")
             
+            if self._use_streaming(file_path):
+                return self.process_file_streaming(file_path)
+            
             # 使用pandas高效读取
             df = self.read_csv_file(file_path)
             if df is None or df.empty:
@@ -168,7 +192,7 @@ class PHBOMProcessor:
             
             # 优化：只保留需要的列，减少内存使用
             needed_columns = [col for col in df.columns if any(
-                keyword in col.lower() for keyword in ['level', 'number', 'p/n', 'description', 'notes']
+                keyword in col.lower() for keyword in NEEDED_COLUMN_KEYWORDS
             )]
             
             if needed_columns:
@@ -200,4 +224,142 @@ class PHBOMProcessor:
         output_file = self.save_to_csv(extracted_df)
         logger.info(f"数据已保存到: {output_file}")
         
-        return output_file 
\ No newline at end of file
+        # 保存列式副本，副本保存失败不影响PHBOM.CSV
+        if self.save_sidecar:
+            try:
+                write_sidecar(output_file, extracted_df)
+            except Exception as e:
+                logger.warning(f"保存PHBOM列式副本失败: {str(e)}")
+        
+        return output_file
+
+    def _use_streaming(self, file_path):
+        """是否对文件使用流式处理"""
+        if self.streaming is not None:
+            return self.streaming
+        try:
+            return os.path.getsize(file_path) > STREAMING_THRESHOLD
+        except OSError:
+            return False
+
+    def _resolve_source_columns(self, columns):
+        """根据表头确定每个必需列对应的源列
+        
+        规则与非流式处理相同：先按关键字保留列（没有匹配时保留全部列），
+        再在保留的列中查找原始列名或替代列名。
+        
+        Args:
+            columns: 表头列名列表
+            
+        Returns:
+            dict: {必需列: 源列名}，找不到时为None
+        """
+        kept = [col for col in columns if any(keyword in col.lower() for keyword in NEEDED_COLUMN_KEYWORDS)]
+        if not kept:
+            kept = list(columns)
+        
+        sources = {}
+        for required_col in self.required_columns:
+            if required_col in kept:
+                sources[required_col] = required_col
+                continue
+            sources[required_col] = next(
+                (alt_col for alt_col in self.column_mappings.get(required_col, []) if alt_col in kept), None)
+            if sources[required_col] is None:
+                logger.warning(f"未找到列 '{required_col}' 的替代列，创建空列")
+            elif sources[required_col] != required_col:
+                logger.info(f"找到替代列名: {sources[required_col]} -> {required_col}")
+        return sources
+
+    def process_file_streaming(self, file_path):
+        """流式处理PHBOM文件
+        
+        先只读取表头确定需要的列，再按chunk_size行分块读取这些列并逐块写入输出文件，
+        内存占用取决于块大小而不是文件大小。
+        
+        Args:
+            file_path: CSV文件路径
+            
+        Returns:
+            tuple: (成功标志, 结果信息)，与process_file相同
+        """
+        try:
+            # 编码由样本检测确定，样本之外出现非UTF-8内容时才重新读取（输出文件会重新写入）
+            return read_with_detected_encoding(file_path, lambda encoding: self._stream_file(file_path, encoding))
+        except Exception as e:
+            logger.error(f"流式处理PHBOM文件时出错: {str(e)}")
+            return False, f"处理PHBOM文件时出错: {str(e)}"
+
+    def _stream_file(self, file_path, encoding):
+        """使用指定编码流式处理文件"""
+        header = list(pd.read_csv(file_path, encoding=encoding, nrows=0).columns)
+        logger.info(f"CSV文件包含以下列: {header}")
+        
+        # 检查是否至少有一列包含'Number'或'P/N'关键字
+        if not any(col for col in header if 'number' in col.lower() or 'p/n' in col.lower()):
+            logger.warning("CSV文件缺少Part Number列")
+            return False, "CSV文件格式不正确，缺少Part Number列"
+        
+        # 验证列
+        if not self.validate_columns(pd.DataFrame(columns=header)):
+            return False, "文件格式不正确，缺少必要的列"
+        
+        sources = self._resolve_source_columns(header)
+        usecols = sorted({header.index(col) for col in sources.values() if col is not None})
+        logger.info(f"流式处理，读取以下列: {[header[i] for i in usecols]}，每块 {self.chunk_size} 行")
+        
+        # 所有列按文本读取，保持单元格原文，各块的格式不受类型推断影响
+        reader = pd.read_csv(file_path, encoding=encoding, usecols=usecols, dtype=str,
+                             chunksize=self.chunk_size)
+        temp_file = f"{self.output_filename}.tmp"
+        rows = 0
+        sidecar = None
+        if self.save_sidecar:
+            try:
+                sidecar = SidecarWriter(self.output_filename, self.required_columns)
+            except Exception as e:
+                logger.warning(f"保存PHBOM列式副本失败: {str(e)}")
+        try:
+            with reader, open(temp_file, 'w', encoding='utf-8', newline='') as f:
+                for chunk in reader:
+                    extracted_df = pd.DataFrame(index=chunk.index)
+                    for required_col, source_col in sources.items():
+                        if source_col is None:
+                            extracted_df[required_col] = None
+                        elif 'number' in source_col.lower() or 'p/n' in source_col.lower():
+                            extracted_df[required_col] = chunk[source_col].astype(str)
+                        else:
+                            extracted_df[required_col] = chunk[source_col]
+                    extracted_df.to_csv(f, header=rows == 0, index=False)
+                    rows += len(chunk)
+                    if sidecar is not None:
+                        try:
+                            sidecar.append(extracted_df)
+                        except Exception as e:
+                            logger.warning(f"保存PHBOM列式副本失败: {str(e)}")
+                            sidecar.abort()
+                            sidecar = None
+            
+            if rows == 0:
+                os.remove(temp_file)
+                if sidecar is not None:
+                    sidecar.abort()
+                return False, "文件为空或格式不正确"
+            os.replace(temp_file, self.output_filename)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            if sidecar is not None:
+                sidecar.abort()
+            raise
+        
+        # CSV写完后写入副本的元数据，记录CSV的大小和修改时间
+        if sidecar is not None:
+            try:
+                sidecar.commit()
+            except Exception as e:
+                logger.warning(f"保存PHBOM列式副本失败: {str(e)}")
+                sidecar.abort()
+        
+        logger.info(f"数据已保存到: {self.output_filename}，共 {rows} 行")
+        return True, self.output_filename 
\ No newline at end of file
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+PHBOM列式二进制副本模块
+
+这个模块在PHBOM.CSV旁边保存同一数据的列式二进制副本（PHBOM.CSV.cols目录），包括：
+- 每列保存为三个原始数组文件：UTF-8字节、每行的起始偏移（int64）、是否有值（uint8）
+- 值与用 pd.read_csv(dtype=str) 读回PHBOM.CSV得到的值相同（空单元格及NA文本为缺失值）
+- 写入时可以逐块追加，流式处理时内存占用取决于块大小
+- meta.json记录列名、行数、数组文件名及PHBOM.CSV的大小和修改时间，CSV变化后副本失效
+- 读取时内存映射数组文件，只解码需要的行，不解析文本
+- 每次写入使用新的文件名，已被映射的旧文件不会被覆盖（Windows不允许覆盖已映射的文件）
+
+PHBOM.CSV仍然保留，供人工查看。
+"""
+
+import os
+import json
+import time
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 副本格式版本
+SIDECAR_VERSION = 1
+
+# 元数据文件名
+META_FILENAME = 'meta.json'
+
+# pd.read_csv默认视为缺失值的文本
+NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+])
+
+
+def sidecar_path(csv_path):
+    """CSV文件对应的副本目录"""
+    return f"{csv_path}.cols"
+
+
+def _file_stat(file_path):
+    try:
+        stat = os.stat(file_path)
+        return [stat.st_size, stat.st_mtime_ns]
+    except OSError:
+        return None
+
+
+def _encode_column(series):
+    """把一列值编码为 (UTF-8字节, 每行字节数, 是否有值)
+
+    to_csv把缺失值写为空文本，读回时空文本及NA文本都是缺失值，这里按相同规则处理。
+    """
+    values = series.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    texts = ['' if absent else str(value) for value, absent in zip(values.tolist(), missing.tolist())]
+    valid = ~(missing | pd.Series(texts, dtype=object).isin(NA_VALUES).to_numpy())
+    texts = [text if ok else '' for text, ok in zip(texts, valid.tolist())]
+
+    joined = ''.join(texts)
+    data = joined.encode('utf-8')
+    if len(data) == len(joined):
+        # 全部为ASCII时字符数就是字节数
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    else:
+        lengths = np.fromiter((len(text.encode('utf-8')) for text in texts), dtype=np.int64, count=len(texts))
+    return data, lengths, valid.astype(np.uint8)
+
+
+class SidecarWriter:
+    """列式副本写入器类，按块追加数据"""
+
+    def __init__(self, csv_path, columns):
+        """初始化写入器，旧副本立即失效
+
+        Args:
+            csv_path: 对应的CSV文件路径
+            columns: 列名列表
+        """
+        self.csv_path = csv_path
+        self.directory = sidecar_path(csv_path)
+        self.columns = list(columns)
+        self.rows = 0
+        self._generation = f"{time.time_ns():x}"
+        self._files = []
+        self._handles = []
+        self._offsets = [0] * len(self.columns)
+
+        os.makedirs(self.directory, exist_ok=True)
+        # 先删除元数据，写入过程中或写入失败时不会读到不完整的副本
+        meta_path = os.path.join(self.directory, META_FILENAME)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        for i in range(len(self.columns)):
+            names = {kind: f"{self._generation}.{i}.{kind}" for kind in ('data', 'offsets', 'valid')}
+            self._files.append(names)
+            handles = {kind: open(os.path.join(self.directory, name), 'wb') for kind, name in names.items()}
+            handles['offsets'].write(np.zeros(1, dtype=np.int64).tobytes())
+            self._handles.append(handles)
+
+    def append(self, df):
+        """追加一块数据
+
+        Args:
+            df: 包含所有列的数据帧
+        """
+        for i, column in enumerate(self.columns):
+            data, lengths, valid = _encode_column(df[column])
+            handles = self._handles[i]
+            handles['data'].write(data)
+            handles['offsets'].write((self._offsets[i] + np.cumsum(lengths)).tobytes())
+            handles['valid'].write(valid.tobytes())
+            self._offsets[i] += len(data)
+        self.rows += len(df)
+
+    def _close_handles(self):
+        for handles in self._handles:
+            for handle in handles.values():
+                handle.close()
+        self._handles = []
+
+    def commit(self):
+        """写入元数据使副本生效（应在CSV文件写完之后调用），并删除其他旧的数组文件"""
+        self._close_handles()
+        meta = {
+            'version': SIDECAR_VERSION,
+            'columns': self.columns,
+            'rows': self.rows,
+            'files': self._files,
+            'csv_stat': _file_stat(self.csv_path)
+        }
+        meta_path = os.path.join(self.directory, META_FILENAME)
+        with open(f"{meta_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(f"{meta_path}.tmp", meta_path)
+        self._remove_files(keep=self._generation)
+        logger.debug(f"已保存PHBOM列式副本: {self.directory}，{self.rows} 行")
+
+    def abort(self):
+        """放弃写入，删除本次写入的文件"""
+        self._close_handles()
+        for names in self._files:
+            for name in names.values():
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def _remove_files(self, keep):
+        """删除其他写入产生的数组文件（仍被映射而无法删除的文件留到下次删除）"""
+        for name in os.listdir(self.directory):
+            if name == META_FILENAME or name.startswith(f"{keep}."):
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+def write_sidecar(csv_path, df):
+    """为已写入的CSV文件保存完整数据帧的列式副本
+
+    Args:
+        csv_path: CSV文件路径
+        df: 写入CSV的数据帧
+    """
+    writer = SidecarWriter(csv_path, df.columns)
+    try:
+        writer.append(df)
+        writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+class StringColumn:
+    """内存映射的字符串列类"""
+
+    def __init__(self, data, offsets, valid):
+        """初始化列
+
+        Args:
+            data: UTF-8字节数组
+            offsets: 每行的起始偏移，长度为行数+1
+            valid: 每行是否有值
+        """
+        self.data = data
+        self.offsets = offsets
+        self.valid = valid
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __getitem__(self, positions):
+        """按位置数组取值
+
+        Args:
+            positions: 行的位置数组
+
+        Returns:
+            numpy.ndarray: 字符串对象数组，缺失值为NaN
+        """
+        positions = np.asarray(positions)
+        starts = self.offsets[positions].tolist()
+        ends = self.offsets[positions + 1].tolist()
+        valid = self.valid[positions].tolist()
+        values = np.empty(len(starts), dtype=object)
+        values[:] = [bytes(self.data[start:end]).decode('utf-8') if ok else np.nan
+                     for start, end, ok in zip(starts, ends, valid)]
+        return values
+
+    def to_list(self, missing=np.nan):
+        """解码整列
+
+        Args:
+            missing: 缺失值使用的值
+
+        Returns:
+            list: 字符串列表
+        """
+        raw = bytes(self.data)
+        text = raw.decode('utf-8')
+        offsets = self.offsets.tolist()
+        if len(text) == len(raw):
+            # 全部为ASCII时字节偏移就是字符偏移，直接切片
+            values = [text[offsets[i]:offsets[i + 1]] for i in range(len(self.valid))]
+        else:
+            values = [raw[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(self.valid))]
+        for i in np.flatnonzero(self.valid == 0).tolist():
+            values[i] = missing
+        return values
+
+
+def _map_array(path, dtype, count):
+    """内存映射原始数组文件（空数组不能映射）"""
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+
+
+def load_sidecar(csv_path):
+    """加载CSV文件的列式副本
+
+    Args:
+        csv_path: CSV文件路径
+
+    Returns:
+        tuple: (列名列表, {列名: StringColumn}, 行数)，副本不存在、已过期或无法读取时返回None
+    """
+    directory = sidecar_path(csv_path)
+    try:
+        with open(os.path.join(directory, META_FILENAME), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"读取PHBOM列式副本失败: {str(e)}")
+        return None
+
+    if meta.get('version') != SIDECAR_VERSION:
+        return None
+    if meta.get('csv_stat') is None or meta['csv_stat'] != _file_stat(csv_path):
+        logger.info(f"PHBOM列式副本已过期: {directory}")
+        return None
+
+    try:
+        rows = meta['rows']
+        columns = {}
+        for column, names in zip(meta['columns'], meta['files']):
+            offsets = _map_array(os.path.join(directory, names['offsets']), np.int64, rows + 1)
+            data_size = int(offsets[-1])
+            columns[column] = StringColumn(
+                _map_array(os.path.join(directory, names['data']), np.uint8, data_size),
+                offsets,
+                _map_array(os.path.join(directory, names['valid']), np.uint8, rows)
+            )
+    except Exception as e:
+        logger.warning(f"读取PHBOM列式副本失败: {str(e)}")
+        return None
+    return meta['columns'], columns, rows
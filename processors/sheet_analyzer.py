@@ -0,0 +1,500 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作表向量化分析模块
+
+这个模块提供配置工作表的批量分析功能，包括：
+- 从组件列中收集组件映射
+- 将组件行 × PN列区域作为一个NumPy对象数组整体取出
+- 批量生成每个System P/N的配置信息
+
+组件条目使用紧凑的ComponentRecord表示，按字典方式访问时与ConfigProcessor逐单元格分析的结果完全一致。
+"""
+
+import logging
+from collections.abc import Mapping
+from contextlib import closing
+from itertools import takewhile
+import numpy as np
+import pandas as pd
+
+from processors.config_records import ComponentRecord
+from utils.component_taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# 对对象数组逐元素执行 str(value).strip()
+_strip_str = np.frompyfunc(lambda value: str(value).strip(), 1, 1)
+
+
+def to_object_array(df):
+    """将DataFrame转换为二维对象数组
+
+    Args:
+        df: 工作表数据DataFrame
+
+    Returns:
+        numpy.ndarray: dtype为object的二维数组
+    """
+    return df.to_numpy(dtype=object, copy=False)
+
+
+def collect_components_map(values, header_row, component_keywords):
+    """收集组件映射（第一列，从标题行后开始，遇到空单元格停止）
+
+    Args:
+        values: 工作表对象数组
+        header_row: System P/N所在行
+        component_keywords: 组件关键字列表
+
+    Returns:
+        dict: {关键字: [{'name': 组件名称, 'row': 行号}, ...]}
+    """
+    components_map = {}
+    if values.shape[1] == 0:
+        return components_map
+
+    first_col = values[header_row + 1:, 0]
+    blank = pd.isna(first_col)
+    end = int(np.argmax(blank)) if blank.any() else len(first_col)
+
+    taxonomy = get_taxonomy(component_keywords)
+    for offset in range(end):
+        component = str(first_col[offset]).strip()
+        if not component:
+            continue
+        for keyword in taxonomy.keywords_in(component):
+            components_map.setdefault(keyword, []).append({
+                'name': component,
+                'row': header_row + 1 + offset
+            })
+    return components_map
+
+
+def find_pn_columns(values, header_row, config_col):
+    """查找标题行中的有效System P/N列
+
+    Args:
+        values: 工作表对象数组
+        header_row: System P/N所在行
+        config_col: System P/N所在列
+
+    Returns:
+        tuple: (按列顺序排列的PN列表, 对应列号数组)
+    """
+    if config_col >= values.shape[1]:
+        return [], np.empty(0, dtype=np.intp)
+
+    header = values[header_row, config_col:]
+    header_ok = ~pd.isna(header)
+    header_str = np.full(header.shape, '', dtype=object)
+    if header_ok.any():
+        header_str[header_ok] = _strip_str(header[header_ok])
+    valid = header_ok & (header_str != '')
+    return header_str[valid].tolist(), np.nonzero(valid)[0] + config_col
+
+
+def extract_column_config(values, col, components_map, component_keywords):
+    """提取单个PN列的配置
+
+    Args:
+        values: 工作表对象数组
+        col: PN所在列
+        components_map: 组件映射
+        component_keywords: 组件关键字列表
+
+    Returns:
+        dict: {关键字: [{'name', 'spec', 'pn'}, ...]}
+    """
+    n_cols = values.shape[1]
+    config = {}
+    for keyword in component_keywords:
+        config[keyword] = []
+        for comp in components_map.get(keyword, []):
+            row = comp['row']
+            spec = values[row, col]
+            if pd.isna(spec):
+                continue
+            part_pn = values[row, col + 1] if col + 1 < n_cols else None
+            config[keyword].append(ComponentRecord(
+                comp['name'],
+                str(spec).strip(),
+                str(part_pn).strip() if not pd.isna(part_pn) else ''
+            ))
+    return config
+
+
+def _component_slots(components_map, component_keywords):
+    """按关键字顺序展开组件槽位
+
+    Returns:
+        tuple: ([(关键字, 组件名称), ...], [组件所在行, ...])
+    """
+    slots = []
+    rows = []
+    for keyword in component_keywords:
+        for comp in components_map.get(keyword, []):
+            slots.append((keyword, comp['name']))
+            rows.append(comp['row'])
+    return slots, rows
+
+
+def _component_strings(values, rows, pn_cols):
+    """整体取出组件行 × PN列的规格，以及每个PN列右侧一列的料号
+
+    Args:
+        values: 工作表对象数组
+        rows: 组件所在行列表
+        pn_cols: PN所在列号数组
+
+    Returns:
+        tuple: (规格非空掩码, 规格文本, 料号文本)，均为 组件数 × PN数 的数组，空单元格的文本为''
+    """
+    n_cols = values.shape[1]
+    row_idx = np.asarray(rows, dtype=np.intp)
+    specs = values[np.ix_(row_idx, pn_cols)]
+
+    next_cols = pn_cols + 1
+    has_next = next_cols < n_cols
+    part_pns = np.full(specs.shape, None, dtype=object)
+    if has_next.any():
+        part_pns[:, has_next] = values[np.ix_(row_idx, next_cols[has_next])]
+
+    spec_ok = ~pd.isna(specs)
+    spec_str = np.full(specs.shape, '', dtype=object)
+    if spec_ok.any():
+        spec_str[spec_ok] = _strip_str(specs[spec_ok])
+
+    part_ok = ~pd.isna(part_pns)
+    part_str = np.full(part_pns.shape, '', dtype=object)
+    if part_ok.any():
+        part_str[part_ok] = _strip_str(part_pns[part_ok])
+    return spec_ok, spec_str, part_str
+
+
+def extract_config_columns(values, pn_columns, components_map, component_keywords):
+    """按列式布局批量提取配置，每个 (PN, 组件) 一行，按PN顺序排列
+
+    与extract_column_config逐列提取的结果一致，但不创建任何组件记录对象。
+
+    Args:
+        values: 工作表对象数组
+        pn_columns: {pn: 列号}
+        components_map: 组件映射
+        component_keywords: 组件关键字列表
+
+    Returns:
+        tuple: ({'pn', 'component_type', 'name', 'spec', 'part_pn'}: 对象数组, 每个PN的行数数组)
+    """
+    pns = np.asarray(list(pn_columns.keys()), dtype=object)
+    pn_cols = np.asarray(list(pn_columns.values()), dtype=np.intp)
+    slots, rows = _component_slots(components_map, component_keywords)
+    if not rows or not len(pns):
+        empty = np.empty(0, dtype=object)
+        return {name: empty for name in ('pn', 'component_type', 'name', 'spec', 'part_pn')}, \
+            np.zeros(len(pns), dtype=np.int64)
+
+    spec_ok, spec_str, part_str = _component_strings(values, rows, pn_cols)
+    # 转置为 PN × 组件，按行优先顺序取出非空规格即为按PN、再按组件顺序排列
+    pn_idx, slot_idx = np.nonzero(spec_ok.T)
+    slot_types = np.asarray([keyword for keyword, name in slots], dtype=object)
+    slot_names = np.asarray([name for keyword, name in slots], dtype=object)
+    columns = {
+        'pn': pns[pn_idx],
+        'component_type': slot_types[slot_idx],
+        'name': slot_names[slot_idx],
+        'spec': spec_str.T[pn_idx, slot_idx],
+        'part_pn': part_str.T[pn_idx, slot_idx]
+    }
+    return columns, spec_ok.sum(axis=0).astype(np.int64)
+
+
+def extract_pn_configs(values, header_row, config_col, components_map, component_keywords):
+    """批量提取工作表中所有System P/N的配置
+
+    Args:
+        values: 工作表对象数组
+        header_row: System P/N所在行
+        config_col: System P/N所在列
+        components_map: 组件映射
+        component_keywords: 组件关键字列表
+
+    Returns:
+        list: 按列顺序排列的 (pn, 列号, config) 元组列表
+    """
+    pns, pn_cols = find_pn_columns(values, header_row, config_col)
+    if not pns:
+        return []
+
+    slots, rows = _component_slots(components_map, component_keywords)
+    if rows:
+        spec_ok, spec_str, part_str = _component_strings(values, rows, pn_cols)
+
+        # 转置为按PN列组织的Python列表，减少组装时的索引开销
+        spec_ok_cols = spec_ok.T.tolist()
+        spec_cols = spec_str.T.tolist()
+        part_cols = part_str.T.tolist()
+    else:
+        spec_ok_cols = spec_cols = part_cols = [[] for _ in pns]
+
+    results = []
+    for j, pn in enumerate(pns):
+        config = {keyword: [] for keyword in component_keywords}
+        ok_col = spec_ok_cols[j]
+        spec_col = spec_cols[j]
+        part_col = part_cols[j]
+        for i, (keyword, name) in enumerate(slots):
+            if ok_col[i]:
+                config[keyword].append(ComponentRecord(name, spec_col[i], part_col[i]))
+        results.append((pn, int(pn_cols[j]), config))
+    return results
+
+
+class LazyConfigData(Mapping):
+    """按需提取的配置数据
+
+    加载工作表时只记录每个System P/N所在的列，首次访问某个PN时才提取该列的配置并缓存。
+    接口与 {pn: {'sheet': 工作表, 'config': 配置}} 字典一致。
+    """
+
+    def __init__(self, component_keywords):
+        """初始化
+
+        Args:
+            component_keywords: 组件关键字列表
+        """
+        self._component_keywords = component_keywords
+        self._sheets = {}     # {工作表: (对象数组, 组件映射)}
+        self._columns = {}    # {pn: (工作表, 列号)}
+        self._loaded = {}     # {pn: {'sheet', 'config'}}
+
+    def add_sheet(self, sheet_name, values, components_map, pn_columns):
+        """登记一个工作表，后出现的重复PN覆盖之前的列
+
+        Args:
+            sheet_name: 工作表名称
+            values: 工作表对象数组
+            components_map: 组件映射
+            pn_columns: {pn: 列号}
+        """
+        self._sheets[sheet_name] = (values, components_map)
+        for pn, col in pn_columns.items():
+            self._columns[pn] = (sheet_name, col)
+            self._loaded.pop(pn, None)
+
+    def sheet_of(self, pn):
+        """获取PN所属工作表，不提取配置"""
+        return self._columns[pn][0]
+
+    def sheet_columns(self):
+        """按工作表分组的PN所在列，不提取配置
+
+        Returns:
+            list: [(工作表, 对象数组, 组件映射, {pn: 列号}), ...]
+        """
+        grouped = {}
+        for pn, (sheet_name, col) in self._columns.items():
+            grouped.setdefault(sheet_name, {})[pn] = col
+        return [(sheet_name, *self._sheets[sheet_name], pn_columns)
+                for sheet_name, pn_columns in grouped.items()]
+
+    def is_loaded(self, pn):
+        """PN的配置是否已经提取"""
+        return pn in self._loaded
+
+    def __getitem__(self, pn):
+        data = self._loaded.get(pn)
+        if data is None:
+            sheet_name, col = self._columns[pn]
+            values, components_map = self._sheets[sheet_name]
+            data = {
+                'sheet': sheet_name,
+                'config': extract_column_config(values, col, components_map, self._component_keywords)
+            }
+            self._loaded[pn] = data
+            logger.debug(f"按需提取System P/N配置: {pn}")
+        return data
+
+    def __contains__(self, pn):
+        return pn in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+# System P/N标题的搜索范围与标签
+HEADER_PROBE_ROWS = 30
+HEADER_PROBE_COLS = 10
+HEADER_LABEL = 'System P/N'
+
+
+def _is_fuzzy_header(text):
+    """模糊匹配：同时包含 system、p、n（不区分大小写）"""
+    return (np.char.find(text, 'system') >= 0) & (np.char.find(text, 'p') >= 0) & (np.char.find(text, 'n') >= 0)
+
+
+def locate_header(values, max_rows=HEADER_PROBE_ROWS, max_cols=HEADER_PROBE_COLS):
+    """在探测窗口中定位System P/N标题单元格
+
+    先在前 max_rows 行 × 前 max_cols 列中查找精确匹配，找不到时在前 max_rows 行的所有列中模糊匹配，
+    均按行优先顺序取第一个匹配。每一步都是对整个窗口的一次数组运算。
+
+    Args:
+        values: 工作表对象数组
+        max_rows: 搜索的行数
+        max_cols: 精确匹配搜索的列数
+
+    Returns:
+        tuple: (header_row, config_col)，未找到时返回 (-1, -1)
+    """
+    window = values[:max_rows]
+    if window.size == 0:
+        return -1, -1
+
+    text = _strip_str(window).astype(str)
+    exact = text[:, :max_cols] == HEADER_LABEL
+    if exact.any():
+        row, col = np.unravel_index(np.argmax(exact), exact.shape)
+        return int(row), int(col)
+
+    fuzzy = _is_fuzzy_header(np.char.lower(text))
+    if fuzzy.any():
+        row, col = np.unravel_index(np.argmax(fuzzy), fuzzy.shape)
+        return int(row), int(col)
+    return -1, -1
+
+
+def _probe_array(probe_rows, first_row, n_rows):
+    """将流式读取的探测行组成对象数组，空单元格为NaN（与pandas读取的结果一致）"""
+    width = max((max(cells) + 1 for cells in probe_rows.values() if cells), default=0)
+    values = np.full((n_rows, width), np.nan, dtype=object)
+    for row, cells in probe_rows.items():
+        for col, text in cells.items():
+            values[row - first_row, col] = text
+    return values
+
+
+def scan_used_range(open_rows, first_row=0, probe_rows=HEADER_PROBE_ROWS, probe_cols=HEADER_PROBE_COLS):
+    """两阶段读取的第一阶段：从流式读取的行中定位标题和组件块，确定需要读取的范围
+
+    与HeaderLocator使用相同的规则定位标题；组件块在第一列第一个空单元格处结束，
+    PN列到标题行最后一个非空单元格为止（再加上其右侧的料号列）。每行只解析前probe_cols列和行宽，
+    只有前几列中找不到标题时才解析探测行的所有列；读到组件块结束即停止，之后的行不再解析。
+    得到的范围是从A1开始的矩形，行号和列号与完整读取时一致。
+
+    Args:
+        open_rows: open_rows(max_cols) 返回 (行号, {列号: 文本}, 行宽) 迭代器的函数，见iter_sheet_rows
+        first_row: pandas读取时数据开始的行（header=0时为1），之前的行不参与标题定位
+        probe_rows: 搜索标题的行数
+        probe_cols: 精确匹配搜索的列数
+
+    Returns:
+        tuple: (结束行, 结束列)，均不包含；右侧没有需要跳过的列时结束列为None，未找到标题时返回None
+    """
+    probe_end = first_row + probe_rows
+    with closing(open_rows(probe_cols)) as rows:
+        widths = {}  # {行号: 该行最后一个非空单元格之后的列号}，用于限制读取的列不超出实际范围
+        probe = {}
+        pending = None
+        for row, cells, width in rows:
+            widths[row] = width
+            if row >= probe_end:
+                pending = (row, cells)
+                break
+            if row >= first_row:
+                probe[row] = cells
+
+        header_row, config_col = locate_header(_probe_array(probe, first_row, probe_rows))
+        if header_row == -1 and any(widths[row] > probe_cols for row in probe):
+            with closing(open_rows(None)) as full_rows:
+                full = {row: cells for row, cells, width in takewhile(lambda item: item[0] < probe_end, full_rows)
+                        if row >= first_row}
+            header_row, config_col = locate_header(_probe_array(full, first_row, probe_rows))
+        if header_row == -1:
+            return None
+        header_row += first_row
+
+        # 组件块：标题行之后第一列连续非空的行
+        def following():
+            for row in sorted(probe):
+                if row > header_row:
+                    yield row, probe[row]
+            if pending is not None:
+                yield pending
+            for row, cells, width in rows:
+                widths[row] = width
+                yield row, cells
+
+        row_end = header_row + 1
+        for row, cells in following():
+            if row != row_end or 0 not in cells:
+                break
+            row_end = row + 1
+
+    col_end = max(widths.get(header_row, 0), config_col + 1) + 1
+    width = max((w for row, w in widths.items() if row < row_end), default=0)
+    return row_end, (col_end if col_end < width else None)
+
+
+class HeaderLocator:
+    """带布局缓存的System P/N标题定位器
+
+    以探测窗口第一列的内容和列数作为工作表布局签名，同一模板的工作表直接复用已定位的
+    (header_row, config_col)。只有该单元格仍是精确匹配的标题、且它之前没有其他精确匹配的标题时
+    才复用（与locate_header的结果相同），否则重新定位。
+    """
+
+    def __init__(self, max_entries=256):
+        """初始化定位器
+
+        Args:
+            max_entries: 最多缓存的布局数量
+        """
+        self.max_entries = max_entries
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _is_first_exact_header(narrow, row, col):
+        """探测窗口中按行优先顺序的第一个精确匹配标题是否就是 (row, col)"""
+        if row >= narrow.shape[0] or col >= narrow.shape[1]:
+            return False
+        # 只转换到缓存的标题行为止
+        exact = _strip_str(narrow[:row + 1]).astype(str) == HEADER_LABEL
+        return bool(exact[row, col]) and not exact[:row].any() and not exact[row, :col].any()
+
+    def locate(self, df):
+        """定位System P/N标题单元格
+
+        只有精确匹配失败时才取出探测行的全部列做模糊匹配，宽工作表不必整体转换。
+
+        Args:
+            df: 工作表数据DataFrame
+
+        Returns:
+            tuple: (header_row, config_col)，未找到时返回 (-1, -1)
+        """
+        if df.shape[0] == 0 or df.shape[1] == 0:
+            return -1, -1
+
+        narrow = to_object_array(df.iloc[:HEADER_PROBE_ROWS, :HEADER_PROBE_COLS])
+        signature = (df.shape[1], tuple(_strip_str(narrow[:, 0]).tolist()))
+        cached = self._cache.get(signature)
+        if cached is not None and self._is_first_exact_header(narrow, *cached):
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        header_row, config_col = locate_header(narrow)
+        if header_row == -1 and df.shape[1] > HEADER_PROBE_COLS:
+            header_row, config_col = locate_header(to_object_array(df.iloc[:HEADER_PROBE_ROWS]))
+        if header_row != -1:
+            if len(self._cache) >= self.max_entries:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[signature] = (header_row, config_col)
+        return header_row, config_col
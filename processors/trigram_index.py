@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+三元组子串索引模块
+
+这个模块为一列字符串建立三元组（连续3个字符）倒排索引，用于不区分大小写的子串查找，包括：
+- 建立索引时把所有字符串拼接为一个码点数组，批量计算 (三元组, 行号) 键，一次排序得到每个三元组的行号列表
+- 查询按字面匹配（不是正则表达式）：取查询中各三元组的行号列表求交集得到候选行，再逐个验证
+- 不足3个字符的查询没有三元组，直接逐行查找
+
+用法（与逐行 str.contains 对比查找耗时）:
+    python -m processors.trigram_index --benchmark [--rows 行数] [--file PHBOM.CSV]
+"""
+
+import sys
+import time
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 三元组长度
+GRAM_SIZE = 3
+
+# 拼接字符串时使用的分隔码点（不会出现在三元组中）
+_SEPARATOR = 0
+
+
+def _gram_keys(codes, size):
+    """把码点数组中每个位置开始的三元组编码为一个整数
+
+    Args:
+        codes: 字符在字母表中的序号数组
+        size: 字母表大小
+    """
+    codes = codes.astype(np.int64)
+    return (codes[:-2] * size + codes[1:-1]) * size + codes[2:]
+
+
+def _code_points(text):
+    """字符串的码点数组"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+class TrigramIndex:
+    """三元组子串索引类"""
+
+    def __init__(self, strings):
+        """建立索引
+
+        Args:
+            strings: 字符串序列（缺失值应先转换为字符串）
+        """
+        # 小写后的字符串，用于验证候选行
+        lowered = [str(text).lower().replace('\0', ' ') for text in strings]
+        self._lowered = lowered
+
+        # 所有字符串以分隔符连接，记录每个码点所属的行
+        codes = _code_points('\0'.join(lowered) + '\0')
+        lengths = np.fromiter((len(text) + 1 for text in lowered), dtype=np.int64, count=len(lowered))
+        rows = np.repeat(np.arange(len(lowered), dtype=np.int64), lengths)
+
+        # 出现过的字符组成字母表，三元组按字母表序号编码，键的范围与字符种类数有关而与码点大小无关
+        self._alphabet = np.flatnonzero(np.bincount(codes))
+        table = np.zeros(int(self._alphabet[-1]) + 1, dtype=np.int64)
+        table[self._alphabet] = np.arange(len(self._alphabet))
+        size = len(self._alphabet)
+
+        if len(codes) >= GRAM_SIZE:
+            keys = _gram_keys(table[codes], size)
+            # 三元组中不能包含分隔符
+            valid = (codes[:-2] != _SEPARATOR) & (codes[1:-1] != _SEPARATOR) & (codes[2:] != _SEPARATOR)
+            keys = keys[valid]
+            rows = rows[:-2][valid]
+        else:
+            keys = np.empty(0, dtype=np.int64)
+            rows = np.empty(0, dtype=np.int64)
+
+        # 三元组和行号合成一个键排序，同一三元组的行号升序排列，再去掉同一行中重复的三元组
+        count = max(len(lowered), 1)
+        if size ** GRAM_SIZE * count < 2 ** 63:
+            pairs = np.sort(keys * count + rows)
+            keys, rows = np.divmod(pairs, count)
+        else:
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            rows = rows[order]
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])
+        keys = keys[keep]
+        rows = rows[keep]
+        self._rows = rows.astype(np.int32)
+
+        # 每个三元组的行号存放在 _rows[_starts[i]:_starts[i + 1]]
+        boundaries = np.flatnonzero(np.diff(keys)) + 1 if len(keys) else np.empty(0, dtype=np.int64)
+        self._grams = keys[np.concatenate(([0], boundaries))] if len(keys) else keys
+        self._starts = np.concatenate(([0], boundaries, [len(keys)])).astype(np.int64)
+
+    def __len__(self):
+        return len(self._lowered)
+
+    @property
+    def nbytes(self):
+        """索引数组占用的内存（字节，不包括字符串本身）"""
+        return self._grams.nbytes + self._starts.nbytes + self._rows.nbytes
+
+    def _postings(self, gram):
+        """三元组的行号数组，不存在时返回None"""
+        i = np.searchsorted(self._grams, gram)
+        if i == len(self._grams) or self._grams[i] != gram:
+            return None
+        return self._rows[self._starts[i]:self._starts[i + 1]]
+
+    def _verify(self, positions, query):
+        """逐行确认候选行包含查询内容"""
+        lowered = self._lowered
+        return np.fromiter((i for i in positions.tolist() if query in lowered[i]), dtype=np.intp)
+
+    def candidates(self, query):
+        """根据三元组求候选行（只在查询不少于3个字符时可用）
+
+        Args:
+            query: 已转为小写的查询内容
+
+        Returns:
+            numpy.ndarray: 候选行号（升序）
+        """
+        codes = _code_points(query)
+        positions = np.searchsorted(self._alphabet, codes)
+        if (positions >= len(self._alphabet)).any() or (self._alphabet[np.minimum(positions, len(self._alphabet) - 1)] != codes).any():
+            # 查询中有索引中没有出现过的字符
+            return np.empty(0, dtype=np.int32)
+        grams = np.unique(_gram_keys(positions, len(self._alphabet)))
+        postings = []
+        for gram in grams:
+            rows = self._postings(gram)
+            if rows is None:
+                return np.empty(0, dtype=np.int32)
+            postings.append(rows)
+        # 从最短的行号列表开始求交集
+        postings.sort(key=len)
+        result = postings[0]
+        for rows in postings[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, rows, assume_unique=True)
+        return result
+
+    def search(self, query):
+        """查找包含query的行（不区分大小写，按字面匹配）
+
+        Args:
+            query: 查询内容
+
+        Returns:
+            numpy.ndarray: 匹配的行号（升序）
+        """
+        query = str(query).lower()
+        if not query:
+            return np.arange(len(self._lowered), dtype=np.intp)
+        if '\0' in query:
+            return np.empty(0, dtype=np.intp)
+        if len(query) < GRAM_SIZE:
+            return self._verify(np.arange(len(self._lowered)), query)
+        return self._verify(self.candidates(query), query)
+
+
+def _synthetic_numbers(rows, seed=0):
+    """生成用于基准测试的料号"""
+    rng = np.random.default_rng(seed)
+    prefixes = np.array(['PN', 'AB', 'CPU-', 'MEM-', 'SSD-', 'X'], dtype=object)
+    picks = prefixes[rng.integers(0, len(prefixes), rows)]
+    digits = rng.integers(0, 10 ** 7, rows)
+    suffixes = np.array(list('ABCDEFGH'), dtype=object)[rng.integers(0, 8, rows)]
+    return [f"{prefix}{number:07d}{suffix}" for prefix, number, suffix in zip(picks, digits, suffixes)]
+
+
+def benchmark(numbers, queries, repeat=3):
+    """对比三元组索引与逐行 str.contains 的查找耗时
+
+    Args:
+        numbers: 料号列表
+        queries: 查询内容列表
+        repeat: 每个查询重复次数，取最短耗时
+
+    Returns:
+        dict: {'build': 建立索引耗时, 'nbytes': 索引大小,
+               'queries': [{'query', 'matches', 'index', 'scan'}, ...]}（耗时单位为秒）
+    """
+    import pandas as pd
+
+    start = time.perf_counter()
+    index = TrigramIndex(numbers)
+    result = {'build': time.perf_counter() - start, 'nbytes': index.nbytes, 'queries': []}
+
+    series = pd.Series(numbers, dtype=object)
+    for query in queries:
+        index_seconds = scan_seconds = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            matches = index.search(query)
+            index_seconds = min(index_seconds, time.perf_counter() - start)
+            start = time.perf_counter()
+            # 原Check的查找方式
+            expected = np.flatnonzero(series.astype(str).str.contains(query, case=False, na=False).to_numpy())
+            scan_seconds = min(scan_seconds, time.perf_counter() - start)
+        if not np.array_equal(matches, expected):
+            logger.warning(f"查询 {query} 的结果与逐行查找不一致: {len(matches)} / {len(expected)}")
+        result['queries'].append({'query': query, 'matches': len(matches),
+                                  'index': index_seconds, 'scan': scan_seconds})
+    return result
+
+
+def main(argv=None):
+    """命令行入口：对比三元组索引与逐行查找的耗时"""
+    import argparse
+    parser = argparse.ArgumentParser(description="料号子串查找基准测试")
+    parser.add_argument('--benchmark', action='store_true', required=True, help="运行基准测试")
+    parser.add_argument('--rows', type=int, default=1000000, help="生成的料号数量（默认1000000）")
+    parser.add_argument('--file', help="使用PHBOM.CSV中的Number列代替生成的料号")
+    parser.add_argument('--query', action='append', dest='queries', help="查询内容，可重复")
+    args = parser.parse_args(argv)
+
+    if args.file:
+        from processors.phbom_index import PHBOMIndex
+        numbers = PHBOMIndex.from_csv(args.file).numbers.tolist()
+    else:
+        numbers = _synthetic_numbers(args.rows)
+    queries = args.queries or [numbers[len(numbers) // 2], numbers[-1][2:8].lower(), 'cpu-12', '99', 'zzz']
+
+    result = benchmark(numbers, queries)
+    print(f"{len(numbers)} 行，建立索引 {result['build']:.3f}s，索引 {result['nbytes'] / 1048576:.1f} MiB")
+    print(f"{'查询':<16} {'匹配':>8} {'索引(ms)':>10} {'逐行(ms)':>10} {'加速':>8}")
+    for item in result['queries']:
+        speedup = item['scan'] / item['index'] if item['index'] > 0 else float('inf')
+        print(f"{item['query']:<16} {item['matches']:>8} {item['index'] * 1000:>10.2f} "
+              f"{item['scan'] * 1000:>10.2f} {speedup:>7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
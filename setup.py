@@ -19,6 +19,7 @@ setup(
     
     # 包含的Python包
     packages=find_packages(),
+    py_modules=['main', 'cli'],
     
     # 项目依赖
     install_requires=[
@@ -27,10 +28,18 @@ setup(
         "openpyxl>=3.0.0",  # 用于读取Excel文件
     ],
     
+    # 可选依赖：更快的Excel读取引擎
+    extras_require={
+        'fast': ["python-calamine>=0.2.0"],
+        # Arrow列式配置表
+        'arrow': ["pyarrow>=10.0.0"],
+    },
+    
     # 入口点，使得项目可以作为命令行工具运行
     entry_points={
         'console_scripts': [
             'autoconfig=main:main',
+            'autoconfig-batch=cli:main',
         ],
     },
     
@@ -40,11 +49,9 @@ setup(
         'Intended Audience :: End Users/Desktop',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Operating System :: OS Independent',
         'Environment :: X11 Applications :: Qt',
         'Topic :: Office/Business',
@@ -53,12 +60,12 @@ setup(
     # 项目关键词
     keywords='system configuration viewer excel phbom',
     
-    # Python版本要求
-    python_requires='>=3.6',
+    # Python版本要求（取消并行分析时使用的 Executor.shutdown(cancel_futures=True) 需要3.9）
+    python_requires='>=3.9',
     
     # 包含非Python文件
     include_package_data=True,
     
     # 许可证
     license='MIT',
-) 
\ No newline at end of file
+) 
\ No newline at end of file
@@ -34,7 +34,9 @@ from utils.event_constants import (
     CLEAR_MOD_CLICKED,
     GENERATE_CLICKED,
     CHECK_CLICKED,
-    BYPASS_WHQL_CLICKED
+    BYPASS_WHQL_CLICKED,
+    PN_SEARCH_CLICKED,
+    CONFIG_DIFF_CLICKED
 )
 
 class ControlPanel(QWidget):
@@ -101,6 +103,21 @@ class ControlPanel(QWidget):
         self.generate_btn.setMinimumWidth(120)
         left_layout.addWidget(self.generate_btn)
         
+        # 添加System P/N查找框和Find按钮
+        self.pn_search_input = QLineEdit()
+        self.pn_search_input.setPlaceholderText("查找System P/N")
+        self.pn_search_input.setMinimumWidth(160)
+        left_layout.addWidget(self.pn_search_input)
+        
+        self.pn_search_btn = QPushButton('Find')
+        self.pn_search_btn.setFixedWidth(70)
+        left_layout.addWidget(self.pn_search_btn)
+        
+        # 添加配置差异比较按钮
+        self.diff_btn = QPushButton('Compare')
+        self.diff_btn.setMinimumWidth(100)
+        left_layout.addWidget(self.diff_btn)
+        
         # 添加弹性空间，使组件左对齐
         left_layout.addStretch(1)
         
@@ -118,6 +135,9 @@ class ControlPanel(QWidget):
         self.load_phbom_btn.clicked.connect(self._on_load_phbom_clicked)
         self.clear_mod_btn.clicked.connect(self._on_clear_mod_clicked)
         self.generate_btn.clicked.connect(self._on_generate_clicked)
+        self.pn_search_btn.clicked.connect(self._on_pn_search_clicked)
+        self.pn_search_input.returnPressed.connect(self._on_pn_search_clicked)
+        self.diff_btn.clicked.connect(self._on_diff_clicked)
         
     def _create_combo_container(self, label_text, combo_width):
         """创建下拉框容器"""
@@ -177,6 +197,14 @@ class ControlPanel(QWidget):
         # 只通过事件总线发布事件，避免双重触发
         event_bus.publish(GENERATE_CLICKED)
         # self.generate_clicked.emit()  # 移除信号发射，避免双重触发
+    
+    def _on_pn_search_clicked(self):
+        """处理System P/N查找按钮点击事件"""
+        event_bus.publish(PN_SEARCH_CLICKED, self.pn_search_input.text().strip())
+    
+    def _on_diff_clicked(self):
+        """处理配置差异比较按钮点击事件"""
+        event_bus.publish(CONFIG_DIFF_CLICKED)
 
 class ButtonPanel(QWidget):
     """中间按钮面板组件"""
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置差异对话框模块
+
+这个模块提供显示两个版本配置工作簿差异的对话框
+"""
+
+import os
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                          QComboBox, QTableWidget, QTableWidgetItem, QHeaderView,
+                          QPushButton)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QColor, QBrush
+
+from processors.config_diff import ADDED, REMOVED, CHANGED, MOVED
+from ui.styles import Styles
+
+# 差异类型的显示名称和背景色
+KIND_LABELS = {
+    ADDED: '新增',
+    REMOVED: '删除',
+    CHANGED: '修改',
+    MOVED: '移动'
+}
+KIND_COLORS = {
+    ADDED: QColor(220, 245, 220),
+    REMOVED: QColor(250, 220, 220),
+    CHANGED: QColor(255, 245, 200),
+    MOVED: QColor(220, 235, 250)
+}
+
+COLUMNS = ['类型', 'System P/N', '组件', '名称', '旧规格', '新规格', '旧P/N', '新P/N', '工作表']
+
+
+class ConfigDiffDialog(QDialog):
+    """配置差异对话框"""
+
+    def __init__(self, diff, parent=None):
+        """初始化对话框
+
+        Args:
+            diff: ConfigDiff差异结果
+            parent: 父窗口
+        """
+        super().__init__(parent)
+        self.diff = diff
+        self.setWindowTitle('配置差异')
+        self.resize(1200, 700)
+        self.setup_ui()
+        self._populate()
+
+    def setup_ui(self):
+        """设置UI布局"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+
+        old_name = os.path.basename(self.diff.old_label) or '旧版本'
+        new_name = os.path.basename(self.diff.new_label) or '新版本'
+        self.summary_label = QLabel(
+            f"{old_name} → {new_name}：{self.diff.summary()}（耗时 {self.diff.elapsed:.3f}s）")
+        layout.addWidget(self.summary_label)
+
+        # 过滤条件
+        filter_layout = QHBoxLayout()
+        self.kind_combo = QComboBox()
+        self.kind_combo.addItem('全部', None)
+        for kind, label in KIND_LABELS.items():
+            self.kind_combo.addItem(label, kind)
+        self.kind_combo.setStyleSheet(Styles.get_combobox_style())
+        filter_layout.addWidget(QLabel('类型:'))
+        filter_layout.addWidget(self.kind_combo)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText('按System P/N或组件过滤')
+        self.filter_input.setStyleSheet(Styles.get_lineedit_style())
+        filter_layout.addWidget(self.filter_input, 1)
+        layout.addLayout(filter_layout)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header_font = QFont()
+        header_font.setBold(True)
+        header.setFont(header_font)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        close_btn = QPushButton('关闭')
+        close_btn.setStyleSheet(Styles.get_button_style())
+        close_btn.clicked.connect(self.accept)
+        button_layout = QHBoxLayout()
+        button_layout.addStretch(1)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.kind_combo.currentIndexChanged.connect(self._apply_filter)
+        self.filter_input.textChanged.connect(self._apply_filter)
+
+    def _populate(self):
+        """填充差异表格"""
+        entries = self.diff.entries
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            if entry.old_sheet and entry.new_sheet and entry.old_sheet != entry.new_sheet:
+                sheet = f"{entry.old_sheet} → {entry.new_sheet}"
+            else:
+                sheet = entry.new_sheet or entry.old_sheet
+            values = [KIND_LABELS.get(entry.kind, entry.kind), entry.pn, entry.keyword, entry.name,
+                      entry.old_spec, entry.new_spec, entry.old_pn, entry.new_pn, sheet]
+            brush = QBrush(KIND_COLORS.get(entry.kind, QColor(255, 255, 255)))
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                item.setBackground(brush)
+                if col == 0:
+                    item.setData(Qt.ItemDataRole.UserRole, entry.kind)
+                self.table.setItem(row, col, item)
+        self.table.resizeColumnsToContents()
+        self.table.setUpdatesEnabled(True)
+
+    def _apply_filter(self):
+        """按类型和关键字过滤显示的行"""
+        kind = self.kind_combo.currentData()
+        text = self.filter_input.text().strip().lower()
+        for row, entry in enumerate(self.diff.entries):
+            visible = kind is None or entry.kind == kind
+            if visible and text:
+                visible = (text in entry.pn.lower() or text in entry.keyword.lower()
+                           or text in entry.name.lower())
+            self.table.setRowHidden(row, not visible)
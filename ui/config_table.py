@@ -15,6 +15,8 @@ from PyQt6.QtGui import QFont, QColor, QBrush
 import logging
 import pandas as pd
 
+from utils.component_taxonomy import get_taxonomy
+
 class ConfigTable(QWidget):
     """配置详情表格组件"""
     
@@ -153,91 +155,30 @@ class ConfigTable(QWidget):
         # 记录所有可用的组件类型
         logger.info(f"配置中可用的组件类型: {list(config.keys())}")
         
-        # 定义关键字的别名映射，以处理可能的拼写变体
-        keyword_aliases = {
-            "CPU": ["cpu", "processor", "central"],
-            "GPU": ["gpu", "graphics", "vga"],
-            "Memory": ["memory", "ram", "dimm", "ddr"],
-            "LCD": ["lcd", "display", "screen", "monitor", "panel"],
-            "WLAN": ["wlan", "wifi", "wireless"],
-            "WWAN": ["wwan", "cellular", "mobile"],
-            "SSD": ["ssd", "solid", "nvme"],
-            "Battery": ["battery", "batt", "accu"],
-            "Adaptor": ["adaptor", "adapter", "power adapter", "ac adapter", "charger", "ac power"],
-            "KeyBoard": ["keyboard", "kb"],
-            "USH": ["ush"],
-            "Finger Print": ["finger print", "fingerprint", "finger"],
-            "Smart Card": ["smart card", "smartcard", "smart"],
-            "RFID": ["rfid", "nfc", "near field", "contactless", "rfid/nfc"],
-            "FIPS": ["fips"]
-        }
+        # 共享的组件分类器：关键字变体和别名已编译为一个前缀匹配表达式，结果按名称缓存
+        taxonomy = get_taxonomy(keywords)
         
-        # 显示所有定义的别名，帮助调试
-        logger.debug(f"关键字别名定义: {keyword_aliases}")
+        # 每个组件只分类一次，按所属关键字分组，组内保持原有顺序
+        keyword_groups = {keyword: [] for keyword in keywords}
+        collected_comps = set()  # 用于跟踪已收集的组件，避免重复
+        for component_type, components in config.items():
+            for comp in components:
+                name = str(comp.get('name', '')) if comp.get('name') is not None else ''
+                keyword = taxonomy.classify(name)
+                if keyword is None:
+                    continue
+                    
+                # 跳过已收集的组件
+                comp_id = f"{comp.get('name')}-{comp.get('pn')}"
+                if comp_id in collected_comps:
+                    continue
+                keyword_groups[keyword].append(comp)
+                collected_comps.add(comp_id)
         
         # 结果列表，按关键字顺序收集组件
         ordered_components = []
-        collected_comps = set()  # 用于跟踪已收集的组件，避免重复
-        
-        # 遍历关键字（按指定顺序）
         for keyword in keywords:
-            keyword_components = []
-            # 对于多词关键字，需要特殊处理
-            keyword_variants = [keyword.lower()]
-            
-            # 处理空格、斜杠和连字符
-            keyword_no_space = keyword.lower().replace(" ", "").replace("/", "").replace("-", "")
-            if keyword_no_space != keyword.lower():
-                keyword_variants.append(keyword_no_space)
-            
-            # 处理有空格的关键字，如"Finger Print"
-            if " " in keyword:
-                keyword_variants.append(keyword.split()[0].lower())
-            
-            aliases = keyword_aliases.get(keyword, [])
-            
-            logger.info(f"正在查找以关键字 {keyword} 开头的组件，变体: {keyword_variants}")
-            
-            # 搜索所有组件类型
-            for component_type, components in config.items():
-                
-                # 检查每个组件
-                for comp in components:
-                    # 跳过已收集的组件
-                    comp_id = f"{comp.get('name')}-{comp.get('pn')}"
-                    if comp_id in collected_comps:
-                        continue
-                        
-                    name = str(comp.get('name', '')).lower() if comp.get('name') is not None else ''
-                    
-                    # 显示正在检查的组件，帮助调试
-                    logger.debug(f"检查组件: {name}")
-                    
-                    # 严格检查组件名称是否以关键字或其别名开头
-                    is_match = False
-                    
-                    # 检查是否以关键字变体开头
-                    for variant in keyword_variants:
-                        if name.startswith(variant):
-                            is_match = True
-                            logger.debug(f"组件 {name} 以关键字变体 {variant} 开头")
-                            break
-                    
-                    # 如果没有匹配关键字变体，检查别名
-                    if not is_match:
-                        for alias in aliases:
-                            if name.startswith(alias.lower()):
-                                is_match = True
-                                logger.debug(f"组件 {name} 以别名 {alias} 开头")
-                                break
-                    
-                    # 如果组件名称与当前关键字匹配
-                    if is_match:
-                        logger.info(f"找到匹配组件: {comp.get('name')} (关键字: {keyword})")
-                        keyword_components.append(comp)
-                        collected_comps.add(comp_id)
-            
-            # 将此关键字下的所有组件添加到结果列表
+            keyword_components = keyword_groups[keyword]
             if keyword_components:
                 logger.info(f"关键字 {keyword} 找到 {len(keyword_components)} 个组件")
                 ordered_components.extend(keyword_components)
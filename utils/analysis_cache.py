@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作表分析结果缓存模块
+
+这个模块提供配置工作簿分析结果的磁盘缓存，包括：
+- 以文件路径、大小、修改时间和内容哈希作为文件指纹
+- 按工作表保存分析结果（sheet_configs、config_data、PN列表）
+- 总大小上限与LRU淘汰（命中时只在内存中更新访问时间，写入或关闭缓存时保存索引）
+- 与条目关联的附属文件（如Arrow列式表），条目失效或被淘汰时一并删除
+- 手动失效
+
+用法（手动清除缓存）:
+    python -m utils.analysis_cache --clear [文件路径]
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 缓存格式版本，分析结果结构变化时递增
+CACHE_VERSION = 3
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.autoconfig', 'cache')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def file_content_hash(file_path, chunk_size=1024 * 1024):
+    """计算文件内容哈希
+
+    Args:
+        file_path: 文件路径
+        chunk_size: 每次读取的字节数
+
+    Returns:
+        str: 十六进制哈希值
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """工作表分析结果的磁盘缓存类"""
+
+    INDEX_FILENAME = 'index.json'
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """初始化缓存
+
+        Args:
+            cache_dir: 缓存目录，默认为 ~/.autoconfig/cache
+            max_bytes: 缓存总大小上限（字节）
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None
+        # 索引在内存中有未保存的修改（命中时更新的访问时间）
+        self._dirty = False
+        atexit.register(self.close)
+
+    # ---- 索引 ----
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, self.INDEX_FILENAME)
+
+    def _load_index(self):
+        """加载缓存索引（首次访问时读取）"""
+        if self._index is None:
+            self._index = {}
+            try:
+                with open(self._index_path(), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self._index = data.get('entries', {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"读取缓存索引失败，将重建缓存: {str(e)}")
+        return self._index
+
+    def _save_index(self):
+        """原子方式写回缓存索引
+
+        每次写入使用唯一的临时文件名，多个进程同时写入时不会互相覆盖临时文件。
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=self.INDEX_FILENAME + '.', suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': self._index}, f)
+            os.replace(tmp_path, self._index_path())
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+
+    def flush(self):
+        """保存内存中未保存的索引修改"""
+        with self._lock:
+            if self._dirty and self._index is not None:
+                try:
+                    self._save_index()
+                except Exception as e:
+                    logger.warning(f"保存缓存索引失败: {str(e)}")
+
+    def close(self):
+        """关闭缓存，保存未保存的索引修改"""
+        self.flush()
+
+    @staticmethod
+    def _entry_key(file_path, sheet_name):
+        raw = f"{os.path.abspath(file_path)}\0{sheet_name}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _remove_entry(self, key):
+        entry = self._index.pop(key, None)
+        if entry:
+            for filename in [entry['file']] + entry.get('attachments', []):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _attachment_name(key, entry, suffix):
+        # 文件名包含内容哈希，旧条目的附属文件未能删除（如仍被内存映射）时不会被误用
+        return f"{key}.{entry['hash'][:16]}{suffix}"
+
+    # ---- 读写 ----
+
+    def get(self, file_path, sheet_name, on_stale=None):
+        """读取缓存的分析结果
+
+        文件大小和修改时间一致时直接命中；修改时间变化但大小一致时，
+        比较内容哈希，内容未变也视为命中。
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            on_stale: 条目因文件变化失效时，在删除前以旧的分析结果调用，
+                供调用方复用其中未变化的部分
+
+        Returns:
+            dict: 缓存的分析结果，未命中时返回None
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        stale_payload = None
+        with self._lock:
+            index = self._load_index()
+            key = self._entry_key(file_path, sheet_name)
+            entry = index.get(key)
+            if entry is None:
+                return None
+
+            stale = entry['size'] != stat.st_size
+            if not stale and entry['mtime_ns'] != stat.st_mtime_ns:
+                stale = file_content_hash(file_path) != entry['hash']
+                if not stale:
+                    entry['mtime_ns'] = stat.st_mtime_ns
+                    self._dirty = True
+
+            try:
+                if stale and on_stale is None:
+                    payload = None
+                else:
+                    with open(os.path.join(self.cache_dir, entry['file']), 'rb') as f:
+                        payload = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"读取缓存文件失败: {str(e)}")
+                self._remove_entry(key)
+                self._save_index()
+                return None
+
+            if stale:
+                self._remove_entry(key)
+                self._save_index()
+                stale_payload = payload
+            else:
+                # 只在内存中更新访问时间，写入或关闭缓存时再保存
+                entry['last_access'] = time.time()
+                self._dirty = True
+
+        if stale_payload is not None:
+            on_stale(stale_payload)
+            return None
+        if payload is None:
+            return None
+        logger.info(f"命中分析缓存: {file_path} [{sheet_name}]")
+        return payload
+
+    def put(self, file_path, sheet_name, payload, content_hash=None):
+        """写入分析结果
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            payload: 分析结果
+            content_hash: 已知的内容哈希，为None时重新计算
+        """
+        try:
+            stat = os.stat(file_path)
+            content_hash = content_hash or file_content_hash(file_path)
+            data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"生成缓存数据失败: {str(e)}")
+            return False
+
+        with self._lock:
+            index = self._load_index()
+            key = self._entry_key(file_path, sheet_name)
+            self._remove_entry(key)
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            filename = f"{key}.pkl"
+            with open(os.path.join(self.cache_dir, filename), 'wb') as f:
+                f.write(data)
+
+            index[key] = {
+                'path': os.path.abspath(file_path),
+                'sheet': sheet_name,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'hash': content_hash,
+                'file': filename,
+                'bytes': len(data),
+                'last_access': time.time()
+            }
+            self._evict()
+            self._save_index()
+
+        logger.debug(f"已写入分析缓存: {file_path} [{sheet_name}], {len(data)} 字节")
+        return True
+
+    def attachment_path(self, file_path, sheet_name, suffix, stat):
+        """获取与缓存条目关联的附属文件路径
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            suffix: 附属文件后缀，如 .arrow
+            stat: 附属文件内容对应的 (文件大小, 修改时间)
+
+        Returns:
+            str: 附属文件路径（文件不一定存在），没有缓存条目或条目与stat不一致时返回None
+        """
+        with self._lock:
+            key = self._entry_key(file_path, sheet_name)
+            entry = self._load_index().get(key)
+            if entry is None or (entry['size'], entry['mtime_ns']) != tuple(stat):
+                return None
+            return os.path.join(self.cache_dir, self._attachment_name(key, entry, suffix))
+
+    def attach(self, file_path, sheet_name, suffix, stat):
+        """登记已写入attachment_path的附属文件，计入缓存大小
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            suffix: 附属文件后缀
+            stat: 附属文件内容对应的 (文件大小, 修改时间)
+
+        Returns:
+            bool: 是否登记成功；条目已变化时返回False，由调用方删除该文件
+        """
+        with self._lock:
+            key = self._entry_key(file_path, sheet_name)
+            entry = self._load_index().get(key)
+            if entry is not None and (entry['size'], entry['mtime_ns']) == tuple(stat):
+                filename = self._attachment_name(key, entry, suffix)
+                path = os.path.join(self.cache_dir, filename)
+                attachments = entry.setdefault('attachments', [])
+                if filename not in attachments and os.path.exists(path):
+                    attachments.append(filename)
+                    entry['bytes'] += os.path.getsize(path)
+                    self._evict()
+                    self._save_index()
+                return True
+        logger.debug(f"分析缓存条目已变化，不保存附属文件: {file_path} [{sheet_name}]")
+        return False
+
+    def _evict(self):
+        """按最近访问时间淘汰，直到总大小不超过上限"""
+        total = sum(entry['bytes'] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            total -= entry['bytes']
+            logger.debug(f"淘汰分析缓存: {entry['path']} [{entry['sheet']}]")
+            self._remove_entry(key)
+
+    def invalidate(self, file_path=None):
+        """手动使缓存失效
+
+        Args:
+            file_path: 工作簿路径，为None时清除全部缓存
+
+        Returns:
+            int: 删除的缓存条目数
+        """
+        with self._lock:
+            index = self._load_index()
+            if file_path is None:
+                keys = list(index.keys())
+            else:
+                abs_path = os.path.abspath(file_path)
+                keys = [key for key, entry in index.items() if entry['path'] == abs_path]
+            for key in keys:
+                self._remove_entry(key)
+            if keys:
+                self._save_index()
+        logger.info(f"已清除 {len(keys)} 条分析缓存")
+        return len(keys)
+
+    def total_bytes(self):
+        """获取缓存总大小（字节）"""
+        with self._lock:
+            return sum(entry['bytes'] for entry in self._load_index().values())
+
+
+def main(argv=None):
+    """命令行入口：手动清除缓存"""
+    import argparse
+    parser = argparse.ArgumentParser(description="管理配置工作簿分析缓存")
+    parser.add_argument('--clear', nargs='?', const='', metavar='FILE',
+                        help="清除缓存，指定文件时只清除该文件的缓存")
+    parser.add_argument('--cache-dir', default=None, help="缓存目录")
+    args = parser.parse_args(argv)
+
+    cache = AnalysisCache(args.cache_dir)
+    if args.clear is not None:
+        removed = cache.invalidate(args.clear or None)
+        print(f"已清除 {removed} 条缓存")
+    else:
+        print(f"缓存目录: {cache.cache_dir}, 大小: {cache.total_bytes()} 字节")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
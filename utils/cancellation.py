@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+协作式取消模块
+
+这个模块提供加载流程使用的取消令牌，包括：
+- 界面线程调用cancel()请求取消
+- 读取和分析过程在检查点调用check()，已取消时抛出LoadCancelled
+- 抛出异常后由调用方丢弃已读取的数据，不修改之前的状态
+"""
+
+import threading
+
+
+class LoadCancelled(Exception):
+    """加载已被取消"""
+
+
+class CancelToken:
+    """取消令牌类，可在线程之间共享"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """请求取消"""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """是否已请求取消"""
+        return self._event.is_set()
+
+    def check(self):
+        """检查点：已请求取消时抛出LoadCancelled"""
+        if self._event.is_set():
+            raise LoadCancelled()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+组件分类模块
+
+这个模块集中定义组件关键字及其别名，并编译成正则表达式匹配器，包括：
+- 组件关键字列表（ConfigProcessor、ConfigModel共用）
+- 关键字别名（配置表格按前缀匹配时使用）
+- 一次扫描找出名称中包含的全部关键字（分析工作表时使用）
+- 一次匹配得到名称所属的第一个关键字（配置表格分组时使用）
+- 按组件名称缓存分类结果
+"""
+
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 组件关键字，顺序即配置表格的显示顺序
+COMPONENT_KEYWORDS = [
+    "CPU", "GPU", "Memory", "LCD", "WLAN", "WWAN", "SSD",
+    "Battery", "Adaptor", "KeyBoard", "USH", "Finger Print",
+    "Smart Card", "RFID", "FIPS"
+]
+
+# 关键字的别名，用于处理组件名称的拼写变体
+KEYWORD_ALIASES = {
+    "CPU": ["cpu", "processor", "central"],
+    "GPU": ["gpu", "graphics", "vga"],
+    "Memory": ["memory", "ram", "dimm", "ddr"],
+    "LCD": ["lcd", "display", "screen", "monitor", "panel"],
+    "WLAN": ["wlan", "wifi", "wireless"],
+    "WWAN": ["wwan", "cellular", "mobile"],
+    "SSD": ["ssd", "solid", "nvme"],
+    "Battery": ["battery", "batt", "accu"],
+    "Adaptor": ["adaptor", "adapter", "power adapter", "ac adapter", "charger", "ac power"],
+    "KeyBoard": ["keyboard", "kb"],
+    "USH": ["ush"],
+    "Finger Print": ["finger print", "fingerprint", "finger"],
+    "Smart Card": ["smart card", "smartcard", "smart"],
+    "RFID": ["rfid", "nfc", "near field", "contactless", "rfid/nfc"],
+    "FIPS": ["fips"]
+}
+
+# 每个分类器最多缓存的组件名称数量
+MAX_CACHED_NAMES = 8192
+
+
+def keyword_prefixes(keyword, aliases=None):
+    """获取关键字的全部前缀变体
+
+    包括小写关键字、去掉空格/斜杠/连字符的形式、多词关键字的第一个词以及别名。
+
+    Args:
+        keyword (str): 组件关键字
+        aliases (list): 别名列表
+
+    Returns:
+        list: 去重后的小写前缀列表
+    """
+    lowered = keyword.lower()
+    prefixes = [lowered]
+    compact = lowered.replace(" ", "").replace("/", "").replace("-", "")
+    if compact != lowered:
+        prefixes.append(compact)
+    if " " in keyword:
+        prefixes.append(keyword.split()[0].lower())
+    prefixes.extend(alias.lower() for alias in aliases or [])
+    return list(dict.fromkeys(prefixes))
+
+
+class ComponentTaxonomy:
+    """组件分类器类"""
+
+    def __init__(self, keywords=None, aliases=None):
+        """初始化并编译匹配器
+
+        Args:
+            keywords (list): 组件关键字列表，默认为COMPONENT_KEYWORDS
+            aliases (dict): 关键字别名，默认为KEYWORD_ALIASES
+        """
+        self.keywords = list(keywords if keywords is not None else COMPONENT_KEYWORDS)
+        self.aliases = dict(aliases if aliases is not None else KEYWORD_ALIASES)
+        self._contains_cache = {}
+        self._prefix_cache = {}
+        self._compile()
+
+    def _compile(self):
+        """编译包含匹配和前缀匹配两个正则表达式"""
+        lowered = list(dict.fromkeys(keyword.lower() for keyword in self.keywords))
+
+        # 包含匹配：每个位置捕获最长的关键字，较短的关键字若是其子串则一并命中
+        by_length = sorted(lowered, key=len, reverse=True)
+        self._contains_re = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in by_length) + '))'
+        ) if lowered else None
+        self._implied = {
+            keyword: {other for other in lowered if other in keyword} for keyword in lowered
+        }
+        self._order = {}
+        for keyword in self.keywords:
+            self._order.setdefault(keyword.lower(), []).append(keyword)
+
+        # 前缀匹配：按关键字顺序排列的命名分组，第一个命中的分组即所属关键字
+        groups = []
+        self._group_keywords = {}
+        for index, keyword in enumerate(self.keywords):
+            prefixes = sorted(keyword_prefixes(keyword, self.aliases.get(keyword)), key=len, reverse=True)
+            group = f"k{index}"
+            self._group_keywords[group] = keyword
+            groups.append(f"(?P<{group}>" + '|'.join(re.escape(prefix) for prefix in prefixes) + ")")
+        self._prefix_re = re.compile('|'.join(groups)) if groups else None
+
+    @staticmethod
+    def _remember(cache, name, result):
+        if len(cache) >= MAX_CACHED_NAMES:
+            cache.clear()
+        cache[name] = result
+        return result
+
+    def keywords_in(self, name):
+        """获取组件名称中包含的全部关键字（不区分大小写）
+
+        Args:
+            name (str): 组件名称
+
+        Returns:
+            tuple: 按关键字列表顺序排列的命中关键字
+        """
+        result = self._contains_cache.get(name)
+        if result is not None:
+            return result
+
+        found = set()
+        if self._contains_re is not None:
+            for match in self._contains_re.finditer(name.lower()):
+                found |= self._implied[match.group(1)]
+        result = tuple(keyword for keyword in self.keywords if keyword.lower() in found)
+        return self._remember(self._contains_cache, name, result)
+
+    def classify(self, name):
+        """获取组件名称所属的关键字：按关键字顺序，第一个以其关键字变体或别名开头的关键字
+
+        Args:
+            name (str): 组件名称
+
+        Returns:
+            str: 所属关键字，不匹配时返回None
+        """
+        try:
+            return self._prefix_cache[name]
+        except KeyError:
+            pass
+
+        result = None
+        if self._prefix_re is not None:
+            match = self._prefix_re.match(name.lower())
+            if match is not None:
+                result = self._group_keywords[match.lastgroup]
+        return self._remember(self._prefix_cache, name, result)
+
+
+_taxonomies = {}
+
+
+def get_taxonomy(keywords=None):
+    """获取指定关键字列表的共享分类器（按关键字列表缓存，只编译一次）
+
+    Args:
+        keywords (list): 组件关键字列表，为None时使用COMPONENT_KEYWORDS
+
+    Returns:
+        ComponentTaxonomy: 分类器
+    """
+    key = tuple(keywords if keywords is not None else COMPONENT_KEYWORDS)
+    taxonomy = _taxonomies.get(key)
+    if taxonomy is None:
+        taxonomy = _taxonomies[key] = ComponentTaxonomy(key)
+    return taxonomy
@@ -13,6 +13,8 @@ CSV文件读取工具
 import logging
 import pandas as pd
 
+from utils.encoding_sniffer import detect_encoding, read_with_detected_encoding
+
 logger = logging.getLogger(__name__)
 
 class CSVReader:
@@ -22,32 +24,27 @@ class CSVReader:
         """初始化CSV读取器"""
         self.data = None
         
-    def read_file(self, file_path, encoding='utf-8', fallback_encoding='gbk'):
+    def read_file(self, file_path, encoding=None, fallback_encoding='gbk'):
         """
         读取CSV文件，自动处理编码
         
         Args:
             file_path (str): CSV文件路径
-            encoding (str): 首选编码
+            encoding (str): 指定编码，为None时根据文件样本检测（BOM、UTF-8或备选编码）
             fallback_encoding (str): 备选编码
             
         Returns:
             pandas.DataFrame: CSV数据，如果读取失败则返回None
         """
         try:
-            # 首先尝试首选编码
-            self.data = pd.read_csv(file_path, encoding=encoding)
-            logger.debug(f"使用 {encoding} 编码成功读取CSV文件")
+            if encoding is None:
+                self.data = read_with_detected_encoding(
+                    file_path, lambda detected: pd.read_csv(file_path, encoding=detected), fallback_encoding)
+                logger.debug(f"使用 {detect_encoding(file_path, fallback_encoding)} 编码成功读取CSV文件")
+            else:
+                self.data = pd.read_csv(file_path, encoding=encoding)
+                logger.debug(f"使用 {encoding} 编码成功读取CSV文件")
             return self.data
-        except UnicodeDecodeError:
-            try:
-                # 如果失败，尝试备选编码
-                self.data = pd.read_csv(file_path, encoding=fallback_encoding)
-                logger.debug(f"使用 {fallback_encoding} 编码成功读取CSV文件")
-                return self.data
-            except Exception as e:
-                logger.error(f"读取CSV文件失败: {str(e)}")
-                return None
         except Exception as e:
             logger.error(f"读取CSV文件失败: {str(e)}")
             return None
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+文本文件编码检测模块
+
+这个模块根据有限的样本一次确定CSV文件的编码，包括：
+- 检测BOM（UTF-8、UTF-16、UTF-32）
+- 检查文件开头、中间和结尾的样本是否为合法的UTF-8
+- 不是UTF-8时使用备选编码（默认GBK）
+- 按文件指纹（路径、大小、修改时间）缓存检测结果，文件不变时不再读取样本
+"""
+
+import os
+import codecs
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# 每个样本的字节数
+SAMPLE_SIZE = 64 * 1024
+
+# 缓存的文件数量上限
+MAX_CACHE_ENTRIES = 256
+
+# 默认的备选编码
+DEFAULT_FALLBACK = 'gbk'
+
+# BOM及对应的编码（UTF-32必须在UTF-16之前检查）
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _fingerprint(file_path):
+    """文件指纹：(绝对路径, 大小, 修改时间)"""
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+
+def _remember(key, encoding):
+    with _cache_lock:
+        _cache[key] = encoding
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _is_utf8_sample(data, at_start, at_end):
+    """样本是否为合法的UTF-8
+
+    Args:
+        data: 样本字节
+        at_start: 样本是否从文件开头开始（否则跳过开头被截断的多字节字符）
+        at_end: 样本是否到达文件结尾（否则允许结尾的多字节字符不完整）
+    """
+    if not at_start:
+        skip = 0
+        while skip < min(3, len(data)) and 0x80 <= data[skip] <= 0xBF:
+            skip += 1
+        data = data[skip:]
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        decoder.decode(data, final=at_end)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def sniff_encoding(file_path, fallback=DEFAULT_FALLBACK, sample_size=SAMPLE_SIZE):
+    """读取样本检测文件编码（不使用缓存）
+
+    Args:
+        file_path: 文件路径
+        fallback: 样本不是合法UTF-8时使用的编码
+        sample_size: 每个样本的字节数
+
+    Returns:
+        str: 编码名称
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        head = f.read(sample_size)
+        for bom, encoding in BOMS:
+            if head.startswith(bom):
+                return encoding
+
+        samples = [(head, True, size <= sample_size)]
+        if size > sample_size:
+            # 文件中间和结尾各取一个样本，避免只有开头是ASCII时误判
+            for offset in (max(sample_size, size // 2 - sample_size // 2), max(sample_size, size - sample_size)):
+                f.seek(offset)
+                samples.append((f.read(sample_size), False, offset + sample_size >= size))
+
+    if all(_is_utf8_sample(*sample) for sample in samples):
+        return 'utf-8'
+    return fallback
+
+
+def detect_encoding(file_path, fallback=DEFAULT_FALLBACK):
+    """检测文件编码，结果按文件指纹缓存
+
+    Args:
+        file_path: 文件路径
+        fallback: 样本不是合法UTF-8时使用的编码
+
+    Returns:
+        str: 编码名称
+    """
+    key = _fingerprint(file_path) + (fallback,)
+    with _cache_lock:
+        encoding = _cache.get(key)
+        if encoding is not None:
+            _cache.move_to_end(key)
+            return encoding
+
+    encoding = sniff_encoding(file_path, fallback)
+    logger.debug(f"检测到文件编码 {encoding}: {file_path}")
+    _remember(key, encoding)
+    return encoding
+
+
+def read_with_detected_encoding(file_path, read, fallback=DEFAULT_FALLBACK):
+    """使用检测到的编码读取文件
+
+    样本之外仍可能出现非UTF-8字节，此时改用备选编码重新读取一次，并更新缓存。
+
+    Args:
+        file_path: 文件路径
+        read: 读取函数，参数为编码名称，如 lambda encoding: pd.read_csv(file_path, encoding=encoding)
+        fallback: 备选编码
+
+    Returns:
+        read的返回值
+    """
+    encoding = detect_encoding(file_path, fallback)
+    try:
+        return read(encoding)
+    except UnicodeDecodeError:
+        if encoding != 'utf-8':
+            raise
+        logger.warning(f"文件样本之外出现非UTF-8内容，改用 {fallback} 编码读取: {file_path}")
+        _remember(_fingerprint(file_path) + (fallback,), fallback)
+        return read(fallback)
+
+
+def clear_cache():
+    """清空编码检测缓存"""
+    with _cache_lock:
+        _cache.clear()
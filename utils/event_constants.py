@@ -28,6 +28,10 @@ SHEET_CHANGED = "SHEET_CHANGED"
 PN_SELECTED = "PN_SELECTED"
 PN_LIST_UPDATED = "PN_LIST_UPDATED"
 PN_CHANGED = "PN_CHANGED"
+PN_SEARCH_CLICKED = "PN_SEARCH_CLICKED"
+
+# 配置差异相关事件
+CONFIG_DIFF_CLICKED = "CONFIG_DIFF_CLICKED"
 
 # 配置详情相关事件
 CONFIG_DETAILS_UPDATED = "CONFIG_DETAILS_UPDATED"
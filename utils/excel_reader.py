@@ -6,20 +6,610 @@ Excel文件读取工具
 
 这个模块提供了Excel文件读取的基本功能，包括：
 - 读取Excel文件
-- 获取工作表列表
+- 获取工作表列表（xlsx/xlsm只读取xl/workbook.xml，无需解析整个工作簿）
+- 计算每个工作表的内容指纹（工作表XML及其引用的共享字符串）
 - 读取指定工作表的数据
+- 按工作表XML在zip中的读取位置报告解压进度
+- 流式读取工作表XML的行（只解析需要的行，用于确定读取范围）
+- 可插拔的读取引擎（calamine、openpyxl只读模式、xlrd），自动选择最快的可用引擎
+
+用法（引擎基准测试，结果保存后用于自动选择引擎）:
+    python -m utils.excel_reader --benchmark 文件路径 [--sheet 工作表]
 """
 
+import io
+import os
+import re
+import html
+import sys
+import json
+import time
+import hashlib
 import logging
+import posixpath
+import zipfile
+import tracemalloc
+import importlib.util
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 logger = logging.getLogger(__name__)
 
+# SpreadsheetML主命名空间及关系命名空间
+SPREADSHEETML_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+OFFICE_RELATIONSHIPS_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_RELATIONSHIPS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# 工作表XML中引用共享字符串的单元格：<c ... t="s" ...><v>索引</v>
+_SHARED_STRING_CELL_RE = re.compile(rb'<c\b[^>]*\bt="s"[^>]*>\s*<v>(\d+)</v>')
+
+# 工作表XML中的行号、单元格及其属性和值
+_ROW_REF_RE = re.compile(rb'\sr="(\d+)"')
+_CELL_RE = re.compile(rb'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.DOTALL)
+_CELL_REF_RE = re.compile(rb'.*?\br="([A-Z]+)\d+"', re.DOTALL)
+_CELL_TYPE_RE = re.compile(rb'\bt="(\w+)"')
+_CELL_VALUE_RE = re.compile(rb'<v>(.*?)</v>', re.DOTALL)
+_INLINE_TEXT_RE = re.compile(rb'<t\b[^>]*>(.*?)</t>', re.DOTALL)
+
+# 基准测试得到的引擎排名
+ENGINE_RANKING_PATH = os.path.join(os.path.expanduser('~'), '.autoconfig', 'excel_engines.json')
+
+
+class ExcelEngine:
+    """Excel读取引擎描述类
+
+    每个引擎对应一个pandas.read_excel引擎，可选依赖未安装时自动视为不可用。
+    """
+
+    def __init__(self, name, module, extensions, description):
+        """初始化引擎描述
+
+        Args:
+            name (str): pandas引擎名称
+            module (str): 引擎依赖的Python模块
+            extensions (tuple): 支持的文件扩展名
+            description (str): 说明
+        """
+        self.name = name
+        self.module = module
+        self.extensions = extensions
+        self.description = description
+        self._available = None
+
+    @property
+    def available(self):
+        """依赖模块是否已安装"""
+        if self._available is None:
+            self._available = importlib.util.find_spec(self.module) is not None
+        return self._available
+
+    def supports(self, file_path):
+        """是否支持指定文件的格式"""
+        return os.path.splitext(file_path)[1].lower() in self.extensions
+
+    def open(self, file_path):
+        """使用该引擎打开Excel文件
+
+        Args:
+            file_path (str): Excel文件路径
+
+        Returns:
+            pandas.ExcelFile: 已打开的Excel文件
+        """
+        return pd.ExcelFile(file_path, engine=self.name)
+
+
+# 默认按速度从快到慢排列
+EXCEL_ENGINES = [
+    ExcelEngine('calamine', 'python_calamine', ('.xlsx', '.xlsm', '.xlsb', '.xls', '.ods'),
+                "基于Rust calamine的解析器（需要安装python-calamine）"),
+    ExcelEngine('openpyxl', 'openpyxl', ('.xlsx', '.xlsm'),
+                "openpyxl只读模式（read_only=True, data_only=True）"),
+    ExcelEngine('xlrd', 'xlrd', ('.xls',),
+                "旧版.xls文件"),
+]
+
+
+def get_engine(name):
+    """按名称获取引擎描述，不存在时返回None"""
+    for engine in EXCEL_ENGINES:
+        if engine.name == name:
+            return engine
+    return None
+
+
+def available_engines(file_path):
+    """获取可以读取指定文件的已安装引擎列表
+
+    Args:
+        file_path (str): Excel文件路径
+
+    Returns:
+        list: ExcelEngine列表，按默认速度排序
+    """
+    return [engine for engine in EXCEL_ENGINES if engine.available and engine.supports(file_path)]
+
+
+def _load_engine_ranking():
+    try:
+        with open(ENGINE_RANKING_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"读取Excel引擎排名失败: {str(e)}")
+        return {}
+
+
+def select_engine(file_path):
+    """自动选择最快的可用引擎
+
+    优先使用基准测试记录的同类文件排名，没有记录时使用默认排序。
+
+    Args:
+        file_path (str): Excel文件路径
+
+    Returns:
+        ExcelEngine: 选中的引擎，没有可用引擎时返回None（由pandas自行选择）
+    """
+    candidates = available_engines(file_path)
+    if not candidates:
+        return None
+    ranking = _load_engine_ranking().get(os.path.splitext(file_path)[1].lower(), [])
+    for name in ranking:
+        for engine in candidates:
+            if engine.name == name:
+                return engine
+    return candidates[0]
+
+
+def open_excel_file(file_path, engine=None):
+    """使用指定或自动选择的引擎打开Excel文件
+
+    Args:
+        file_path (str): Excel文件路径
+        engine (str): 引擎名称，为None时自动选择
+
+    Returns:
+        pandas.ExcelFile: 已打开的Excel文件
+    """
+    selected = get_engine(engine) if engine else select_engine(file_path)
+    if selected is None:
+        if engine:
+            logger.warning(f"未知的Excel引擎 {engine}，使用pandas默认引擎")
+        return pd.ExcelFile(file_path)
+    logger.debug(f"使用 {selected.name} 引擎打开: {file_path}")
+    return selected.open(file_path)
+
+
+def _peak_rss_bytes():
+    """进程常驻内存峰值（字节），不支持的平台返回None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _benchmark_engine_job(engine_name, file_path, sheet_names):
+    """在独立进程中用一个引擎读取工作表，返回 (耗时, 峰值内存字节数)"""
+    rss_before = _peak_rss_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with get_engine(engine_name).open(file_path) as excel_file:
+        for sheet_name in sheet_names or excel_file.sheet_names:
+            pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+    elapsed = time.perf_counter() - start
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    rss_after = _peak_rss_bytes()
+    # 原生扩展的内存tracemalloc统计不到，能取到常驻内存时以其为准
+    if rss_before is not None:
+        return elapsed, max(rss_after - rss_before, traced_peak)
+    return elapsed, traced_peak
+
+
+def benchmark_engines(file_path, sheet_names=None):
+    """对所有可用引擎进行读取基准测试
+
+    每个引擎在新的子进程中运行，避免相互影响内存统计。
+
+    Args:
+        file_path (str): Excel文件路径
+        sheet_names (list): 要读取的工作表，为None时读取全部工作表
+
+    Returns:
+        list: [{'engine': 名称, 'seconds': 耗时, 'peak_bytes': 峰值内存, 'error': 错误信息}, ...]，按耗时排序
+    """
+    results = []
+    for engine in available_engines(file_path):
+        result = {'engine': engine.name, 'seconds': None, 'peak_bytes': None, 'error': None}
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result['seconds'], result['peak_bytes'] = executor.submit(
+                    _benchmark_engine_job, engine.name, file_path, sheet_names).result()
+        except Exception as e:
+            result['error'] = str(e)
+            logger.warning(f"引擎 {engine.name} 基准测试失败: {str(e)}")
+        results.append(result)
+    results.sort(key=lambda item: (item['seconds'] is None, item['seconds'] or 0))
+    return results
+
+
+def save_engine_ranking(file_path, results):
+    """保存基准测试排名，供select_engine自动选择
+
+    Args:
+        file_path (str): 测试使用的Excel文件路径
+        results (list): benchmark_engines的返回值
+    """
+    ranking = _load_engine_ranking()
+    ranking[os.path.splitext(file_path)[1].lower()] = [
+        item['engine'] for item in results if item['error'] is None
+    ]
+    try:
+        os.makedirs(os.path.dirname(ENGINE_RANKING_PATH), exist_ok=True)
+        with open(ENGINE_RANKING_PATH, 'w', encoding='utf-8') as f:
+            json.dump(ranking, f)
+    except Exception as e:
+        logger.warning(f"保存Excel引擎排名失败: {str(e)}")
+
+
+def _zip_part_path(target):
+    """将workbook.xml.rels中的目标转换为zip内路径"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join('xl', target))
+
+
+def _sheet_parts(archive):
+    """读取工作表名称到zip内XML路径的映射
+
+    Args:
+        archive (zipfile.ZipFile): 已打开的xlsx/xlsm容器
+
+    Returns:
+        tuple: ({工作表名称: zip内路径}（按工作簿顺序）, 共享字符串路径)
+    """
+    with archive.open('xl/workbook.xml') as f:
+        workbook = ET.parse(f).getroot()
+    with archive.open('xl/_rels/workbook.xml.rels') as f:
+        rels = ET.parse(f).getroot()
+
+    targets = {}
+    shared_strings_path = 'xl/sharedStrings.xml'
+    for rel in rels.findall(f'{{{PACKAGE_RELATIONSHIPS_NS}}}Relationship'):
+        targets[rel.get('Id')] = _zip_part_path(rel.get('Target'))
+        if rel.get('Type', '').endswith('/sharedStrings'):
+            shared_strings_path = targets[rel.get('Id')]
+
+    parts = {}
+    sheets = workbook.find(f'{{{SPREADSHEETML_NS}}}sheets')
+    for sheet in sheets.findall(f'{{{SPREADSHEETML_NS}}}sheet') if sheets is not None else []:
+        part = targets.get(sheet.get(f'{{{OFFICE_RELATIONSHIPS_NS}}}id'))
+        if part is not None:
+            parts[sheet.get('name')] = part
+    return parts, shared_strings_path
+
+
+def sheet_byte_span(file_path, sheet_name):
+    """获取工作表XML在文件中占用的字节范围（本地文件头 + 压缩数据）
+
+    Args:
+        file_path (str): Excel文件路径
+        sheet_name (str): 工作表名称
+
+    Returns:
+        tuple: (起始偏移, 结束偏移)，不是xlsx/xlsm或找不到工作表时返回None
+    """
+    if not zipfile.is_zipfile(file_path):
+        return None
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            part = _sheet_parts(archive)[0].get(sheet_name)
+            if part is None:
+                return None
+            info = archive.getinfo(part)
+    except (KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        logger.warning(f"读取工作表位置失败: {str(e)}")
+        return None
+    start = info.header_offset
+    header_size = 30 + len(info.filename.encode('utf-8')) + len(info.extra)
+    return start, start + header_size + info.compress_size
+
+
+class ProgressFile(io.FileIO):
+    """报告读取进度的文件对象
+
+    作为pandas/openpyxl的输入时，zip容器按需从文件中读取压缩数据，
+    读取位置在被监视的字节范围内前进的比例即为该部分的解压进度。
+    """
+
+    def __init__(self, file_path):
+        """初始化文件对象
+
+        Args:
+            file_path (str): 文件路径
+        """
+        super().__init__(file_path, 'rb')
+        self._span = None
+        self._callback = None
+        self._cancel = None
+        self._done = 0
+
+    def watch(self, span, callback, cancel=None):
+        """开始监视字节范围的读取进度
+
+        Args:
+            span (tuple): (起始偏移, 结束偏移)
+            callback: 进度回调 callback(已读取字节数, 总字节数)
+            cancel: CancelToken，已取消时下一次读取抛出LoadCancelled，中止正在进行的解析
+        """
+        self._span = span
+        self._callback = callback
+        self._cancel = cancel
+        self._done = 0
+
+    def unwatch(self):
+        """停止监视"""
+        self._span = None
+        self._callback = None
+        self._cancel = None
+
+    def _report(self):
+        start, end = self._span
+        done = min(max(self.tell() - start, 0), end - start)
+        if done > self._done:
+            self._done = done
+            self._callback(done, end - start)
+
+    def read(self, size=-1):
+        if self._cancel is not None:
+            self._cancel.check()
+        data = super().read(size)
+        if self._callback is not None:
+            self._report()
+        return data
+
+    def readinto(self, buffer):
+        if self._cancel is not None:
+            self._cancel.check()
+        count = super().readinto(buffer)
+        if self._callback is not None:
+            self._report()
+        return count
+
+
+def sheet_fingerprints(file_path, sheet_names=None):
+    """计算工作表内容指纹
+
+    每个工作表的指纹由其 xl/worksheets/sheetN.xml 的内容以及它引用的共享字符串共同决定，
+    其他工作表或样式的修改不会改变该指纹。
+
+    Args:
+        file_path (str): Excel文件路径
+        sheet_names (list): 只计算这些工作表，为None时计算全部工作表
+
+    Returns:
+        dict: {工作表名称: 十六进制指纹}，不是xlsx/xlsm或读取失败时返回空字典
+    """
+    if not zipfile.is_zipfile(file_path):
+        return {}
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            parts, shared_strings_path = _sheet_parts(archive)
+
+            shared_strings = None
+            fingerprints = {}
+            for name, part in parts.items():
+                if sheet_names is not None and name not in sheet_names:
+                    continue
+                data = archive.read(part)
+                digest = hashlib.blake2b(data, digest_size=20)
+
+                # 共享字符串按索引引用，需要把引用到的字符串内容一并计入
+                indices = _SHARED_STRING_CELL_RE.findall(data)
+                if indices:
+                    if shared_strings is None:
+                        shared_strings = _read_shared_strings(archive, shared_strings_path)
+                    for index in indices:
+                        index = int(index)
+                        value = shared_strings[index] if index < len(shared_strings) else ''
+                        digest.update(value.encode('utf-8') + b'\0')
+                fingerprints[name] = digest.hexdigest()
+            return fingerprints
+    except (KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        logger.warning(f"计算工作表指纹失败: {str(e)}")
+        return {}
+
+
+def _read_shared_strings(archive, path):
+    """读取共享字符串表"""
+    strings = []
+    try:
+        with archive.open(path) as f:
+            for _, element in ET.iterparse(f):
+                if element.tag == f'{{{SPREADSHEETML_NS}}}si':
+                    strings.append(''.join(element.itertext()))
+                    element.clear()
+    except KeyError:
+        pass
+    return strings
+
+
+def load_shared_strings(file_path):
+    """读取xlsx/xlsm的共享字符串表
+
+    Args:
+        file_path (str): Excel文件路径
+
+    Returns:
+        list: 共享字符串列表，不是xlsx/xlsm时返回None
+    """
+    if not zipfile.is_zipfile(file_path):
+        return None
+    with zipfile.ZipFile(file_path) as archive:
+        return _read_shared_strings(archive, _sheet_parts(archive)[1])
+
+
+def _column_index(letters):
+    """列字母转换为从0开始的列号"""
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _cell_text(attrs, body, shared_strings):
+    """解析单元格的文本，body为<c>元素的内容"""
+    if not body:
+        return ''
+    cell_type = _CELL_TYPE_RE.search(attrs)
+    cell_type = cell_type.group(1) if cell_type else b'n'
+    if cell_type == b'inlineStr':
+        text = ''.join(run.decode('utf-8') for run in _INLINE_TEXT_RE.findall(body))
+    else:
+        value = _CELL_VALUE_RE.search(body)
+        text = value.group(1).decode('utf-8') if value else ''
+        if cell_type == b's' and text:
+            index = int(text)
+            return shared_strings[index] if index < len(shared_strings) else ''
+    return html.unescape(text) if '&' in text else text
+
+
+def _parse_row(row, shared_strings, max_cols):
+    """解析一行的单元格
+
+    Returns:
+        tuple: ({列号: 文本}（只包含列号小于max_cols的非空单元格）, 最后一个非空单元格之后的列号)
+    """
+    cells = {}
+    col_index = -1
+    for cell in _CELL_RE.finditer(row):
+        ref = _CELL_REF_RE.match(cell.group(1))
+        col_index = _column_index(ref.group(1).decode('ascii')) if ref else col_index + 1
+        if max_cols is not None and col_index >= max_cols:
+            break
+        text = _cell_text(cell.group(1), cell.group(2), shared_strings)
+        if text:
+            cells[col_index] = text
+    else:
+        # 已解析整行
+        return cells, max(cells) + 1 if cells else 0
+
+    # 从行尾向前查找最后一个非空单元格，其余单元格不解析
+    end = len(row)
+    while True:
+        pos = row.rfind(b'<c ', 0, end)
+        if pos < 0:
+            return cells, max(cells) + 1 if cells else 0
+        cell = _CELL_RE.match(row, pos)
+        ref = _CELL_REF_RE.match(cell.group(1)) if cell else None
+        if ref is None:
+            # 没有单元格引用时无法从行尾确定列号，解析整行
+            all_cells, width = _parse_row(row, shared_strings, None)
+            return {col: text for col, text in all_cells.items() if col < max_cols}, width
+        if _cell_text(cell.group(1), cell.group(2), shared_strings):
+            return cells, _column_index(ref.group(1).decode('ascii')) + 1
+        end = pos
+
+
+def iter_sheet_rows(file_path, sheet_name, shared_strings=None, max_cols=None, chunk_size=1024 * 1024):
+    """流式读取工作表XML中的行
+
+    按块解压工作表XML并逐行解析，调用方停止迭代后不再解压和解析其余部分。只提取单元格引用和文本，
+    max_cols限制每行解析的列数（宽工作表中只需要前几列时不解析其余单元格）。
+    XML中不存在的行不会出现在结果中，空单元格不会出现在行中；使用命名空间前缀的工作表XML无法识别，
+    不产生任何行。
+
+    Args:
+        file_path (str): Excel文件路径（xlsx/xlsm）
+        sheet_name (str): 工作表名称
+        shared_strings (list): 已读取的共享字符串表，为None时自动读取
+        max_cols (int): 每行只解析列号小于该值的单元格，为None时解析所有单元格
+        chunk_size (int): 每次解压的字节数
+
+    Yields:
+        tuple: (从0开始的行号, {从0开始的列号: 单元格文本}, 该行最后一个非空单元格之后的列号)
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        parts, shared_strings_path = _sheet_parts(archive)
+        if sheet_name not in parts:
+            raise KeyError(f"工作表不存在: {sheet_name}")
+        if shared_strings is None:
+            shared_strings = _read_shared_strings(archive, shared_strings_path)
+
+        row_index = -1
+        with archive.open(parts[sheet_name]) as f:
+            buffer = b''
+            search_from = 0
+            while True:
+                chunk = f.read(chunk_size)
+                buffer += chunk
+                pos = 0
+                while True:
+                    end = buffer.find(b'</row>', max(pos, search_from))
+                    if end < 0:
+                        break
+                    # 自闭合的空行 <row r="N"/> 没有单元格，只取最后一个<row开始的行
+                    start = buffer.rfind(b'<row', pos, end)
+                    if start >= 0:
+                        tag_end = buffer.find(b'>', start)
+                        ref = _ROW_REF_RE.search(buffer, start, tag_end)
+                        row_index = int(ref.group(1)) - 1 if ref else row_index + 1
+                        cells, width = _parse_row(buffer[tag_end + 1:end], shared_strings, max_cols)
+                        yield row_index, cells, width
+                    pos = end + len(b'</row>')
+                buffer = buffer[pos:]
+                search_from = max(len(buffer) - len(b'</row>'), 0)
+                if not chunk:
+                    break
+
+
+def read_sheet_names(file_path):
+    """快速获取工作表名称列表
+
+    xlsx/xlsm文件只从zip容器中读取xl/workbook.xml，不解析共享字符串、样式和工作表数据；
+    其他格式或读取失败时回退到pandas.ExcelFile。
+
+    Args:
+        file_path (str): Excel文件路径
+
+    Returns:
+        list: 按工作簿顺序排列的工作表名称列表
+    """
+    if zipfile.is_zipfile(file_path):
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                with archive.open('xl/workbook.xml') as f:
+                    root = ET.parse(f).getroot()
+            sheets = root.find(f'{{{SPREADSHEETML_NS}}}sheets')
+            if sheets is not None:
+                names = [sheet.get('name') for sheet in sheets.findall(f'{{{SPREADSHEETML_NS}}}sheet')]
+                logger.debug(f"从workbook.xml读取到工作表: {names}")
+                return names
+        except (KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+            logger.warning(f"快速读取工作表列表失败，回退到完整解析: {str(e)}")
+
+    with open_excel_file(file_path) as excel_file:
+        return list(excel_file.sheet_names)
+
+
 class ExcelReader:
     """Excel文件读取器类"""
     
-    def __init__(self):
-        """初始化Excel读取器"""
+    def __init__(self, engine=None):
+        """初始化Excel读取器
+        
+        Args:
+            engine (str): 读取引擎名称（calamine、openpyxl、xlrd），为None时自动选择最快的可用引擎
+        """
+        self.engine = engine
         self.excel_file = None
         self.current_sheet = None
         
@@ -34,7 +624,7 @@ class ExcelReader:
             bool: 是否成功加载文件
         """
         try:
-            self.excel_file = pd.ExcelFile(file_path)
+            self.excel_file = open_excel_file(file_path, self.engine)
             logger.debug(f"成功加载Excel文件: {file_path}")
             return True
         except Exception as e:
@@ -68,4 +658,34 @@ class ExcelReader:
                 return self.current_sheet
         except Exception as e:
             logger.error(f"读取工作表 {sheet_name} 失败: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
+
+
+def main(argv=None):
+    """命令行入口：对比各引擎的读取耗时和峰值内存"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Excel读取引擎基准测试")
+    parser.add_argument('--benchmark', required=True, metavar='FILE', help="用于测试的Excel文件")
+    parser.add_argument('--sheet', action='append', dest='sheets', help="只读取指定工作表，可重复")
+    parser.add_argument('--no-save', action='store_true', help="不保存排名（默认保存，供自动选择引擎）")
+    args = parser.parse_args(argv)
+
+    results = benchmark_engines(args.benchmark, args.sheets)
+    if not results:
+        print("没有可用的Excel引擎")
+        return 1
+
+    print(f"{'引擎':<10} {'耗时(s)':>10} {'峰值内存(MiB)':>14}")
+    for item in results:
+        if item['error']:
+            print(f"{item['engine']:<10} 失败: {item['error']}")
+        else:
+            print(f"{item['engine']:<10} {item['seconds']:>10.3f} {item['peak_bytes'] / 1048576:>14.1f}")
+    if not args.no_save:
+        save_engine_ranking(args.benchmark, results)
+        print(f"已保存引擎排名: {ENGINE_RANKING_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+System P/N全局索引模块
+
+这个模块维护 System P/N → (工作簿, 工作表, 列) 的持久化倒排索引，包括：
+- 分析工作表时增量更新
+- 工作簿文件变化时丢弃过期的工作表条目
+- O(1) 查找
+- 修改后延迟在后台线程中保存，连续的修改合并为一次写入；退出时保存未保存的修改
+- 保存时重新读取索引文件，只合并本实例修改过的工作簿，不覆盖其他实例或进程写入的条目
+"""
+
+import os
+import json
+import atexit
+import logging
+import weakref
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 索引格式版本
+INDEX_VERSION = 1
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser('~'), '.autoconfig', 'pn_index.json')
+
+# 修改后延迟保存的秒数，期间的其他修改合并为一次写入
+SAVE_DELAY = 2.0
+
+# 进程中的所有索引实例，退出时统一保存（不延长实例的生命周期）
+_instances = weakref.WeakSet()
+
+
+def _flush_all():
+    """退出时保存所有索引实例中未保存的修改"""
+    for index in list(_instances):
+        index.flush()
+
+
+atexit.register(_flush_all)
+
+
+def column_letter(col):
+    """将从0开始的列号转换为Excel列字母
+
+    Args:
+        col (int): 列号
+
+    Returns:
+        str: 列字母，例如 0 -> 'A'，27 -> 'AB'
+    """
+    letters = ''
+    col += 1
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _file_stat(file_path):
+    try:
+        stat = os.stat(file_path)
+        return [stat.st_size, stat.st_mtime_ns]
+    except OSError:
+        return None
+
+
+class PNIndex:
+    """System P/N全局倒排索引类"""
+
+    def __init__(self, index_path=None, save_delay=SAVE_DELAY):
+        """初始化索引
+
+        Args:
+            index_path: 索引文件路径，默认为 ~/.autoconfig/pn_index.json
+            save_delay: 修改后延迟保存的秒数
+        """
+        self.index_path = index_path or DEFAULT_INDEX_PATH
+        self.save_delay = save_delay
+        self._lock = threading.Lock()
+        # 保证同一时间只有一个线程写文件
+        self._write_lock = threading.Lock()
+        self._workbooks = None  # {工作簿: {'stat': [...], 'sheets': {工作表: {pn: 列}}}}
+        self._index = None      # {pn: [(工作簿, 工作表, 列), ...]}
+        # 有未保存修改的工作簿
+        self._changed = set()
+        self._timer = None
+        _instances.add(self)
+
+    def _read_workbooks(self):
+        """读取索引文件中的工作簿条目，文件不存在或无法读取时返回空字典"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                return data.get('workbooks', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"读取P/N索引失败，将重建索引: {str(e)}")
+        return {}
+
+    def _ensure_loaded(self):
+        """首次访问时加载索引文件"""
+        if self._workbooks is not None:
+            return
+        self._workbooks = self._read_workbooks()
+        self._rebuild()
+
+    def _rebuild(self):
+        """根据工作簿条目重建倒排表"""
+        self._index = {}
+        for workbook, info in self._workbooks.items():
+            for sheet, pn_columns in info['sheets'].items():
+                for pn, col in pn_columns.items():
+                    self._index.setdefault(pn, []).append((workbook, sheet, col))
+
+    def _schedule_save(self, workbook):
+        """标记工作簿有未保存的修改，延迟save_delay秒后在后台线程中保存（调用方需持有_lock）"""
+        self._changed.add(workbook)
+        if self._timer is None:
+            self._timer = threading.Timer(self.save_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """立即保存未保存的修改
+
+        重新读取索引文件，把本实例修改过的工作簿合并进去后写回：
+        - 文件中的条目与本实例的条目对应同一版本的工作簿时合并工作表，本实例的工作表优先
+        - 否则以本实例的条目为准
+        - 本实例删除的工作簿，只在文件中的条目也已过期时删除
+        """
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._changed:
+                    return
+                changes = {}
+                for workbook in self._changed:
+                    info = self._workbooks.get(workbook)
+                    # 各工作表的条目修改时整体替换，复制外层字典即可
+                    changes[workbook] = None if info is None else {'stat': info['stat'],
+                                                                   'sheets': dict(info['sheets'])}
+                self._changed = set()
+
+            workbooks = self._read_workbooks()
+            for workbook, info in changes.items():
+                current = workbooks.get(workbook)
+                if info is None:
+                    if current is not None and current['stat'] != _file_stat(workbook):
+                        del workbooks[workbook]
+                elif current is not None and current['stat'] == info['stat']:
+                    current['sheets'].update(info['sheets'])
+                else:
+                    workbooks[workbook] = info
+            text = json.dumps({'version': INDEX_VERSION, 'workbooks': workbooks}, ensure_ascii=False)
+            if not self._write(text):
+                with self._lock:
+                    self._changed.update(changes)
+
+    def _write(self, text):
+        """原子方式写回索引文件
+
+        每次写入使用唯一的临时文件名，多个进程同时写入时不会互相覆盖临时文件。
+
+        Returns:
+            bool: 是否已写入
+        """
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.index_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.index_path) + '.',
+                                            suffix='.tmp', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self.index_path)
+            return True
+        except Exception as e:
+            logger.warning(f"保存P/N索引失败: {str(e)}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return False
+
+    def _remove_locations(self, workbook, sheets):
+        """从倒排表中删除指定工作簿工作表的条目"""
+        for sheet in sheets:
+            pn_columns = self._workbooks[workbook]['sheets'].get(sheet, {})
+            for pn in pn_columns:
+                locations = [loc for loc in self._index.get(pn, [])
+                             if loc[0] != workbook or loc[1] != sheet]
+                if locations:
+                    self._index[pn] = locations
+                else:
+                    self._index.pop(pn, None)
+
+    def update_sheet(self, file_path, sheet_name, pn_columns):
+        """更新一个工作表的索引条目
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            pn_columns: {pn: 列号}
+        """
+        self.update_sheets(file_path, {sheet_name: pn_columns})
+
+    def update_sheets(self, file_path, sheets):
+        """批量更新工作簿中多个工作表的索引条目
+
+        如果工作簿文件自上次索引后发生变化，同时丢弃该工作簿其他工作表的过期条目。
+
+        Args:
+            file_path: 工作簿路径
+            sheets: {工作表名称: {pn: 列号}}
+        """
+        workbook = os.path.abspath(file_path)
+        stat = _file_stat(workbook)
+        with self._lock:
+            self._ensure_loaded()
+            info = self._workbooks.get(workbook)
+            if info is not None and info['stat'] != stat:
+                logger.info(f"工作簿已变化，丢弃过期的P/N索引: {workbook}")
+                self._remove_locations(workbook, list(info['sheets'].keys()))
+                info = None
+            if info is None:
+                info = self._workbooks[workbook] = {'stat': stat, 'sheets': {}}
+
+            for sheet_name, pn_columns in sheets.items():
+                self._remove_locations(workbook, [sheet_name])
+                info['sheets'][sheet_name] = {pn: int(col) for pn, col in pn_columns.items()}
+                for pn, col in info['sheets'][sheet_name].items():
+                    self._index.setdefault(pn, []).append((workbook, sheet_name, col))
+            self._schedule_save(workbook)
+
+    def invalidate_workbook(self, file_path):
+        """删除工作簿的全部索引条目
+
+        Args:
+            file_path: 工作簿路径
+        """
+        workbook = os.path.abspath(file_path)
+        with self._lock:
+            self._ensure_loaded()
+            if workbook in self._workbooks:
+                self._remove_locations(workbook, list(self._workbooks[workbook]['sheets'].keys()))
+                del self._workbooks[workbook]
+                self._schedule_save(workbook)
+
+    def refresh_workbook(self, file_path):
+        """工作簿文件变化或被删除时丢弃其索引条目
+
+        Args:
+            file_path: 工作簿路径
+
+        Returns:
+            bool: 索引条目仍然有效时返回True
+        """
+        workbook = os.path.abspath(file_path)
+        with self._lock:
+            self._ensure_loaded()
+            info = self._workbooks.get(workbook)
+            if info is None:
+                return False
+            if info['stat'] == _file_stat(workbook):
+                return True
+        self.invalidate_workbook(workbook)
+        return False
+
+    def lookup(self, pn):
+        """查找System P/N所在位置
+
+        Args:
+            pn: System P/N
+
+        Returns:
+            list: [{'workbook': 工作簿路径, 'sheet': 工作表, 'column': 列号, 'column_letter': 列字母}, ...]
+        """
+        with self._lock:
+            self._ensure_loaded()
+            locations = list(self._index.get(str(pn).strip(), []))
+        return [{
+            'workbook': workbook,
+            'sheet': sheet,
+            'column': col,
+            'column_letter': column_letter(col)
+        } for workbook, sheet, col in locations]
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._index)
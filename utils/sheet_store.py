@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作表内存存储模块
+
+这个模块提供按最近使用顺序淘汰的工作表数据存储，包括：
+- 按 (工作簿, 文件大小/修改时间, 工作表) 保存已读取的DataFrame和分析结果
+- 逐对象统计占用的字节数（DataFrame中的字符串与其他对象共享时只计一次）
+- 可配置的内存上限，超出时淘汰最久未使用的工作表
+- 命中/未命中/淘汰计数
+"""
+
+import os
+import sys
+import logging
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _object_values(column):
+    """列中Python对象的数组（不复制），列不以Python对象保存时返回None"""
+    if column.dtype == object or getattr(column.dtype, 'storage', None) == 'python':
+        return np.asarray(column.array)
+    return None
+
+
+def deep_sizeof(obj):
+    """统计对象及其引用的全部对象占用的字节数，共享对象只计一次
+
+    DataFrame中以Python对象保存的列逐个统计其中的对象，与分析结果（如values数组）
+    共享的字符串只计一次。
+
+    Args:
+        obj: 任意对象
+
+    Returns:
+        int: 字节数
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if item is None or id(item) in seen:
+            continue
+        seen.add(id(item))
+
+        if isinstance(item, (pd.DataFrame, pd.Series)):
+            total += int(item.index.memory_usage(deep=True))
+            columns = item.items() if isinstance(item, pd.DataFrame) else [(item.name, item)]
+            for _, column in columns:
+                values = _object_values(column)
+                if values is None:
+                    total += int(column.memory_usage(index=False, deep=True))
+                else:
+                    stack.append(values)
+            continue
+        if isinstance(item, np.ndarray):
+            total += item.nbytes
+            if item.dtype == object:
+                stack.extend(item.ravel().tolist())
+            continue
+
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool)):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            if hasattr(item, '__dict__'):
+                stack.append(vars(item))
+            for cls in type(item).__mro__:
+                for slot in getattr(cls, '__slots__', ()):
+                    if hasattr(item, slot):
+                        stack.append(getattr(item, slot))
+    return total
+
+
+class SheetStore:
+    """工作表数据LRU存储类"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """初始化存储
+
+        Args:
+            max_bytes: 内存上限（字节）
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # {键: (数据, 字节数)}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(file_path, sheet_name):
+        """生成存储键，文件变化后自然失效"""
+        try:
+            stat = os.stat(file_path)
+            stat = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            stat = None
+        return os.path.abspath(file_path), stat, sheet_name
+
+    def get(self, file_path, sheet_name):
+        """读取工作表数据
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+
+        Returns:
+            dict: 保存的数据，未命中时返回None
+        """
+        key = self._key(file_path, sheet_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.debug(f"工作表存储命中: {sheet_name}")
+        return entry[0]
+
+    def put(self, file_path, sheet_name, data, size=None):
+        """保存工作表数据，超出上限时淘汰最久未使用的工作表
+
+        Args:
+            file_path: 工作簿路径
+            sheet_name: 工作表名称
+            data: 要保存的数据
+            size: 数据占用的字节数，为None时在这里统计（数据较大时应在后台线程中预先统计）
+
+        Returns:
+            bool: 是否已保存（单个工作表超过上限时不保存）
+        """
+        key = self._key(file_path, sheet_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is data:
+                self._entries.move_to_end(key)
+                self._evict()
+                return True
+
+        if size is None:
+            size = deep_sizeof(data)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            if size > self.max_bytes:
+                logger.debug(f"工作表 {sheet_name} 占用 {size} 字节，超过存储上限，不保存")
+                return False
+            self._entries[key] = (data, size)
+            self.total_bytes += size
+            self._evict()
+        logger.debug(f"已保存工作表 {sheet_name}: {size} 字节，共 {self.total_bytes} 字节")
+        return True
+
+    def _evict(self):
+        """淘汰最久未使用的工作表，直到总大小不超过上限（调用方持有锁）"""
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+            logger.debug(f"淘汰工作表存储: {evicted_key[2]}, {evicted_size} 字节")
+
+    def invalidate(self, file_path=None):
+        """删除工作簿的全部工作表数据
+
+        Args:
+            file_path: 工作簿路径，为None时清空存储
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                abs_path = os.path.abspath(file_path)
+                for key in [key for key in self._entries if key[0] == abs_path]:
+                    del self._entries[key]
+            self.total_bytes = sum(size for _, size in self._entries.values())
+
+    def stats(self):
+        """获取存储统计信息
+
+        Returns:
+            dict: 包含条目数、字节数、上限、命中、未命中、淘汰次数
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+工作簿会话模块
+
+这个模块提供在整个会话期间复用的工作簿句柄，包括：
+- 只打开一次zip容器，共享字符串表和样式只解析一次
+- 切换工作表时只解析该工作表的XML
+- 文件在磁盘上被修改后自动重新打开
+- 使用openpyxl引擎时报告工作表XML的解压进度
+- 流式读取工作表的行，按已确定的范围读取工作表（两阶段读取）
+"""
+
+import os
+import logging
+import zipfile
+import pandas as pd
+
+from utils.excel_reader import (read_sheet_names, open_excel_file, get_engine, select_engine,
+                                sheet_byte_span, ProgressFile, load_shared_strings, iter_sheet_rows)
+
+logger = logging.getLogger(__name__)
+
+
+class WorkbookSession:
+    """工作簿会话类，持有已解析的Excel容器"""
+
+    def __init__(self, file_path, engine=None):
+        """初始化工作簿会话
+
+        Args:
+            file_path (str): Excel文件路径
+            engine (str): 读取引擎名称，为None时自动选择最快的可用引擎
+        """
+        self.file_path = file_path
+        self.engine = engine
+        self._excel_file = None
+        self._stream = None  # openpyxl按需读取时使用的文件对象，用于报告进度
+        self._sheet_names = None
+        self._shared_strings = None  # 流式读取行时使用的共享字符串表
+        self._stat = self._file_stat()
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.file_path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def sheet_names(self):
+        """工作表名称列表（只读取workbook.xml，不打开完整工作簿）"""
+        if self._sheet_names is None:
+            if self._excel_file is not None:
+                self._sheet_names = list(self._excel_file.sheet_names)
+            else:
+                self._sheet_names = read_sheet_names(self.file_path)
+        return self._sheet_names
+
+    @property
+    def excel_file(self):
+        """已打开的pandas.ExcelFile，首次访问时打开"""
+        if self._excel_file is None:
+            logger.debug(f"打开工作簿会话: {self.file_path}")
+            selected = get_engine(self.engine) if self.engine else select_engine(self.file_path)
+            if selected is not None and selected.name == 'openpyxl' and zipfile.is_zipfile(self.file_path):
+                # openpyxl只读模式在遍历行时才从zip中读取工作表数据，读取位置即解析进度
+                self._stream = ProgressFile(self.file_path)
+                self._excel_file = selected.open(self._stream)
+            else:
+                self._excel_file = open_excel_file(self.file_path, self.engine)
+        return self._excel_file
+
+    @property
+    def stat(self):
+        """打开会话时文件的 (大小, 修改时间)，文件不存在时为None"""
+        return self._stat
+
+    @property
+    def is_open(self):
+        """工作簿容器是否已打开"""
+        return self._excel_file is not None
+
+    def matches(self, file_path):
+        """判断会话是否对应指定文件且文件未被修改
+
+        Args:
+            file_path (str): Excel文件路径
+
+        Returns:
+            bool: 可以继续复用时返回True
+        """
+        return (os.path.abspath(file_path) == os.path.abspath(self.file_path)
+                and self._stat is not None and self._file_stat() == self._stat)
+
+    @property
+    def streams_rows(self):
+        """能否流式读取工作表的行（xlsx/xlsm）"""
+        return zipfile.is_zipfile(self.file_path)
+
+    def iter_rows(self, sheet_name, max_cols=None):
+        """流式读取工作表的行，共享字符串表在会话中只读取一次
+
+        Args:
+            sheet_name (str): 工作表名称
+            max_cols (int): 每行只解析前max_cols列，为None时解析所有列
+
+        Returns:
+            iterator: (行号, {列号: 文本}, 行宽) 迭代器，见excel_reader.iter_sheet_rows
+        """
+        if self._shared_strings is None:
+            self._shared_strings = load_shared_strings(self.file_path)
+        return iter_sheet_rows(self.file_path, sheet_name, self._shared_strings, max_cols)
+
+    def read_sheet(self, sheet_name, progress=None, cancel=None, bounds=None, **kwargs):
+        """读取指定工作表
+
+        Args:
+            sheet_name (str): 工作表名称
+            progress: 进度回调 progress(已完成量, 总量)；总量为0表示无法报告进度
+                （calamine等一次性解析整个工作表的引擎）
+            cancel: CancelToken；openpyxl引擎在解析过程中检查，其他引擎在解析前后检查
+            bounds: 只读取从A1开始的 (结束行, 结束列) 范围（均不包含，结束列为None时读取所有列），
+                行号和列号与完整读取时一致
+            **kwargs: 传递给pandas.read_excel的其他参数
+
+        Returns:
+            pandas.DataFrame: 工作表数据
+
+        Raises:
+            LoadCancelled: 读取被取消
+        """
+        if bounds is not None:
+            row_end, col_end = bounds
+            header = kwargs.get('header', 0)
+            kwargs['nrows'] = max(row_end - (0 if header is None else header + 1), 0)
+            if col_end is not None:
+                kwargs['usecols'] = list(range(col_end))
+
+        excel_file = self.excel_file
+        if progress is None and cancel is None:
+            return pd.read_excel(excel_file, sheet_name=sheet_name, **kwargs)
+        progress = progress or (lambda done, total: None)
+
+        span = sheet_byte_span(self.file_path, sheet_name) if self._stream is not None else None
+        if span is None:
+            if cancel is not None:
+                cancel.check()
+            progress(0, 0)
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, **kwargs)
+            if cancel is not None:
+                cancel.check()
+            progress(1, 1)
+            return df
+
+        self._stream.watch(span, progress, cancel)
+        try:
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, **kwargs)
+        finally:
+            self._stream.unwatch()
+        progress(span[1] - span[0], span[1] - span[0])
+        return df
+
+    def close(self):
+        """关闭工作簿容器"""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+            self._shared_strings = None
+            logger.debug(f"已关闭工作簿会话: {self.file_path}")